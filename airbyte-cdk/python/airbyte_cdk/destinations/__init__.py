@@ -1,3 +1,3 @@
-from .destination import Destination
+from .destination import Destination, RecordBatch, batch_records
 
-__all__ = ["Destination"]
+__all__ = ["Destination", "RecordBatch", "batch_records"]
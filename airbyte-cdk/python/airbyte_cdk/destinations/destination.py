@@ -24,20 +24,55 @@
 
 import argparse
 import io
+import json
 import sys
 from abc import ABC, abstractmethod
-from typing import Any, Iterable, List, Mapping
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Union
 
 from airbyte_cdk import AirbyteLogger
 from airbyte_cdk.connector import Connector
-from airbyte_cdk.models import AirbyteMessage, ConfiguredAirbyteCatalog, Type
+from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage, ConfiguredAirbyteCatalog, Type
+from airbyte_cdk.output_sink import get_output_sink
 from airbyte_cdk.sources.utils.schema_helpers import check_config_against_spec_or_exit
 from pydantic import ValidationError
 
 
+class RecordBatch(NamedTuple):
+    stream: str
+    records: List[AirbyteRecordMessage]
+
+
+def batch_records(input_messages: Iterable[AirbyteMessage], batch_size: int) -> Iterable[Union[RecordBatch, AirbyteMessage]]:
+    """
+    Groups the RECORD messages of the input into per-stream batches of up to `batch_size` records. Other messages are passed through
+    as they are, except that every pending batch is output before a STATE message, so a destination which persists each batch before
+    moving to the next item only outputs a STATE message once all records which came before it have been written.
+    """
+    batches: Dict[str, List[AirbyteRecordMessage]] = defaultdict(list)
+    for message in input_messages:
+        if message.type == Type.RECORD:
+            stream_batch = batches[message.record.stream]
+            stream_batch.append(message.record)
+            if len(stream_batch) >= batch_size:
+                yield RecordBatch(message.record.stream, stream_batch)
+                del batches[message.record.stream]
+        else:
+            if message.type == Type.STATE:
+                for stream, records in batches.items():
+                    yield RecordBatch(stream, records)
+                batches.clear()
+            yield message
+
+    for stream, records in batches.items():
+        yield RecordBatch(stream, records)
+
+
 class Destination(Connector, ABC):
     logger = AirbyteLogger()
     VALID_CMDS = {"spec", "check", "write"}
+    # can be overridden to only decode the envelope of RECORD messages and pass their data to write() without pydantic validation
+    lazy_input_parsing = False
 
     @abstractmethod
     def write(
@@ -51,12 +86,48 @@ class Destination(Connector, ABC):
 
     def _parse_input_stream(self, input_stream: io.TextIOWrapper) -> Iterable[AirbyteMessage]:
         """Reads from stdin, converting to Airbyte messages"""
+        if self.lazy_input_parsing:
+            yield from self._parse_input_stream_lazily(input_stream)
+            return
         for line in input_stream:
             try:
                 yield AirbyteMessage.parse_raw(line)
             except ValidationError:
                 self.logger.info(f"ignoring input which can't be deserialized as Airbyte Message: {line}")
 
+    def _parse_input_stream_lazily(self, input_stream: io.TextIOWrapper) -> Iterable[AirbyteMessage]:
+        """
+        Reads from stdin, converting to Airbyte messages. Only the envelope of RECORD messages (stream, emitted_at, namespace) is checked,
+        their data is the plain dict decoded from the input rather than a validated pydantic model. Other messages are fully parsed.
+        """
+        for line in input_stream:
+            try:
+                message = self._parse_message_lazily(line)
+            except (ValueError, TypeError, AttributeError):
+                # pydantic's ValidationError and json's JSONDecodeError are both ValueErrors
+                message = None
+            if message:
+                yield message
+            else:
+                self.logger.info(f"ignoring input which can't be deserialized as Airbyte Message: {line}")
+
+    @staticmethod
+    def _parse_message_lazily(line: str) -> Optional[AirbyteMessage]:
+        raw_message = json.loads(line)
+        if raw_message.get("type") != Type.RECORD.value:
+            return AirbyteMessage.parse_obj(raw_message)
+
+        raw_record = raw_message.get("record")
+        if not (
+            isinstance(raw_record, dict)
+            and isinstance(raw_record.get("stream"), str)
+            and isinstance(raw_record.get("data"), dict)
+            and isinstance(raw_record.get("emitted_at"), int)
+        ):
+            return None
+        record = AirbyteRecordMessage.construct(**raw_record)
+        return AirbyteMessage.construct(type=Type.RECORD, record=record)
+
     def _run_write(
         self, config: Mapping[str, Any], configured_catalog_path: str, input_stream: io.TextIOWrapper
     ) -> Iterable[AirbyteMessage]:
@@ -123,5 +194,9 @@ class Destination(Connector, ABC):
     def run(self, args: List[str]):
         parsed_args = self.parse_args(args)
         output_messages = self.run_cmd(parsed_args)
-        for message in output_messages:
-            print(message.json(exclude_unset=True))
+        sink = get_output_sink()
+        try:
+            for message in output_messages:
+                sink.write(message.json(exclude_unset=True), flush=message.type == Type.STATE)
+        finally:
+            sink.flush()
@@ -28,10 +28,11 @@ import importlib
 import os.path
 import sys
 import tempfile
-from typing import Iterable, List
+from typing import Iterable, List, Tuple
 
 from airbyte_cdk.logger import AirbyteLogger
 from airbyte_cdk.models import AirbyteMessage, Status, Type
+from airbyte_cdk.output_sink import get_output_sink
 from airbyte_cdk.sources import Source
 from airbyte_cdk.sources.utils.schema_helpers import check_config_against_spec_or_exit
 
@@ -76,6 +77,11 @@ class AirbyteEntrypoint(object):
         return main_parser.parse_args(args)
 
     def run(self, parsed_args: argparse.Namespace) -> Iterable[str]:
+        for _, message in self.run_messages(parsed_args):
+            yield message
+
+    def run_messages(self, parsed_args: argparse.Namespace) -> Iterable[Tuple[Type, str]]:
+        """Runs the command, yields the type of each output message along with the message serialized"""
         cmd = parsed_args.command
         if not cmd:
             raise Exception("No command passed")
@@ -86,7 +92,7 @@ class AirbyteEntrypoint(object):
         with tempfile.TemporaryDirectory() as temp_dir:
             if cmd == "spec":
                 message = AirbyteMessage(type=Type.SPEC, spec=source_spec)
-                yield message.json(exclude_unset=True)
+                yield Type.SPEC, message.json(exclude_unset=True)
             else:
                 raw_config = self.source.read_config(parsed_args.config)
                 config = self.source.configure(raw_config, temp_dir)
@@ -100,16 +106,17 @@ class AirbyteEntrypoint(object):
                         logger.error("Check failed")
 
                     output_message = AirbyteMessage(type=Type.CONNECTION_STATUS, connectionStatus=check_result).json(exclude_unset=True)
-                    yield output_message
+                    yield Type.CONNECTION_STATUS, output_message
                 elif cmd == "discover":
                     catalog = self.source.discover(logger, config)
-                    yield AirbyteMessage(type=Type.CATALOG, catalog=catalog).json(exclude_unset=True)
+                    yield Type.CATALOG, AirbyteMessage(type=Type.CATALOG, catalog=catalog).json(exclude_unset=True)
                 elif cmd == "read":
                     config_catalog = self.source.read_catalog(parsed_args.catalog)
                     state = self.source.read_state(parsed_args.state)
                     generator = self.source.read(logger, config, config_catalog, state)
+                    serializer = self.source.message_serializer
                     for message in generator:
-                        yield message.json(exclude_unset=True)
+                        yield message.type, serializer.serialize(message)
                 else:
                     raise Exception("Unexpected command " + cmd)
 
@@ -117,8 +124,13 @@ class AirbyteEntrypoint(object):
 def launch(source: Source, args: List[str]):
     source_entrypoint = AirbyteEntrypoint(source)
     parsed_args = source_entrypoint.parse_args(args)
-    for message in source_entrypoint.run(parsed_args):
-        print(message)
+    sink = get_output_sink()
+    try:
+        for message_type, message in source_entrypoint.run_messages(parsed_args):
+            # state is flushed right away so that the platform can checkpoint it
+            sink.write(message, flush=message_type == Type.STATE)
+    finally:
+        sink.flush()
 
 
 def main():
@@ -26,6 +26,7 @@
 import traceback
 
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage
+from airbyte_cdk.output_sink import get_output_sink
 
 
 class AirbyteLogger:
@@ -46,7 +47,7 @@ class AirbyteLogger:
     def log(self, level, message):
         log_record = AirbyteLogMessage(level=level, message=message)
         log_message = AirbyteMessage(type="LOG", log=log_record)
-        print(log_message.json(exclude_unset=True))
+        get_output_sink().write(log_message.json(exclude_unset=True))
 
     def fatal(self, message):
         self.log("FATAL", message)
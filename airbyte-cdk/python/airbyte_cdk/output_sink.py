@@ -0,0 +1,103 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import atexit
+import sys
+import threading
+import time
+from typing import List, Optional, TextIO
+
+# Large enough that one write call carries thousands of records when stdout is a pipe
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+DEFAULT_FLUSH_INTERVAL_SECONDS = 1.0
+
+
+class OutputSink:
+    """
+    Writes the lines output by a connector (the serialized Airbyte messages) to stdout.
+
+    Lines are collected in a buffer which is written out in a single call once it holds `buffer_size` characters, or when a line is
+    written more than `flush_interval_seconds` after the last flush, instead of issuing a write per message. Callers pass `flush=True`
+    for messages which must reach the platform right away e.g: STATE messages. The sink is safe to use from several threads, each line
+    is always written out in one piece.
+    """
+
+    def __init__(
+        self,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        stream: Optional[TextIO] = None,
+    ):
+        """
+        :param buffer_size: number of buffered characters which triggers a flush, 0 disables buffering
+        :param flush_interval_seconds: maximum time lines are kept in the buffer while messages keep being written
+        :param stream: stream to write to, defaults to the current sys.stdout
+        """
+        self.buffer_size = buffer_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self._stream = stream
+        self._lines: List[str] = []
+        self._buffered_size = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+    def write(self, line: str, flush: bool = False):
+        with self._lock:
+            self._lines.append(line)
+            self._buffered_size += len(line) + 1
+            if flush or self._buffered_size >= self.buffer_size or time.monotonic() - self._last_flush >= self.flush_interval_seconds:
+                self._flush()
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if self._lines:
+            # resolve stdout lazily so that a replaced sys.stdout (e.g: in tests) is respected
+            stream = self._stream or sys.stdout
+            self._lines.append("")
+            stream.write("\n".join(self._lines))
+            stream.flush()
+            self._lines = []
+            self._buffered_size = 0
+        self._last_flush = time.monotonic()
+
+
+_output_sink = OutputSink()
+# whatever is still buffered must be written out even if the connector exits with an error
+atexit.register(lambda: _output_sink.flush())
+
+
+def get_output_sink() -> OutputSink:
+    """Returns the sink shared by the entrypoints and the logger"""
+    return _output_sink
+
+
+def set_output_sink(sink: OutputSink):
+    """Replaces the shared sink, flushing the previous one first"""
+    global _output_sink
+    _output_sink.flush()
+    _output_sink = sink
@@ -24,9 +24,12 @@
 
 
 import copy
+import threading
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Any, Iterator, List, Mapping, MutableMapping, Optional, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from queue import Empty, Full, Queue
+from typing import Any, Callable, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple
 
 from airbyte_cdk.logger import AirbyteLogger
 from airbyte_cdk.models import (
@@ -43,6 +46,39 @@ from airbyte_cdk.models import (
 from airbyte_cdk.models import Type as MessageType
 from airbyte_cdk.sources.source import Source
 from airbyte_cdk.sources.streams import Stream
+from airbyte_cdk.sources.utils.clock import now_millis
+from airbyte_cdk.sources.utils.serialization import unvalidated_record_message
+
+# Put on a queue by a worker thread once it has finished reading its stream or slice
+_DONE = object()
+
+# Maximum number of records buffered per slice when the slices of a stream are read in parallel
+_SLICE_BUFFER_SIZE = 1000
+
+
+def _put_until_stopped(queue: Queue, item: Any, stop_event: threading.Event) -> bool:
+    """Puts the item on the queue, waiting for a free slot unless the stop event is set. Returns False if the item was not put."""
+    while not stop_event.is_set():
+        try:
+            queue.put(item, timeout=0.1)
+            return True
+        except Full:
+            continue
+    return False
+
+
+def _get_until_done(queue: Queue) -> Iterator[Any]:
+    """Yields the items put on the queue by a worker until it is done, re-raising any exception the worker put on the queue."""
+    while True:
+        try:
+            item = queue.get(timeout=0.1)
+        except Empty:
+            continue
+        if item is _DONE:
+            return
+        if isinstance(item, Exception):
+            raise item
+        yield item
 
 
 class AbstractSource(Source, ABC):
@@ -51,6 +87,12 @@ class AbstractSource(Source, ABC):
     in this class to create an Airbyte Specification compliant Source.
     """
 
+    @property
+    def _state_lock(self) -> threading.Lock:
+        """Guards connector_state while streams are read in parallel, created per instance as subclasses don't have to call __init__"""
+        # dict.setdefault is atomic, so concurrent callers always get the same lock
+        return self.__dict__.setdefault("_state_lock_instance", threading.Lock())
+
     @abstractmethod
     def check_connection(self, logger: AirbyteLogger, config: Mapping[str, Any]) -> Tuple[bool, Optional[Any]]:
         """
@@ -73,6 +115,25 @@ class AbstractSource(Source, ABC):
         """Source name"""
         return self.__class__.__name__
 
+    @property
+    def max_concurrent_streams(self) -> int:
+        """
+        The maximum number of streams which are read in parallel during the Read operation. By default streams are read one after another.
+
+        Override to return a value greater than 1 to read the configured streams on a pool of worker threads. Messages of a single stream
+        are still output in the order the stream produced them, while messages of different streams are interleaved. Only enable this if
+        the streams of the source are independent of each other and safe to read from different threads.
+        """
+        return 1
+
+    @property
+    def concurrent_read_buffer_size(self) -> int:
+        """
+        The maximum number of messages buffered between the worker threads and the consumer of the Read operation when streams are read in
+        parallel. Workers block once the buffer is full, which bounds memory usage when the destination is slower than the source.
+        """
+        return 10000
+
     def discover(self, logger: AirbyteLogger, config: Mapping[str, Any]) -> AirbyteCatalog:
         """Implements the Discover operation from the Airbyte Specification. See https://docs.airbyte.io/architecture/airbyte-specification."""
         streams = [stream.as_airbyte_stream() for stream in self.streams(config=config)]
@@ -95,25 +156,83 @@ class AbstractSource(Source, ABC):
         """Implements the Read operation from the Airbyte Specification. See https://docs.airbyte.io/architecture/airbyte-specification."""
         connector_state = copy.deepcopy(state or {})
         logger.info(f"Starting syncing {self.name}")
-        # TODO assert all streams exist in the connector
         # get the streams once in case the connector needs to make any queries to generate them
         stream_instances = {s.name: s for s in self.streams(config)}
+        streams_to_read = []
         for configured_stream in catalog.streams:
             stream_instance = stream_instances.get(configured_stream.stream.name)
             if not stream_instance:
                 raise KeyError(
                     f"The requested stream {configured_stream.stream.name} was not found in the source. Available streams: {stream_instances.keys()}"
                 )
+            streams_to_read.append((stream_instance, configured_stream))
+
+        if self.max_concurrent_streams > 1 and len(streams_to_read) > 1:
+            yield from self._read_streams_concurrently(logger, streams_to_read, connector_state)
+        else:
+            for stream_instance, configured_stream in streams_to_read:
+                try:
+                    yield from self._read_stream(
+                        logger=logger, stream_instance=stream_instance, configured_stream=configured_stream, connector_state=connector_state
+                    )
+                except Exception as e:
+                    logger.exception(f"Encountered an exception while reading stream {self.name}")
+                    raise e
+
+        logger.info(f"Finished syncing {self.name}")
+
+    def _read_streams_concurrently(
+        self,
+        logger: AirbyteLogger,
+        streams_to_read: List[Tuple[Stream, ConfiguredAirbyteStream]],
+        connector_state: MutableMapping[str, Any],
+    ) -> Iterator[AirbyteMessage]:
+        """
+        Reads every stream on its own worker thread and merges their messages into a single iterator. Each worker puts the messages of its
+        stream on a shared bounded queue in order, so a STATE message is always output after the records it accounts for.
+        """
+        messages: Queue = Queue(maxsize=self.concurrent_read_buffer_size)
+        stop_reading = threading.Event()
+
+        def put(item: Any) -> bool:
+            return _put_until_stopped(messages, item, stop_reading)
 
+        def read_stream(stream_instance: Stream, configured_stream: ConfiguredAirbyteStream):
             try:
-                yield from self._read_stream(
+                if stop_reading.is_set():
+                    return
+                for message in self._read_stream(
                     logger=logger, stream_instance=stream_instance, configured_stream=configured_stream, connector_state=connector_state
-                )
+                ):
+                    if not put(message):
+                        return
             except Exception as e:
-                logger.exception(f"Encountered an exception while reading stream {self.name}")
-                raise e
+                logger.exception(f"Encountered an exception while reading stream {configured_stream.stream.name}")
+                put(e)
+            finally:
+                put(_DONE)
 
-        logger.info(f"Finished syncing {self.name}")
+        workers = min(self.max_concurrent_streams, len(streams_to_read))
+        logger.info(f"Reading {len(streams_to_read)} streams using {workers} parallel workers")
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=self.name) as executor:
+            for stream_instance, configured_stream in streams_to_read:
+                executor.submit(read_stream, stream_instance, configured_stream)
+            try:
+                running = len(streams_to_read)
+                while running:
+                    try:
+                        item = messages.get(timeout=0.1)
+                    except Empty:
+                        continue
+                    if item is _DONE:
+                        running -= 1
+                    elif isinstance(item, Exception):
+                        raise item
+                    else:
+                        yield item
+            finally:
+                # unblock the workers in case the read failed or the consumer stopped early
+                stop_reading.set()
 
     def _read_stream(
         self,
@@ -147,7 +266,7 @@ class AbstractSource(Source, ABC):
         connector_state: MutableMapping[str, Any],
     ) -> Iterator[AirbyteMessage]:
         stream_name = configured_stream.stream.name
-        stream_state = connector_state.get(stream_name, {})
+        stream_state = copy.deepcopy(connector_state.get(stream_name, {}))
         if stream_state:
             logger.info(f"Setting state of {stream_name} stream to {stream_state}")
 
@@ -155,14 +274,31 @@ class AbstractSource(Source, ABC):
         slices = stream_instance.stream_slices(
             cursor_field=configured_stream.cursor_field, sync_mode=SyncMode.incremental, stream_state=stream_state
         )
-        for slice in slices:
-            record_counter = 0
-            records = stream_instance.read_records(
-                sync_mode=SyncMode.incremental,
-                stream_slice=slice,
-                stream_state=stream_state,
-                cursor_field=configured_stream.cursor_field or None,
+        if stream_instance.max_concurrent_slices > 1:
+            sync_start_state = copy.deepcopy(stream_state)
+            slice_records = self._read_slices_concurrently(
+                stream_instance,
+                slices,
+                lambda stream_slice: stream_instance.read_records(
+                    sync_mode=SyncMode.incremental,
+                    stream_slice=stream_slice,
+                    stream_state=copy.deepcopy(sync_start_state),
+                    cursor_field=configured_stream.cursor_field or None,
+                ),
+            )
+        else:
+            # stream_state is evaluated lazily so every slice is read with the state updated by the previous slices
+            slice_records = (
+                stream_instance.read_records(
+                    sync_mode=SyncMode.incremental,
+                    stream_slice=slice,
+                    stream_state=stream_state,
+                    cursor_field=configured_stream.cursor_field or None,
+                )
+                for slice in slices
             )
+        for records in slice_records:
+            record_counter = 0
             for record_data in records:
                 record_counter += 1
                 yield self._as_airbyte_record(stream_name, record_data)
@@ -174,19 +310,77 @@ class AbstractSource(Source, ABC):
 
     def _read_full_refresh(self, stream_instance: Stream, configured_stream: ConfiguredAirbyteStream) -> Iterator[AirbyteMessage]:
         slices = stream_instance.stream_slices(sync_mode=SyncMode.full_refresh, cursor_field=configured_stream.cursor_field)
-        for slice in slices:
-            records = stream_instance.read_records(
-                stream_slice=slice, sync_mode=SyncMode.full_refresh, cursor_field=configured_stream.cursor_field
+
+        def read_slice(stream_slice: Optional[Mapping[str, Any]]) -> Iterable[Mapping[str, Any]]:
+            return stream_instance.read_records(
+                stream_slice=stream_slice, sync_mode=SyncMode.full_refresh, cursor_field=configured_stream.cursor_field
             )
+
+        if stream_instance.max_concurrent_slices > 1:
+            slice_records = self._read_slices_concurrently(stream_instance, slices, read_slice)
+        else:
+            slice_records = (read_slice(slice) for slice in slices)
+        for records in slice_records:
             for record in records:
                 yield self._as_airbyte_record(configured_stream.stream.name, record)
 
+    def _read_slices_concurrently(
+        self,
+        stream_instance: Stream,
+        slices: Iterable[Optional[Mapping[str, Any]]],
+        read_slice: Callable[[Optional[Mapping[str, Any]]], Iterable[Mapping[str, Any]]],
+    ) -> Iterator[Iterator[Mapping[str, Any]]]:
+        """
+        Reads up to `max_concurrent_slices` slices of the stream in parallel and yields an iterator over the records of each slice, in the
+        order of the slices. Records of a slice are buffered until all previous slices have been consumed, so the caller only checkpoints
+        the state of a slice once every earlier slice has completed.
+        """
+        max_slices = stream_instance.max_concurrent_slices
+        stop_reading = threading.Event()
+        slice_iterator = iter(slices)
+
+        def fill_buffer(stream_slice: Optional[Mapping[str, Any]], buffer: Queue):
+            try:
+                if stop_reading.is_set():
+                    return
+                for record in read_slice(stream_slice):
+                    if not _put_until_stopped(buffer, record, stop_reading):
+                        return
+            except Exception as e:
+                _put_until_stopped(buffer, e, stop_reading)
+            finally:
+                _put_until_stopped(buffer, _DONE, stop_reading)
+
+        with ThreadPoolExecutor(max_workers=max_slices, thread_name_prefix=stream_instance.name) as executor:
+            pending: deque = deque()
+
+            def submit_next_slice():
+                for stream_slice in slice_iterator:
+                    buffer: Queue = Queue(maxsize=_SLICE_BUFFER_SIZE)
+                    executor.submit(fill_buffer, stream_slice, buffer)
+                    pending.append(buffer)
+                    return
+
+            try:
+                for _ in range(max_slices):
+                    submit_next_slice()
+                while pending:
+                    yield _get_until_done(pending.popleft())
+                    # the previous slice has been fully consumed, let the next one start
+                    submit_next_slice()
+            finally:
+                stop_reading.set()
+
     def _checkpoint_state(self, stream_name, stream_state, connector_state, logger):
         logger.info(f"Setting state of {stream_name} stream to {stream_state}")
-        connector_state[stream_name] = stream_state
-        return AirbyteMessage(type=MessageType.STATE, state=AirbyteStateMessage(data=connector_state))
+        # store a snapshot so that the emitted message is not affected by streams updating their state in place afterwards
+        with self._state_lock:
+            connector_state[stream_name] = copy.deepcopy(stream_state)
+            return AirbyteMessage(type=MessageType.STATE, state=AirbyteStateMessage(data=dict(connector_state)))
 
     def _as_airbyte_record(self, stream_name: str, data: Mapping[str, Any]):
-        now_millis = int(datetime.now().timestamp()) * 1000
-        message = AirbyteRecordMessage(stream=stream_name, data=data, emitted_at=now_millis)
+        emitted_at = now_millis()
+        if self.message_serializer.fast_path:
+            return unvalidated_record_message(stream_name, data, emitted_at)
+        message = AirbyteRecordMessage(stream=stream_name, data=data, emitted_at=emitted_at)
         return AirbyteMessage(type=MessageType.RECORD, record=message)
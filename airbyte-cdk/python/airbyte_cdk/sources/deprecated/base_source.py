@@ -24,7 +24,6 @@
 
 
 import copy
-from datetime import datetime
 from typing import Any, Iterable, Mapping, MutableMapping, Type
 
 from airbyte_cdk.logger import AirbyteLogger
@@ -41,6 +40,7 @@ from airbyte_cdk.models import (
 )
 from airbyte_cdk.models import Type as MessageType
 from airbyte_cdk.sources.source import Source
+from airbyte_cdk.sources.utils.clock import now_millis
 
 from .client import BaseClient
 
@@ -104,8 +104,7 @@ class BaseSource(Source):
 
         logger.info(f"Syncing {stream_name} stream")
         for record in client.read_stream(configured_stream.stream):
-            now = int(datetime.now().timestamp()) * 1000
-            message = AirbyteRecordMessage(stream=stream_name, data=record, emitted_at=now)
+            message = AirbyteRecordMessage(stream=stream_name, data=record, emitted_at=now_millis())
             yield AirbyteMessage(type=MessageType.RECORD, record=message)
 
         if use_incremental and client.get_stream_state(stream_name):
@@ -28,7 +28,6 @@ import os
 import selectors
 import subprocess
 from dataclasses import dataclass
-from datetime import datetime
 from io import TextIOWrapper
 from typing import Any, DefaultDict, Dict, Iterator, List, Mapping, Optional, Tuple
 
@@ -43,6 +42,7 @@ from airbyte_cdk.models import (
     SyncMode,
     Type,
 )
+from airbyte_cdk.sources.utils.clock import now_millis
 
 _INCREMENTAL = "INCREMENTAL"
 _FULL_TABLE = "FULL_TABLE"
@@ -232,7 +232,7 @@ class SingerHelper:
             out_record = AirbyteRecordMessage(
                 stream=stream_name,
                 data=transformed_json["record"],
-                emitted_at=int(datetime.now().timestamp()) * 1000,
+                emitted_at=now_millis(),
             )
             out_message = AirbyteMessage(type=Type.RECORD, record=out_record)
         return out_message
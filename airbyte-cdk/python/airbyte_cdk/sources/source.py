@@ -31,9 +31,13 @@ from typing import Any, Dict, Iterable, Mapping, MutableMapping
 from airbyte_cdk.connector import Connector
 from airbyte_cdk.logger import AirbyteLogger
 from airbyte_cdk.models import AirbyteCatalog, AirbyteMessage, ConfiguredAirbyteCatalog
+from airbyte_cdk.sources.utils.serialization import AirbyteMessageSerializer
 
 
 class Source(Connector, ABC):
+    # can be overridden to change how output messages are serialized e.g: AirbyteMessageSerializer(fast_path=True)
+    message_serializer = AirbyteMessageSerializer()
+
     # can be overridden to change an input state
     def read_state(self, state_path: str) -> Dict[str, Any]:
         if state_path:
@@ -148,6 +148,19 @@ class Stream(ABC):
         """
         return None
 
+    @property
+    def max_concurrent_slices(self) -> int:
+        """
+        Decides how many slices of this stream are read in parallel. By default slices are read one after another.
+
+        When this returns a value greater than 1, `read_records` is called for several slices at once from worker threads, so it must be
+        safe to call concurrently. Records are still output in the order of the slices returned by `stream_slices`, and the STATE message
+        of a slice (as well as interval checkpoints) is only output once all earlier slices have been fully read. Since slices run
+        ahead of the state, `read_records` receives the stream state as of the beginning of the sync for every slice, so this is best
+        suited to streams whose slices are independent of each other, e.g: date windows.
+        """
+        return 1
+
     def get_updated_state(self, current_stream_state: MutableMapping[str, Any], latest_record: Mapping[str, Any]):
         """
         Override to extract state from the latest record. Needed to implement incremental sync.
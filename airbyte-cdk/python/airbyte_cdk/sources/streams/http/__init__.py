@@ -1,5 +1,15 @@
 # Initialize Streams Package
+from .async_http import AsyncHttpStream
 from .exceptions import UserDefinedBackoffException
 from .http import HttpStream
+from .rate_limiting import AdaptiveRateLimiter, TokenBucketRateLimiter
+from .session import SessionFactory
 
-__all__ = ["HttpStream", "UserDefinedBackoffException"]
+__all__ = [
+    "AdaptiveRateLimiter",
+    "AsyncHttpStream",
+    "HttpStream",
+    "SessionFactory",
+    "TokenBucketRateLimiter",
+    "UserDefinedBackoffException",
+]
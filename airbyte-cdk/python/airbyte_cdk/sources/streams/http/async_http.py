@@ -0,0 +1,194 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import asyncio
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Iterable, List, Mapping, Optional
+
+import requests
+from airbyte_cdk.models import SyncMode
+
+from .http import HttpStream
+
+
+class AsyncHttpStream(HttpStream, ABC):
+    """
+    Base abstract class for HTTP streams which fetch several pages at once, e.g: APIs paginated by offset or reading a known list of IDs.
+
+    `parse_response` and `next_page_token` are coroutines. After the first page of a slice is fetched, `parallel_page_tokens` can return
+    the tokens of every remaining page (e.g: all offsets computed from the total count of the first response), which are then fetched
+    concurrently with up to `max_in_flight_requests` requests in flight. Otherwise pages are followed one after another through
+    `next_page_token` like in HttpStream. Records are always output in page order.
+
+    Requests are still sent with the stream's requests session (from worker threads), so authenticators, retries and backoff, rate
+    limiters and session factories work exactly as for HttpStream. `read_records` runs the event loop and returns a regular iterator,
+    so the stream plugs into AbstractSource like any other stream.
+    """
+
+    @property
+    def max_in_flight_requests(self) -> int:
+        """
+        Override if needed. Maximum number of requests this stream sends concurrently.
+        """
+        return 10
+
+    @abstractmethod
+    async def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        """
+        Override this method to define a sequential pagination strategy, see HttpStream.next_page_token. It isn't called for pages
+        whose tokens were returned by `parallel_page_tokens`.
+        """
+
+    async def parallel_page_tokens(
+        self, response: requests.Response, stream_state: Mapping[str, Any], stream_slice: Mapping[str, Any] = None
+    ) -> Iterable[Mapping[str, Any]]:
+        """
+        Override to fetch the pages of a slice concurrently. Given the response to the first page of the slice, returns the tokens of
+        all remaining pages. Returning no tokens falls back to sequential pagination through `next_page_token`.
+        """
+        return []
+
+    @abstractmethod
+    async def parse_response(
+        self,
+        response: requests.Response,
+        stream_state: Mapping[str, Any],
+        stream_slice: Mapping[str, Any] = None,
+        next_page_token: Mapping[str, Any] = None,
+    ) -> Iterable[Mapping]:
+        """
+        Parses the raw response object into a list of records.
+        """
+
+    def read_records(
+        self,
+        sync_mode: SyncMode,
+        cursor_field: List[str] = None,
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+    ) -> Iterable[Mapping[str, Any]]:
+        loop = asyncio.new_event_loop()
+        executor = ThreadPoolExecutor(max_workers=self.max_in_flight_requests, thread_name_prefix=self.name)
+        pages = self.read_pages(executor, stream_slice=stream_slice, stream_state=stream_state or {}).__aiter__()
+        try:
+            while True:
+                try:
+                    page = loop.run_until_complete(pages.__anext__())
+                except StopAsyncIteration:
+                    break
+                yield from page
+        finally:
+            loop.run_until_complete(pages.aclose())
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+            executor.shutdown(wait=True)
+
+    async def read_pages(
+        self, executor: ThreadPoolExecutor, stream_state: Mapping[str, Any], stream_slice: Mapping[str, Any] = None
+    ) -> AsyncIterator[List[Mapping[str, Any]]]:
+        """
+        Fetches the pages of a slice, yielding the records of each page in page order.
+        """
+        response = await self._fetch(executor, stream_state, stream_slice)
+        yield await self._parse(response, stream_state, stream_slice)
+
+        page_tokens = list(await self.parallel_page_tokens(response, stream_state=stream_state, stream_slice=stream_slice))
+        if page_tokens:
+            parallel_pages = self._read_parallel_pages(executor, stream_state, stream_slice, page_tokens)
+            try:
+                async for page in parallel_pages:
+                    yield page
+            finally:
+                await parallel_pages.aclose()
+            return
+
+        next_page_token = await self.next_page_token(response)
+        while next_page_token:
+            response = await self._fetch(executor, stream_state, stream_slice, next_page_token)
+            yield await self._parse(response, stream_state, stream_slice, next_page_token)
+            next_page_token = await self.next_page_token(response)
+
+    async def _read_parallel_pages(
+        self,
+        executor: ThreadPoolExecutor,
+        stream_state: Mapping[str, Any],
+        stream_slice: Optional[Mapping[str, Any]],
+        page_tokens: List[Mapping[str, Any]],
+    ) -> AsyncIterator[List[Mapping[str, Any]]]:
+        """
+        Fetches the pages of the given tokens keeping up to `max_in_flight_requests` requests in flight, yielding them in token order.
+        """
+        remaining_tokens = iter(page_tokens)
+        in_flight: deque = deque()
+
+        def fetch_next_page():
+            for token in remaining_tokens:
+                in_flight.append(asyncio.ensure_future(self._fetch_page(executor, stream_state, stream_slice, token)))
+                return
+
+        try:
+            for _ in range(self.max_in_flight_requests):
+                fetch_next_page()
+            while in_flight:
+                page = await in_flight.popleft()
+                fetch_next_page()
+                yield page
+        finally:
+            # stop fetching pages nobody will read if the stream fails or is closed early
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+    async def _fetch_page(
+        self,
+        executor: ThreadPoolExecutor,
+        stream_state: Mapping[str, Any],
+        stream_slice: Mapping[str, Any],
+        next_page_token: Mapping[str, Any],
+    ) -> List[Mapping[str, Any]]:
+        response = await self._fetch(executor, stream_state, stream_slice, next_page_token)
+        return await self._parse(response, stream_state, stream_slice, next_page_token)
+
+    async def _fetch(
+        self,
+        executor: ThreadPoolExecutor,
+        stream_state: Mapping[str, Any],
+        stream_slice: Mapping[str, Any] = None,
+        next_page_token: Mapping[str, Any] = None,
+    ) -> requests.Response:
+        request, request_kwargs = self._create_page_request(stream_state, stream_slice, next_page_token)
+        return await asyncio.get_running_loop().run_in_executor(executor, self._send_request, request, request_kwargs)
+
+    async def _parse(
+        self,
+        response: requests.Response,
+        stream_state: Mapping[str, Any],
+        stream_slice: Mapping[str, Any] = None,
+        next_page_token: Mapping[str, Any] = None,
+    ) -> List[Mapping[str, Any]]:
+        records = await self.parse_response(response, stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
+        return list(records)
@@ -37,12 +37,22 @@ class Oauth2Authenticator(HttpAuthenticator):
     The generated access token is attached to each request via the Authorization header.
     """
 
-    def __init__(self, token_refresh_endpoint: str, client_id: str, client_secret: str, refresh_token: str, scopes: List[str] = None):
+    def __init__(
+        self,
+        token_refresh_endpoint: str,
+        client_id: str,
+        client_secret: str,
+        refresh_token: str,
+        scopes: List[str] = None,
+        session: requests.Session = None,
+    ):
         self.token_refresh_endpoint = token_refresh_endpoint
         self.client_secret = client_secret
         self.client_id = client_id
         self.refresh_token = refresh_token
         self.scopes = scopes
+        # reuse the connection to the token endpoint across refreshes
+        self._session = session or requests.Session()
 
         self._token_expiry_date = pendulum.now().subtract(days=1)
         self._access_token = None
@@ -81,7 +91,7 @@ class Oauth2Authenticator(HttpAuthenticator):
         returns a tuple of (access_token, token_lifespan_in_seconds)
         """
         try:
-            response = requests.request(method="POST", url=self.token_refresh_endpoint, data=self.get_refresh_request_body())
+            response = self._session.request(method="POST", url=self.token_refresh_endpoint, data=self.get_refresh_request_body())
             response.raise_for_status()
             response_json = response.json()
             return response_json["access_token"], response_json["expires_in"]
@@ -24,7 +24,7 @@
 
 
 from abc import ABC, abstractmethod
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
+from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 import requests
 from airbyte_cdk.models import SyncMode
@@ -32,7 +32,8 @@ from airbyte_cdk.sources.streams.core import Stream
 
 from .auth.core import HttpAuthenticator, NoAuth
 from .exceptions import DefaultBackoffException, RequestBodyException, UserDefinedBackoffException
-from .rate_limiting import default_backoff_handler, user_defined_backoff_handler
+from .rate_limiting import TokenBucketRateLimiter, default_backoff_handler, user_defined_backoff_handler
+from .session import SessionFactory
 
 # list of all possible HTTP methods which can be used for sending of request bodies
 BODY_REQUEST_METHODS = ("POST", "PUT", "PATCH")
@@ -45,9 +46,21 @@ class HttpStream(Stream, ABC):
 
     source_defined_cursor = True  # Most HTTP streams use a source defined cursor (i.e: the user can't configure it like on a SQL table)
 
-    def __init__(self, authenticator: HttpAuthenticator = NoAuth()):
+    def __init__(
+        self,
+        authenticator: HttpAuthenticator = NoAuth(),
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
+        session_factory: Optional[SessionFactory] = None,
+    ):
+        """
+        :param authenticator: authenticator adding the auth headers to every request
+        :param rate_limiter: rate limiter shared by the streams consuming the same API budget, see the `rate_limiter` property
+        :param session_factory: factory shared by the streams of a source so that they reuse the same pool of connections, by default
+        every stream opens its own connections
+        """
         self._authenticator = authenticator
-        self._session = requests.Session()
+        self._rate_limiter = rate_limiter
+        self._session = session_factory.create_session() if session_factory else requests.Session()
 
     @property
     @abstractmethod
@@ -88,6 +101,15 @@ class HttpStream(Stream, ABC):
     def authenticator(self) -> HttpAuthenticator:
         return self._authenticator
 
+    @property
+    def rate_limiter(self) -> Optional[TokenBucketRateLimiter]:
+        """
+        Override if needed. The rate limiter every request (including retries) waits on before being sent. Share one instance between all
+        the streams consuming the same API budget. The limiter is notified of every response, which lets an AdaptiveRateLimiter slow down
+        on 429 and 5XX responses. By default requests are only limited reactively by the backoff on 429 responses.
+        """
+        return self._rate_limiter
+
     @abstractmethod
     def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
         """
@@ -228,6 +250,23 @@ class HttpStream(Stream, ABC):
 
         return self._session.prepare_request(requests.Request(**args))
 
+    def _create_page_request(
+        self, stream_state: Mapping[str, Any], stream_slice: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None
+    ) -> Tuple[requests.PreparedRequest, Mapping[str, Any]]:
+        """
+        Builds the request for the given page, and the keyword arguments it should be sent with.
+        """
+        request_headers = self.request_headers(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
+        request = self._create_prepared_request(
+            path=self.path(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
+            headers=dict(request_headers, **self.authenticator.get_auth_header()),
+            params=self.request_params(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
+            json=self.request_body_json(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
+            data=self.request_body_data(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
+        )
+        request_kwargs = self.request_kwargs(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
+        return request, request_kwargs
+
     def _send(self, request: requests.PreparedRequest, request_kwargs: Mapping[str, Any]) -> requests.Response:
         """
         Wraps sending the request in rate limit and error handlers.
@@ -247,10 +286,14 @@ class HttpStream(Stream, ABC):
         Unexpected transient exceptions use the default backoff parameters.
         Unexpected persistent exceptions are not handled and will cause the sync to fail.
         """
+        if self.rate_limiter:
+            self.rate_limiter.acquire(request)
         response: requests.Response = self._session.send(request, **request_kwargs)
 
         if self.should_retry(response):
             custom_backoff_time = self.backoff_time(response)
+            if self.rate_limiter:
+                self.rate_limiter.on_retry(request, custom_backoff_time)
             if custom_backoff_time:
                 raise UserDefinedBackoffException(backoff=custom_backoff_time, request=request, response=response)
             else:
@@ -259,6 +302,8 @@ class HttpStream(Stream, ABC):
             # Raise any HTTP exceptions that happened in case there were unexpected ones
             response.raise_for_status()
 
+        if self.rate_limiter:
+            self.rate_limiter.on_success(request)
         return response
 
     def _send_request(self, request: requests.PreparedRequest, request_kwargs: Mapping[str, Any]) -> requests.Response:
@@ -281,15 +326,7 @@ class HttpStream(Stream, ABC):
 
         next_page_token = None
         while not pagination_complete:
-            request_headers = self.request_headers(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
-            request = self._create_prepared_request(
-                path=self.path(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
-                headers=dict(request_headers, **self.authenticator.get_auth_header()),
-                params=self.request_params(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
-                json=self.request_body_json(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
-                data=self.request_body_data(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
-            )
-            request_kwargs = self.request_kwargs(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
+            request, request_kwargs = self._create_page_request(stream_state, stream_slice, next_page_token)
             response = self._send_request(request, request_kwargs)
             yield from self.parse_response(response, stream_state=stream_state, stream_slice=stream_slice)
 
@@ -23,10 +23,15 @@
 #
 
 
+import random
 import sys
+import threading
 import time
+from typing import Any, Dict, Mapping, Optional
+from urllib.parse import urlparse
 
 import backoff
+import requests
 from airbyte_cdk.logger import AirbyteLogger
 from requests import codes, exceptions
 
@@ -55,7 +60,8 @@ def default_backoff_handler(max_tries: int, factor: int, **kwargs):
     return backoff.on_exception(
         backoff.expo,
         TRANSIENT_EXCEPTIONS,
-        jitter=None,
+        # randomize the waits so that requests failing at the same time are not all retried at the same time
+        jitter=backoff.random_jitter,
         on_backoff=log_retry_attempt,
         giveup=should_give_up,
         max_tries=max_tries,
@@ -70,7 +76,8 @@ def user_defined_backoff_handler(max_tries: int, **kwargs):
         if isinstance(exc, UserDefinedBackoffException):
             retry_after = exc.backoff
             logger.info(f"Retrying. Sleeping for {retry_after} seconds")
-            time.sleep(retry_after + 1)  # extra second to cover any fractions of second
+            # extra second to cover any fractions of second, plus a random jitter so that parallel requests don't all retry at once
+            time.sleep(retry_after + 1 + random.random())
 
     def log_give_up(details):
         _, exc, _ = sys.exc_info()
@@ -86,3 +93,159 @@ def user_defined_backoff_handler(max_tries: int, **kwargs):
         max_tries=max_tries,
         **kwargs,
     )
+
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket refilled at `rate` tokens per second and holding at most `capacity` tokens.
+
+    Callers reserve a token under the lock and sleep outside of it, so concurrent callers are served in order without busy waiting.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Takes a token, sleeping until one is available. Returns the number of seconds waited."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            wait_time = -self._tokens / self.rate if self._tokens < 0 else 0
+            wait_time = max(wait_time, self._paused_until - now)
+        if wait_time > 0:
+            time.sleep(wait_time)
+        return wait_time
+
+    def set_rate(self, rate: float):
+        with self._lock:
+            # tokens accumulated so far were earned at the previous rate
+            self._refill(time.monotonic())
+            self.rate = rate
+
+    def pause(self, seconds: float):
+        """Holds back every request until the given number of seconds has passed"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+
+class TokenBucketRateLimiter:
+    """
+    Proactively limits the rate of requests sent by HTTP streams to a budget of `max_requests` per `period_seconds`.
+
+    Requests are let through as long as tokens are left in the bucket, which holds up to `burst` tokens and is refilled continuously at
+    the budgeted rate, so a stream runs at the maximum allowed rate instead of sleeping a fixed worst-case amount after every page.
+    Pass the same instance to every stream sharing the budget, e.g: one limiter per API credential. With `per_host` set, each host
+    gets its own bucket with the same budget.
+
+    Example: allow 60 requests per minute with bursts of up to 10 requests
+        rate_limiter = TokenBucketRateLimiter(max_requests=60, period_seconds=60, burst=10)
+        streams = [Users(authenticator=auth, rate_limiter=rate_limiter), Groups(authenticator=auth, rate_limiter=rate_limiter)]
+    """
+
+    def __init__(self, max_requests: int, period_seconds: float = 1, burst: Optional[int] = None, per_host: bool = False):
+        """
+        :param max_requests: number of requests allowed per period
+        :param period_seconds: length of the period in seconds
+        :param burst: maximum number of requests which can be sent at once after the limiter was idle, defaults to 1
+        :param per_host: whether every host gets its own budget
+        """
+        if max_requests <= 0 or period_seconds <= 0:
+            raise ValueError("The number of requests and the period of a rate limit must be positive")
+        self.rate = max_requests / period_seconds
+        self.burst = burst or 1
+        self.per_host = per_host
+        self._buckets: Dict[str, _TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, request: requests.PreparedRequest) -> float:
+        """Waits until the request is allowed to be sent. Returns the number of seconds waited."""
+        return self._bucket(request).acquire()
+
+    def on_success(self, request: requests.PreparedRequest):
+        """Called once a request got a response which doesn't need to be retried. The budget of this limiter is fixed so this does nothing."""
+
+    def on_retry(self, request: requests.PreparedRequest, backoff_time: Optional[float] = None):
+        """
+        Called when a request is about to be retried because of its response e.g: a 429 status.
+        :param backoff_time: how long the server asked to wait before retrying if known e.g: from a Retry-After header
+        """
+
+    def _bucket(self, request: requests.PreparedRequest) -> _TokenBucket:
+        scope = urlparse(request.url).netloc if self.per_host else ""
+        with self._lock:
+            bucket = self._buckets.get(scope)
+            if not bucket:
+                bucket = self._buckets[scope] = _TokenBucket(rate=self.rate, capacity=self.burst)
+        return bucket
+
+
+class AdaptiveRateLimiter(TokenBucketRateLimiter):
+    """
+    Token bucket rate limiter whose rate adapts to the feedback of the server (additive increase, multiplicative decrease).
+
+    The rate starts at the budget given by `max_requests` / `period_seconds`, which is also its ceiling. Every request which has to be
+    retried (429 or 5XX responses) multiplies the rate by `decrease_factor`, and if the server told how long to back off, every request
+    sharing the bucket is held back for that long plus a random jitter, so parallel streams don't all retry at the same moment. Every
+    successful request adds `increase_step` back to the rate. The current rates and the retry counts are exposed by `metrics`.
+    """
+
+    def __init__(
+        self,
+        max_requests: int,
+        period_seconds: float = 1,
+        burst: Optional[int] = None,
+        per_host: bool = False,
+        decrease_factor: float = 0.5,
+        increase_step: Optional[float] = None,
+        min_rate: Optional[float] = None,
+        jitter: float = 0.1,
+    ):
+        """
+        :param decrease_factor: factor applied to the rate whenever a request is retried
+        :param increase_step: requests per second added to the rate after each successful request, defaults to 1% of the budget
+        :param min_rate: lowest rate in requests per second, defaults to 1% of the budget
+        :param jitter: maximum random extra wait, as a fraction of the backoff time requested by the server
+        """
+        super().__init__(max_requests=max_requests, period_seconds=period_seconds, burst=burst, per_host=per_host)
+        if not 0 < decrease_factor < 1:
+            raise ValueError("The decrease factor must be between 0 and 1")
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step or self.rate / 100
+        self.min_rate = min_rate or self.rate / 100
+        self.jitter = jitter
+        self.successes = 0
+        self.retries = 0
+
+    @property
+    def metrics(self) -> Mapping[str, Any]:
+        """Current rate in requests per second of every bucket (keyed by host if `per_host` is set) and the number of successes and retries"""
+        with self._lock:
+            rates = {scope: bucket.rate for scope, bucket in self._buckets.items()}
+        return {"requests_per_second": rates, "successes": self.successes, "retries": self.retries}
+
+    def on_success(self, request: requests.PreparedRequest):
+        bucket = self._bucket(request)
+        with self._lock:
+            self.successes += 1
+            rate = min(self.rate, bucket.rate + self.increase_step)
+        bucket.set_rate(rate)
+
+    def on_retry(self, request: requests.PreparedRequest, backoff_time: Optional[float] = None):
+        bucket = self._bucket(request)
+        with self._lock:
+            self.retries += 1
+            rate = max(self.min_rate, bucket.rate * self.decrease_factor)
+        bucket.set_rate(rate)
+        logger.info(f"Reducing request rate to {rate:.2f} requests per second after {self.retries} retries")
+        if backoff_time:
+            bucket.pause(backoff_time * (1 + random.uniform(0, self.jitter)))
@@ -0,0 +1,98 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import socket
+from typing import Any, List, Tuple
+
+import requests
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.request import ACCEPT_ENCODING
+
+# Socket options enabling TCP keep-alive probes, so that idle pooled connections (e.g: while polling an async job) are not silently dropped
+TCP_KEEPALIVE_OPTIONS: List[Tuple[int, int, int]] = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+
+
+class _PooledHTTPAdapter(HTTPAdapter):
+    def __init__(self, socket_options: List[Tuple[int, int, int]], **kwargs):
+        self._socket_options = socket_options
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any):
+        kwargs["socket_options"] = self._socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+    def close(self):
+        """Called when any session using the adapter is closed, keeps the connections open for the other sessions"""
+
+    def close_connections(self):
+        super().close()
+
+
+class SessionFactory:
+    """
+    Creates the requests sessions of HTTP streams on top of one shared pool of connections.
+
+    Every session created by a factory mounts the same adapter, so all streams of a source given the same factory reuse the open
+    connections (and TLS sessions) to each host instead of opening new ones. Sessions advertise every content encoding urllib3 can decode,
+    which includes brotli if the brotli package is installed.
+
+    Note that requests only speaks HTTP/1.1, so connection reuse is what saves the handshakes.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+        pool_block: bool = DEFAULT_POOLBLOCK,
+        tcp_keepalive: bool = True,
+    ):
+        """
+        :param pool_connections: number of hosts whose connection pools are kept open
+        :param pool_maxsize: maximum number of open connections kept per host, should be at least the number of parallel requests
+        :param pool_block: whether requests wait for a free connection once pool_maxsize connections are in use, instead of opening
+        extra connections which are discarded after the request
+        :param tcp_keepalive: whether to enable TCP keep-alive probes on the pooled connections
+        """
+        socket_options = list(HTTPConnection.default_socket_options)
+        if tcp_keepalive:
+            socket_options += TCP_KEEPALIVE_OPTIONS
+        self._adapter = _PooledHTTPAdapter(
+            socket_options=socket_options, pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block
+        )
+
+    def create_session(self) -> requests.Session:
+        session = requests.Session()
+        session.mount("https://", self._adapter)
+        session.mount("http://", self._adapter)
+        session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        return session
+
+    def close(self):
+        """
+        Closes the connections of the pool. Closing a session created by the factory leaves them open, as they are shared with the other
+        sessions.
+        """
+        self._adapter.close_connections()
@@ -0,0 +1,46 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import time
+
+
+class MonotonicClock:
+    """
+    Epoch time in milliseconds derived from the monotonic clock, anchored to the system time when the clock is created.
+
+    Reading it costs a single monotonic clock call instead of building a datetime object, which matters when stamping every record,
+    and the returned timestamps never go backwards during a sync even if the system time is adjusted.
+    """
+
+    def __init__(self):
+        self._anchor_millis = time.time() * 1000
+        self._anchor_monotonic = time.monotonic()
+
+    def now_millis(self) -> int:
+        return int(self._anchor_millis + (time.monotonic() - self._anchor_monotonic) * 1000)
+
+
+# Returns the current epoch time in milliseconds, used as the emitted_at timestamp of records
+now_millis = MonotonicClock().now_millis
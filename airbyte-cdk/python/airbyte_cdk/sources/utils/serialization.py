@@ -0,0 +1,108 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import json
+from typing import Any, Callable, Mapping
+
+from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage, Type
+from pydantic.json import pydantic_encoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_RECORD_FIELDS = {"stream", "data", "emitted_at", "namespace"}
+
+
+def unvalidated_record_message(stream_name: str, data: Mapping[str, Any], emitted_at: int) -> AirbyteMessage:
+    """
+    Builds a RECORD message without running pydantic validation on the record data. The data is referenced rather than copied, so it
+    must not be modified after the message is created.
+    """
+    record = AirbyteRecordMessage.construct(stream=stream_name, data=data, emitted_at=emitted_at)
+    return AirbyteMessage.construct(type=Type.RECORD, record=record)
+
+
+class AirbyteMessageSerializer:
+    """
+    Serializes AirbyteMessages into the JSON lines output by a connector.
+
+    By default every message is serialized with pydantic. When `fast_path` is enabled, RECORD messages are serialized by filling a
+    pre-built JSON envelope with the encoded record fields, producing exactly the same output as `message.json(exclude_unset=True)`
+    without walking the pydantic model tree, and AbstractSource skips model validation when building records. Other message types
+    always go through pydantic.
+
+    The `orjson` backend encodes records with orjson (if installed) instead of the standard library. It outputs compact JSON, which is
+    equivalent but not byte-identical to the default output.
+    """
+
+    BACKENDS = ("json", "orjson")
+
+    def __init__(self, fast_path: bool = False, backend: str = "json"):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown serialization backend {backend}, expected one of {self.BACKENDS}")
+        if backend == "orjson" and not orjson:
+            raise ImportError("The orjson serialization backend requires the orjson package to be installed")
+        self.fast_path = fast_path
+        self.backend = backend
+        if backend == "orjson":
+            self._dumps: Callable[[Any], str] = lambda obj: orjson.dumps(obj, default=pydantic_encoder).decode("utf-8")
+            self._record_prefix = '{"type":"RECORD","record":{"stream":'
+            self._data_separator = ',"data":'
+            self._emitted_at_separator = ',"emitted_at":'
+            self._namespace_separator = ',"namespace":'
+        else:
+            self._dumps = lambda obj: json.dumps(obj, default=pydantic_encoder)
+            self._record_prefix = '{"type": "RECORD", "record": {"stream": '
+            self._data_separator = ', "data": '
+            self._emitted_at_separator = ', "emitted_at": '
+            self._namespace_separator = ', "namespace": '
+
+    def serialize(self, message: AirbyteMessage) -> str:
+        if self.fast_path and message.type == Type.RECORD and self._has_plain_record(message):
+            return self._serialize_record(message.record)
+        return message.json(exclude_unset=True)
+
+    @staticmethod
+    def _has_plain_record(message: AirbyteMessage) -> bool:
+        """Only messages holding nothing but the known record fields can be written through the envelope, anything else falls back to pydantic"""
+        return message.__fields_set__ == {"type", "record"} and message.record.__fields_set__ <= _RECORD_FIELDS
+
+    def _serialize_record(self, record: AirbyteRecordMessage) -> str:
+        dumps = self._dumps
+        # fields must be output in the order they are declared on AirbyteRecordMessage to match pydantic
+        parts = [
+            self._record_prefix,
+            dumps(record.stream),
+            self._data_separator,
+            dumps(record.data),
+            self._emitted_at_separator,
+            dumps(record.emitted_at),
+        ]
+        if "namespace" in record.__fields_set__:
+            parts += [self._namespace_separator, dumps(record.namespace)]
+        parts.append("}}")
+        return "".join(parts)
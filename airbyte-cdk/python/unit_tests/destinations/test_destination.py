@@ -30,7 +30,7 @@ from typing import Any, Dict, Iterable, List, Mapping, Union
 from unittest.mock import ANY
 
 import pytest
-from airbyte_cdk.destinations import Destination
+from airbyte_cdk.destinations import Destination, RecordBatch, batch_records
 from airbyte_cdk.models import (
     AirbyteCatalog,
     AirbyteConnectionStatus,
@@ -253,3 +253,49 @@ class TestRun:
     def test_run_cmd_with_incorrect_args_fails(self, args, destination: Destination):
         with pytest.raises(Exception):
             list(destination.run_cmd(parsed_args=argparse.Namespace(**args)))
+
+
+class TestLazyInputParsing:
+    def test_parse_input_stream_lazily(self, destination: Destination):
+        destination.lazy_input_parsing = True
+        record = _record("s1", {"k1": "v1", "nested": {"k2": [1, 2]}})
+        state = _state({"s1": {"cursor": 1}})
+        lines = [
+            _wrapped(record).json(exclude_unset=True),
+            _wrapped(state).json(exclude_unset=True),
+            '{"type": "RECORD", "record": {"stream": "s1", "data": "not a dict", "emitted_at": 0}}',
+            "not a message",
+        ]
+        input_stream = io.TextIOWrapper(io.BytesIO(bytes("\n".join(lines), "utf-8")))
+
+        messages = list(destination._parse_input_stream(input_stream))
+
+        assert messages == [_wrapped(record), _wrapped(state)]
+        assert isinstance(messages[0].record.data, dict)
+
+
+class TestBatchRecords:
+    def test_records_are_batched_per_stream(self):
+        messages = [_wrapped(_record("s1", {"i": i})) for i in range(5)] + [_wrapped(_record("s2", {"i": 0}))]
+
+        batches = list(batch_records(messages, batch_size=2))
+
+        assert batches == [
+            RecordBatch("s1", [_record("s1", {"i": 0}), _record("s1", {"i": 1})]),
+            RecordBatch("s1", [_record("s1", {"i": 2}), _record("s1", {"i": 3})]),
+            RecordBatch("s1", [_record("s1", {"i": 4})]),
+            RecordBatch("s2", [_record("s2", {"i": 0})]),
+        ]
+
+    def test_pending_batches_are_output_before_state(self):
+        state = _wrapped(_state({"k1": "v1"}))
+        messages = [_wrapped(_record("s1", {"i": 0})), _wrapped(_record("s2", {"i": 0})), state, _wrapped(_record("s1", {"i": 1}))]
+
+        batches = list(batch_records(messages, batch_size=10))
+
+        assert batches == [
+            RecordBatch("s1", [_record("s1", {"i": 0})]),
+            RecordBatch("s2", [_record("s2", {"i": 0})]),
+            state,
+            RecordBatch("s1", [_record("s1", {"i": 1})]),
+        ]
@@ -140,8 +140,27 @@ class TestOauth2Authenticator:
         resp = Response()
         resp.status_code = 200
 
-        mocker.patch.object(requests, "request", return_value=resp)
+        mocker.patch.object(requests.Session, "request", return_value=resp)
         mocker.patch.object(resp, "json", return_value={"access_token": "access_token", "expires_in": 1000})
         token = oauth.refresh_access_token()
 
         assert ("access_token", 1000) == token
+
+    def test_refresh_reuses_session(self, mocker):
+        session = requests.Session()
+        oauth = Oauth2Authenticator(
+            TestOauth2Authenticator.refresh_endpoint,
+            TestOauth2Authenticator.client_id,
+            TestOauth2Authenticator.client_secret,
+            TestOauth2Authenticator.refresh_token,
+            session=session,
+        )
+        resp = Response()
+        resp.status_code = 200
+        mocker.patch.object(session, "request", return_value=resp)
+        mocker.patch.object(resp, "json", return_value={"access_token": "access_token", "expires_in": 1000})
+
+        oauth.refresh_access_token()
+        oauth.refresh_access_token()
+
+        assert session.request.call_count == 2
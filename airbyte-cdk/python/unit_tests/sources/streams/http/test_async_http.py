@@ -0,0 +1,167 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import threading
+import time
+from typing import Any, Iterable, Mapping, Optional
+
+import pytest
+import requests
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams.http import AsyncHttpStream
+
+
+class StubOffsetAsyncHttpStream(AsyncHttpStream):
+    """Paginates by offset: the first page tells the total number of records so all other pages can be fetched at once"""
+
+    url_base = "https://test_base_url.com/"
+    primary_key = "id"
+    page_size = 2
+
+    def __init__(self, total: int, max_in_flight_requests: int = 3):
+        super().__init__()
+        self.total = total
+        self._max_in_flight_requests = max_in_flight_requests
+
+    @property
+    def max_in_flight_requests(self) -> int:
+        return self._max_in_flight_requests
+
+    def path(self, **kwargs) -> str:
+        return "items"
+
+    def request_params(self, stream_state: Mapping[str, Any], stream_slice: Mapping[str, Any] = None, next_page_token=None):
+        return next_page_token or {"offset": 0}
+
+    async def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        return None
+
+    async def parallel_page_tokens(self, response: requests.Response, stream_state: Mapping[str, Any], stream_slice=None):
+        return [{"offset": offset} for offset in range(self.page_size, self.total, self.page_size)]
+
+    async def parse_response(self, response: requests.Response, stream_state: Mapping[str, Any], **kwargs) -> Iterable[Mapping]:
+        offset = int(response.text)
+        return [{"id": i} for i in range(offset, min(offset + self.page_size, self.total))]
+
+
+class StubCursorAsyncHttpStream(StubOffsetAsyncHttpStream):
+    """Follows the pages one after another"""
+
+    async def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        next_offset = int(response.text) + self.page_size
+        return {"offset": next_offset} if next_offset < self.total else None
+
+    async def parallel_page_tokens(self, response: requests.Response, stream_state: Mapping[str, Any], stream_slice=None):
+        return []
+
+
+class SlowServer:
+    """Answers the requests of the stub streams, later pages faster than earlier ones so that responses arrive out of order"""
+
+    def __init__(self, total: int, delay: float = 0):
+        self.total = total
+        self.delay = delay
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, request: requests.PreparedRequest, request_kwargs: Mapping[str, Any]) -> requests.Response:
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        offset = int(request.url.split("offset=")[1])
+        time.sleep(self.delay * (self.total - offset) / self.total)
+        with self._lock:
+            self.in_flight -= 1
+        response = requests.Response()
+        response.status_code = 200
+        response._content = str(offset).encode()
+        return response
+
+
+def test_parallel_pages_are_read_in_order(mocker):
+    stream = StubOffsetAsyncHttpStream(total=20, max_in_flight_requests=4)
+    server = SlowServer(total=20, delay=0.05)
+    mocker.patch.object(stream, "_send_request", side_effect=server)
+
+    records = list(stream.read_records(sync_mode=SyncMode.full_refresh))
+
+    assert [{"id": i} for i in range(20)] == records
+    assert 1 < server.max_in_flight <= 4
+
+
+def test_max_in_flight_requests_of_one_reads_pages_one_by_one(mocker):
+    stream = StubOffsetAsyncHttpStream(total=10, max_in_flight_requests=1)
+    server = SlowServer(total=10, delay=0.01)
+    mocker.patch.object(stream, "_send_request", side_effect=server)
+
+    records = list(stream.read_records(sync_mode=SyncMode.full_refresh))
+
+    assert [{"id": i} for i in range(10)] == records
+    assert server.max_in_flight == 1
+
+
+def test_sequential_pagination_with_next_page_token(mocker):
+    stream = StubCursorAsyncHttpStream(total=7)
+    server = SlowServer(total=7)
+    mocker.patch.object(stream, "_send_request", side_effect=server)
+
+    records = list(stream.read_records(sync_mode=SyncMode.full_refresh))
+
+    assert [{"id": i} for i in range(7)] == records
+    assert server.requests == 4
+
+
+def test_reading_a_few_records_stops_fetching_pages(mocker):
+    stream = StubOffsetAsyncHttpStream(total=100, max_in_flight_requests=2)
+    server = SlowServer(total=100)
+    mocker.patch.object(stream, "_send_request", side_effect=server)
+
+    records = stream.read_records(sync_mode=SyncMode.full_refresh)
+    first_records = [next(records) for _ in range(3)]
+    records.close()
+
+    assert [{"id": 0}, {"id": 1}, {"id": 2}] == first_records
+    assert server.requests < 10
+
+
+def test_request_errors_are_raised(mocker):
+    stream = StubOffsetAsyncHttpStream(total=10)
+    mocker.patch.object(stream, "_send_request", side_effect=requests.exceptions.HTTPError("boom"))
+
+    with pytest.raises(requests.exceptions.HTTPError, match="boom"):
+        list(stream.read_records(sync_mode=SyncMode.full_refresh))
+
+
+def test_requests_are_sent_with_the_stream_session(requests_mock):
+    stream = StubCursorAsyncHttpStream(total=4)
+    requests_mock.get("https://test_base_url.com/items?offset=0", text="0")
+    requests_mock.get("https://test_base_url.com/items?offset=2", text="2")
+
+    records = list(stream.read_records(sync_mode=SyncMode.full_refresh))
+
+    assert [{"id": i} for i in range(4)] == records
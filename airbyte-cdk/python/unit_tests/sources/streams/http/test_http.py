@@ -30,7 +30,7 @@ from unittest.mock import ANY
 import pytest
 import requests
 from airbyte_cdk.models import SyncMode
-from airbyte_cdk.sources.streams.http import HttpStream
+from airbyte_cdk.sources.streams.http import AdaptiveRateLimiter, HttpStream, TokenBucketRateLimiter
 from airbyte_cdk.sources.streams.http.exceptions import DefaultBackoffException, RequestBodyException, UserDefinedBackoffException
 
 
@@ -303,3 +303,34 @@ class TestRequestBody:
                 assert response["body"] == self.data_body
             else:
                 assert response["body"] is None
+
+
+def test_rate_limiter_is_acquired_before_each_request(mocker, requests_mock):
+    rate_limiter = TokenBucketRateLimiter(max_requests=100)
+    mocker.patch.object(rate_limiter, "acquire", return_value=0)
+    stream = StubBasicReadHttpStream()
+    stream._rate_limiter = rate_limiter
+    mocker.patch.object(StubBasicReadHttpStream, "retry_factor", new_callable=mocker.PropertyMock, return_value=0)
+    requests_mock.register_uri("GET", stream.url_base, [{"status_code": 429}, {"status_code": 200}])
+
+    list(stream.read_records(sync_mode=SyncMode.full_refresh))
+
+    # the retried request waits on the limiter as well
+    assert rate_limiter.acquire.call_count == 2
+
+
+def test_rate_limiter_is_notified_of_responses(mocker, requests_mock):
+    rate_limiter = AdaptiveRateLimiter(max_requests=100)
+    mocker.patch.object(rate_limiter, "acquire", return_value=0)
+    mocker.patch.object(rate_limiter, "on_retry")
+    mocker.patch.object(rate_limiter, "on_success")
+    stream = StubBasicReadHttpStream()
+    stream._rate_limiter = rate_limiter
+    mocker.patch.object(StubBasicReadHttpStream, "retry_factor", new_callable=mocker.PropertyMock, return_value=0)
+    mocker.patch.object(StubBasicReadHttpStream, "backoff_time", return_value=None)
+    requests_mock.register_uri("GET", stream.url_base, [{"status_code": 503}, {"status_code": 200}])
+
+    list(stream.read_records(sync_mode=SyncMode.full_refresh))
+
+    rate_limiter.on_retry.assert_called_once_with(ANY, None)
+    rate_limiter.on_success.assert_called_once()
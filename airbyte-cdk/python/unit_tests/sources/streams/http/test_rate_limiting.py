@@ -0,0 +1,136 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import pytest
+import requests
+from airbyte_cdk.sources.streams.http.rate_limiting import AdaptiveRateLimiter, TokenBucketRateLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(mocker) -> FakeClock:
+    fake_clock = FakeClock()
+    mocker.patch("airbyte_cdk.sources.streams.http.rate_limiting.time.monotonic", side_effect=fake_clock.monotonic)
+    mocker.patch("airbyte_cdk.sources.streams.http.rate_limiting.time.sleep", side_effect=fake_clock.sleep)
+    return fake_clock
+
+
+def _request(url: str = "https://api.test.com/v1/users") -> requests.PreparedRequest:
+    return requests.Request("GET", url).prepare()
+
+
+def test_burst_is_sent_without_waiting(clock):
+    limiter = TokenBucketRateLimiter(max_requests=10, period_seconds=1, burst=3)
+
+    waits = [limiter.acquire(_request()) for _ in range(3)]
+
+    assert waits == [0, 0, 0]
+    assert clock.sleeps == []
+
+
+def test_requests_are_paced_at_the_budgeted_rate(clock):
+    limiter = TokenBucketRateLimiter(max_requests=60, period_seconds=60)
+
+    waits = [limiter.acquire(_request()) for _ in range(4)]
+
+    assert waits == [0, pytest.approx(1), pytest.approx(1), pytest.approx(1)]
+
+
+def test_idle_time_refills_tokens(clock):
+    limiter = TokenBucketRateLimiter(max_requests=2, period_seconds=1, burst=2)
+    limiter.acquire(_request())
+    limiter.acquire(_request())
+
+    clock.now += 10
+
+    # the bucket never holds more than the burst size
+    assert [limiter.acquire(_request()) for _ in range(3)] == [0, 0, pytest.approx(0.5)]
+
+
+def test_per_host_budgets_are_independent(clock):
+    limiter = TokenBucketRateLimiter(max_requests=1, period_seconds=1, per_host=True)
+
+    assert limiter.acquire(_request("https://first.test.com/users")) == 0
+    assert limiter.acquire(_request("https://second.test.com/users")) == 0
+    assert limiter.acquire(_request("https://first.test.com/groups")) == pytest.approx(1)
+
+
+@pytest.mark.parametrize("max_requests, period_seconds", [(0, 1), (1, 0)])
+def test_invalid_budget_raises(max_requests, period_seconds):
+    with pytest.raises(ValueError):
+        TokenBucketRateLimiter(max_requests=max_requests, period_seconds=period_seconds)
+
+
+def test_adaptive_rate_decreases_on_retry_and_recovers_on_success(clock):
+    request = _request()
+    limiter = AdaptiveRateLimiter(max_requests=100, period_seconds=1, increase_step=10)
+    limiter.acquire(request)
+
+    limiter.on_retry(request)
+    limiter.on_retry(request)
+    assert limiter.metrics["requests_per_second"] == {"": 25}
+
+    for _ in range(3):
+        limiter.on_success(request)
+    assert limiter.metrics == {"requests_per_second": {"": 55}, "successes": 3, "retries": 2}
+
+    for _ in range(10):
+        limiter.on_success(request)
+    # the rate never exceeds the budget
+    assert limiter.metrics["requests_per_second"] == {"": 100}
+
+
+def test_adaptive_rate_never_drops_below_minimum(clock):
+    request = _request()
+    limiter = AdaptiveRateLimiter(max_requests=100, period_seconds=1, min_rate=10)
+
+    for _ in range(10):
+        limiter.on_retry(request)
+
+    assert limiter.metrics["requests_per_second"] == {"": 10}
+
+
+def test_adaptive_backoff_hint_pauses_all_requests(clock, mocker):
+    mocker.patch("airbyte_cdk.sources.streams.http.rate_limiting.random.uniform", return_value=0.1)
+    request = _request()
+    limiter = AdaptiveRateLimiter(max_requests=100, period_seconds=1, burst=10)
+    limiter.acquire(request)
+
+    limiter.on_retry(request, backoff_time=30)
+
+    # the pause is stretched by the jitter
+    assert limiter.acquire(request) == pytest.approx(33)
@@ -0,0 +1,66 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import socket
+
+from airbyte_cdk.sources.streams.http.session import SessionFactory
+
+
+def test_sessions_share_connection_pool():
+    factory = SessionFactory()
+
+    first, second = factory.create_session(), factory.create_session()
+
+    assert first.get_adapter("https://api.test.com") is second.get_adapter("https://api.test.com")
+    assert first.get_adapter("http://api.test.com") is first.get_adapter("https://other.test.com")
+    # sessions still keep their own headers
+    first.headers["X-Test"] = "1"
+    assert "X-Test" not in second.headers
+
+
+def test_closing_a_session_keeps_shared_connections():
+    factory = SessionFactory()
+    first, second = factory.create_session(), factory.create_session()
+    pool = second.get_adapter("https://api.test.com").poolmanager.connection_from_url("https://api.test.com")
+
+    first.close()
+    assert second.get_adapter("https://api.test.com").poolmanager.connection_from_url("https://api.test.com") is pool
+
+    factory.close()
+    assert second.get_adapter("https://api.test.com").poolmanager.connection_from_url("https://api.test.com") is not pool
+
+
+def test_pool_is_configurable():
+    session = SessionFactory(pool_maxsize=32).create_session()
+
+    pool_kwargs = session.get_adapter("https://api.test.com").poolmanager.connection_pool_kw
+
+    assert pool_kwargs["maxsize"] == 32
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in pool_kwargs["socket_options"]
+
+
+def test_accept_encoding_negotiates_compression():
+    session = SessionFactory().create_session()
+    assert "gzip" in session.headers["Accept-Encoding"]
@@ -23,6 +23,7 @@
 #
 
 
+import threading
 from collections import defaultdict
 from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
@@ -366,3 +367,151 @@ def test_valid_incremental_read_with_slices_and_interval(mocker, logger):
     messages = _fix_emitted_at(list(src.read(logger, {}, catalog, state=defaultdict(dict))))
 
     assert expected == messages
+
+
+class ConcurrentMockSource(MockSource):
+    @property
+    def max_concurrent_streams(self) -> int:
+        return 4
+
+
+def _messages_of_stream(messages: List[AirbyteMessage], stream: str) -> List[AirbyteMessage]:
+    return [m for m in messages if m.type == Type.RECORD and m.record.stream == stream]
+
+
+def test_concurrent_full_refresh_read_keeps_per_stream_order(mocker, logger):
+    """Tests that reading streams in parallel outputs every record and keeps the order of records within each stream"""
+    stream_output = [{"k": i} for i in range(100)]
+    streams = [MockStream([({"sync_mode": SyncMode.full_refresh}, stream_output)], name=f"s{i}") for i in range(5)]
+
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+
+    src = ConcurrentMockSource(streams=streams)
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(s, SyncMode.full_refresh) for s in streams])
+
+    messages = _fix_emitted_at(list(src.read(logger, {}, catalog)))
+
+    assert len(messages) == 500
+    for stream in streams:
+        assert _messages_of_stream(messages, stream.name) == _as_records(stream.name, stream_output)
+
+
+def test_concurrent_incremental_read_outputs_state_after_records(mocker, logger):
+    """Tests that in parallel reads the STATE message of each stream follows all of its records and the final state covers all streams"""
+    stream_output = [{"k1": "v1"}, {"k2": "v2"}]
+    s1 = MockStream([({"sync_mode": SyncMode.incremental, "stream_state": {}}, stream_output)], name="s1")
+    s2 = MockStream([({"sync_mode": SyncMode.incremental, "stream_state": {}}, stream_output)], name="s2")
+    state = {"cursor": "value"}
+    mocker.patch.object(MockStream, "get_updated_state", return_value=state)
+    mocker.patch.object(MockStream, "supports_incremental", return_value=True)
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+
+    src = ConcurrentMockSource(streams=[s1, s2])
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(s1, SyncMode.incremental), _configured_stream(s2, SyncMode.incremental)])
+
+    messages = _fix_emitted_at(list(src.read(logger, {}, catalog, state=defaultdict(dict))))
+
+    for stream_name in ["s1", "s2"]:
+        last_record = max(i for i, m in enumerate(messages) if m.type == Type.RECORD and m.record.stream == stream_name)
+        first_state = min(i for i, m in enumerate(messages) if m.type == Type.STATE and stream_name in m.state.data)
+        assert last_record < first_state
+    assert messages[-1] == _state({"s1": state, "s2": state})
+
+
+def test_concurrent_read_raises_stream_exception(mocker, logger):
+    """Tests that an exception raised while reading one stream in parallel is re-raised by the Read operation"""
+    s1 = MockStream([({"sync_mode": SyncMode.full_refresh}, [{"k1": "v1"}])], name="s1")
+    s2 = MockStream(name="s2")
+
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+
+    src = ConcurrentMockSource(streams=[s1, s2])
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[_configured_stream(s1, SyncMode.full_refresh), _configured_stream(s2, SyncMode.full_refresh)]
+    )
+
+    with pytest.raises(Exception, match="No mocked output supplied"):
+        list(src.read(logger, {}, catalog))
+
+
+def test_state_lock_is_per_instance():
+    """Sources don't share the lock guarding their state, even though MockSource doesn't call AbstractSource.__init__"""
+    src1, src2 = MockSource(), MockSource()
+
+    assert src1._state_lock is src1._state_lock
+    assert src1._state_lock is not src2._state_lock
+
+
+class ConcurrentSlicesMockStream(MockStream):
+    @property
+    def max_concurrent_slices(self) -> int:
+        return 3
+
+
+def test_concurrent_slices_incremental_read_matches_serial_output(mocker, logger):
+    """Tests that reading slices in parallel outputs records and STATE messages in the same order as a serial read"""
+    slices = [{"slice": i} for i in range(5)]
+    stream_output = [{"k1": "v1"}, {"k2": "v2"}, {"k3": "v3"}]
+    s1 = ConcurrentSlicesMockStream(
+        [({"sync_mode": SyncMode.incremental, "stream_slice": s, "stream_state": mocker.ANY}, stream_output) for s in slices], name="s1"
+    )
+    state = {"cursor": "value"}
+    mocker.patch.object(MockStream, "get_updated_state", return_value=state)
+    mocker.patch.object(MockStream, "supports_incremental", return_value=True)
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+    mocker.patch.object(MockStream, "stream_slices", return_value=slices)
+    mocker.patch.object(MockStream, "state_checkpoint_interval", new_callable=mocker.PropertyMock, return_value=2)
+
+    src = MockSource(streams=[s1])
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(s1, SyncMode.incremental)])
+
+    expected = []
+    for _ in slices:
+        expected += [
+            _as_record("s1", stream_output[0]),
+            _as_record("s1", stream_output[1]),
+            _state({"s1": state}),
+            _as_record("s1", stream_output[2]),
+            _state({"s1": state}),
+        ]
+
+    messages = _fix_emitted_at(list(src.read(logger, {}, catalog, state=defaultdict(dict))))
+
+    assert expected == messages
+
+
+def test_concurrent_slices_are_read_in_parallel(mocker, logger):
+    """Tests that several slices are being read at the same time when the stream allows concurrent slices"""
+    slices = [{"slice": i} for i in range(3)]
+    barrier = threading.Barrier(len(slices), timeout=5)
+
+    def read_records(**kwargs):
+        # every slice waits for the others to start, which would time out if slices were read one after another
+        barrier.wait()
+        yield kwargs["stream_slice"]
+
+    s1 = ConcurrentSlicesMockStream(name="s1")
+    mocker.patch.object(s1, "read_records", side_effect=read_records)
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+    mocker.patch.object(MockStream, "stream_slices", return_value=slices)
+
+    src = MockSource(streams=[s1])
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(s1, SyncMode.full_refresh)])
+
+    messages = _fix_emitted_at(list(src.read(logger, {}, catalog)))
+
+    assert _as_records("s1", slices) == messages
+
+
+def test_concurrent_slices_read_raises_slice_exception(mocker, logger):
+    """Tests that an exception raised while reading a slice in parallel is re-raised by the Read operation"""
+    slices = [{"1": "1"}, {"2": "2"}]
+    s1 = ConcurrentSlicesMockStream([({"sync_mode": SyncMode.full_refresh, "stream_slice": slices[0]}, [slices[0]])], name="s1")
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+    mocker.patch.object(MockStream, "stream_slices", return_value=slices)
+
+    src = MockSource(streams=[s1])
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(s1, SyncMode.full_refresh)])
+
+    with pytest.raises(Exception, match="No mocked output supplied"):
+        list(src.read(logger, {}, catalog))
@@ -0,0 +1,77 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import logging
+import time
+from datetime import datetime
+
+import pytest
+from airbyte_cdk.sources.utils.clock import MonotonicClock, now_millis
+
+logger = logging.getLogger(__name__)
+
+
+def test_now_millis_is_close_to_system_time():
+    assert abs(now_millis() - time.time() * 1000) < 1000
+
+
+def test_clock_never_goes_backwards(mocker):
+    clock = MonotonicClock()
+    first = clock.now_millis()
+    # moving the system time back must not affect timestamps
+    mocker.patch("airbyte_cdk.sources.utils.clock.time.time", return_value=0)
+    assert clock.now_millis() >= first
+
+
+def test_clock_matches_the_datetime_timestamps():
+    """The clock stamps records with the same epoch milliseconds as datetime.now(), which emitted_at used to be computed with"""
+    clock = MonotonicClock()
+    before = datetime.now().timestamp() * 1000
+    timestamps = [clock.now_millis() for _ in range(1000)]
+    after = datetime.now().timestamp() * 1000
+    assert timestamps == sorted(timestamps)
+    # the clock truncates to the millisecond, its anchor may be read a few microseconds apart from the system time
+    assert before - 1 <= timestamps[0] and timestamps[-1] <= after + 1
+
+
+@pytest.mark.benchmark
+def test_benchmark_emitted_at_per_record_overhead():
+    """Compares the time spent computing the emitted_at timestamp of 1M records with datetime.now() and with the monotonic clock"""
+    records_count = 1_000_000
+
+    start = time.perf_counter()
+    for _ in range(records_count):
+        int(datetime.now().timestamp()) * 1000
+    datetime_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(records_count):
+        now_millis()
+    clock_time = time.perf_counter() - start
+
+    logger.info(
+        f"emitted_at overhead per record: datetime.now() {datetime_time / records_count * 1e9:.0f}ns, "
+        f"monotonic clock {clock_time / records_count * 1e9:.0f}ns"
+    )
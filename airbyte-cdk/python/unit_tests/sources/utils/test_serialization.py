@@ -0,0 +1,124 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import datetime
+import decimal
+import json
+import logging
+import time
+from enum import Enum
+
+import pytest
+from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, AirbyteRecordMessage, AirbyteStateMessage, Level, Type
+from airbyte_cdk.sources.utils.serialization import AirbyteMessageSerializer, unvalidated_record_message
+
+logger = logging.getLogger(__name__)
+
+
+class Color(Enum):
+    RED = "red"
+
+
+RECORD_DATA = [
+    {},
+    {"id": 1, "name": "octavia", "score": 1.5, "active": True, "deleted_at": None},
+    {"nested": {"list": [1, "two", {"three": 3.0}], "empty": []}, "unicode": "résumé ✓", "quote": 'say "hi"\n'},
+    {"created_at": datetime.datetime(2021, 7, 1, 12, 30, 15, 123), "day": datetime.date(2021, 7, 1)},
+    {"amount": decimal.Decimal("10.50"), "tags": {"a"}, "color": Color.RED, "tuple": (1, 2)},
+]
+
+
+@pytest.mark.parametrize("data", RECORD_DATA)
+def test_fast_path_record_is_byte_identical(data):
+    message = AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", data=data, emitted_at=1625140215000))
+    assert AirbyteMessageSerializer(fast_path=True).serialize(message) == message.json(exclude_unset=True)
+
+
+@pytest.mark.parametrize("data", RECORD_DATA)
+def test_unvalidated_record_is_byte_identical(data):
+    validated = AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", data=data, emitted_at=1625140215000))
+    unvalidated = unvalidated_record_message("stream", data, 1625140215000)
+    assert AirbyteMessageSerializer(fast_path=True).serialize(unvalidated) == validated.json(exclude_unset=True)
+
+
+def test_fast_path_record_with_namespace():
+    record = AirbyteRecordMessage(stream="stream", data={"k": "v"}, emitted_at=1, namespace="public")
+    message = AirbyteMessage(type=Type.RECORD, record=record)
+    assert AirbyteMessageSerializer(fast_path=True).serialize(message) == message.json(exclude_unset=True)
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage(data={"stream": {"cursor": 1}})),
+        AirbyteMessage(type=Type.LOG, log=AirbyteLogMessage(level=Level.INFO, message="hello")),
+        AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="s", data={}, emitted_at=1, extra_field="extra")),
+    ],
+)
+def test_other_messages_fall_back_to_pydantic(message):
+    assert AirbyteMessageSerializer(fast_path=True).serialize(message) == message.json(exclude_unset=True)
+
+
+def test_orjson_backend_outputs_equivalent_json():
+    pytest.importorskip("orjson")
+    data = RECORD_DATA[2]
+    message = AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", data=data, emitted_at=1))
+    serialized = AirbyteMessageSerializer(fast_path=True, backend="orjson").serialize(message)
+    assert json.loads(serialized) == json.loads(message.json(exclude_unset=True))
+
+
+def test_unknown_backend_raises():
+    with pytest.raises(ValueError):
+        AirbyteMessageSerializer(backend="pickle")
+
+
+WIDE_RECORD_DATA = {f"column_{i}": f"value {i}" if i % 2 else i for i in range(100)}
+
+
+def test_fast_path_wide_record_is_byte_identical():
+    message = AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", data=WIDE_RECORD_DATA, emitted_at=1))
+    unvalidated = unvalidated_record_message("stream", WIDE_RECORD_DATA, 1)
+    assert AirbyteMessageSerializer(fast_path=True).serialize(unvalidated) == message.json(exclude_unset=True)
+
+
+@pytest.mark.benchmark
+def test_benchmark_fast_path_against_pydantic():
+    """Logs the time spent serializing the same wide records through both paths"""
+    records_count = 5000
+
+    start = time.perf_counter()
+    for _ in range(records_count):
+        AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", data=WIDE_RECORD_DATA, emitted_at=1)).json(
+            exclude_unset=True
+        )
+    pydantic_time = time.perf_counter() - start
+
+    serializer = AirbyteMessageSerializer(fast_path=True)
+    start = time.perf_counter()
+    for _ in range(records_count):
+        serializer.serialize(unvalidated_record_message("stream", WIDE_RECORD_DATA, 1))
+    fast_time = time.perf_counter() - start
+
+    logger.info(f"Serialized {records_count} records: pydantic {pydantic_time:.3f}s, fast path {fast_time:.3f}s")
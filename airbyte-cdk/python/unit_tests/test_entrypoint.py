@@ -30,17 +30,20 @@ from unittest.mock import MagicMock
 
 import pytest
 from airbyte_cdk import AirbyteEntrypoint
+from airbyte_cdk.entrypoint import launch
 from airbyte_cdk.models import (
     AirbyteCatalog,
     AirbyteConnectionStatus,
     AirbyteMessage,
     AirbyteRecordMessage,
+    AirbyteStateMessage,
     AirbyteStream,
     ConnectorSpecification,
     Status,
     Type,
 )
 from airbyte_cdk.sources import Source
+from airbyte_cdk.sources.utils.serialization import AirbyteMessageSerializer
 
 
 class MockSource(Source):
@@ -190,3 +193,28 @@ def test_run_read(entrypoint: AirbyteEntrypoint, mocker, spec_mock, config_mock)
 def test_invalid_command(entrypoint: AirbyteEntrypoint, mocker, config_mock):
     with pytest.raises(Exception):
         list(entrypoint.run(Namespace(command="invalid", config="conf")))
+
+
+def test_run_read_with_fast_serialization(entrypoint: AirbyteEntrypoint, mocker, spec_mock, config_mock):
+    parsed_args = Namespace(command="read", config="config_path", state="statepath", catalog="catalogpath")
+    expected = AirbyteRecordMessage(stream="stream", data={"data": "stuff"}, emitted_at=1)
+    mocker.patch.object(MockSource, "message_serializer", AirbyteMessageSerializer(fast_path=True))
+    mocker.patch.object(MockSource, "read_state", return_value={})
+    mocker.patch.object(MockSource, "read_catalog", return_value={})
+    mocker.patch.object(MockSource, "read", return_value=[AirbyteMessage(record=expected, type=Type.RECORD)])
+    assert [_wrap_message(expected)] == list(entrypoint.run(parsed_args))
+
+
+def test_launch_flushes_state_messages(mocker, spec_mock, config_mock):
+    """The output is flushed after each STATE message, whatever its serialized form"""
+    record = AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", data={"type": "STATE"}, emitted_at=1))
+    state = AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage(data={"stream": "value"}))
+    mocker.patch.object(MockSource, "read_state", return_value={})
+    mocker.patch.object(MockSource, "read_catalog", return_value={})
+    mocker.patch.object(MockSource, "read", return_value=[record, state, record])
+    sink = MagicMock()
+    mocker.patch("airbyte_cdk.entrypoint.get_output_sink", return_value=sink)
+
+    launch(MockSource(), ["read", "--config", "config_path", "--catalog", "catalog_path"])
+
+    assert [call[1]["flush"] for call in sink.write.call_args_list] == [False, True, False]
@@ -0,0 +1,94 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import io
+import threading
+
+from airbyte_cdk.output_sink import OutputSink
+
+
+def test_lines_are_buffered_until_buffer_is_full():
+    stream = io.StringIO()
+    sink = OutputSink(buffer_size=20, flush_interval_seconds=60, stream=stream)
+
+    sink.write("0123456789")
+    assert stream.getvalue() == ""
+
+    sink.write("0123456789")
+    assert stream.getvalue() == "0123456789\n0123456789\n"
+
+
+def test_flush_forces_write():
+    stream = io.StringIO()
+    sink = OutputSink(buffer_size=1024, flush_interval_seconds=60, stream=stream)
+
+    sink.write("record")
+    sink.write("state", flush=True)
+    assert stream.getvalue() == "record\nstate\n"
+
+    sink.write("record")
+    sink.flush()
+    assert stream.getvalue() == "record\nstate\nrecord\n"
+
+
+def test_lines_are_flushed_after_interval(mocker):
+    stream = io.StringIO()
+    monotonic = mocker.patch("airbyte_cdk.output_sink.time.monotonic", return_value=100)
+    sink = OutputSink(buffer_size=1024, flush_interval_seconds=1, stream=stream)
+
+    sink.write("first")
+    assert stream.getvalue() == ""
+
+    monotonic.return_value = 101
+    sink.write("second")
+    assert stream.getvalue() == "first\nsecond\n"
+
+
+def test_unbuffered_sink_writes_every_line():
+    stream = io.StringIO()
+    sink = OutputSink(buffer_size=0, stream=stream)
+
+    sink.write("line")
+    assert stream.getvalue() == "line\n"
+
+
+def test_concurrent_writes_keep_lines_intact():
+    stream = io.StringIO()
+    sink = OutputSink(buffer_size=100, flush_interval_seconds=60, stream=stream)
+
+    def write_lines(thread_id: int):
+        for i in range(1000):
+            sink.write(f"thread {thread_id} line {i}")
+
+    threads = [threading.Thread(target=write_lines, args=(thread_id,)) for thread_id in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    sink.flush()
+
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 4000
+    assert sorted(lines) == sorted(f"thread {t} line {i}" for t in range(4) for i in range(1000))
@@ -0,0 +1,110 @@
+{#
+    Filter keeping only the rows emitted after the last run of the incremental model `model_name`.
+
+    The filter is used by the first (ephemeral) models of a stream pipeline so that only the new raw rows are parsed.
+    Ephemeral models can't rely on is_incremental() and {{ this }} as these describe the ephemeral model itself, so the
+    incremental table is looked up in the dbt graph instead (a ref() to it would introduce a cycle in the DAG).
+    The same rules as is_incremental() apply: the filter is disabled when the table doesn't exist yet or with --full-refresh.
+
+    Like any dbt incremental model (dbt 0.19 has no on_schema_change), new rows are only inserted into the columns the existing
+    table already has: the values of a column added to the stream are dropped until the table is rebuilt by a reset of the
+    connection or a run with --full-refresh.
+#}
+
+{% macro incremental_filter(model_name, col_emitted_at='_airbyte_emitted_at') -%}
+  {%- set relation = none -%}
+  {%- if execute and not flags.FULL_REFRESH -%}
+    {%- set node = graph.nodes.values() | selectattr('resource_type', 'equalto', 'model') | selectattr('name', 'equalto', model_name) | first -%}
+    {#- the model is missing from the graph when it was disabled, in which case every row is kept -#}
+    {%- if node -%}
+      {%- set relation = adapter.get_relation(database=node.database, schema=node.schema, identifier=node.alias) -%}
+    {%- endif -%}
+  {%- endif -%}
+  {%- if relation is not none and relation.type == 'table' -%}
+    {#- max() of an empty table is null, in which case every row is kept -#}
+    coalesce({{ col_emitted_at }} > (select max({{ col_emitted_at }}) from {{ relation }}), true)
+  {%- else -%}
+    1 = 1
+  {%- endif -%}
+{%- endmacro %}
+
+{#
+    Run at the start of dbt runs (see on-run-start in dbt_project.yml): drops the tables built by previous versions of normalization
+    for incremental models merging records on the _airbyte_unique_key column, when these tables don't have that column yet.
+    These tables are then built again from scratch instead of failing to merge new records.
+    The existing relations are looked up in the relation cache of dbt, so a single metadata query lists the up-to-date tables.
+#}
+
+{% macro drop_outdated_incremental_tables() -%}
+  {%- if execute -%}
+    {%- set relations = [] -%}
+    {%- for node in graph.nodes.values() | selectattr('resource_type', 'equalto', 'model') -%}
+      {%- if node.config.materialized == 'incremental' and '_airbyte_unique_key' in node.raw_sql -%}
+        {%- set relation = adapter.get_relation(database=node.database, schema=node.schema, identifier=node.alias) -%}
+        {%- if relation is not none -%}
+          {% do relations.append(relation) %}
+        {%- endif -%}
+      {%- endif -%}
+    {%- endfor -%}
+    {%- if relations -%}
+      {%- set up_to_date_tables = tables_with_column(relations, '_airbyte_unique_key') -%}
+      {%- for relation in relations -%}
+        {%- if (relation.schema ~ '.' ~ relation.identifier) | lower not in up_to_date_tables -%}
+          {% do log('Dropping ' ~ relation ~ ' to rebuild it with the _airbyte_unique_key column', info=true) %}
+          {% do adapter.drop_relation(relation) %}
+        {%- endif -%}
+      {%- endfor -%}
+    {%- endif -%}
+  {%- endif -%}
+{%- endmacro %}
+
+{#
+    Lists the tables of the schemas of the given relations which have a column named `column_name`, as lower case
+    "<schema>.<table>" names.
+#}
+
+{% macro tables_with_column(relations, column_name) -%}
+  {{ return(adapter.dispatch('tables_with_column')(relations, column_name)) }}
+{%- endmacro %}
+
+{% macro default__tables_with_column(relations, column_name) -%}
+  {%- set query -%}
+    select table_schema, table_name
+    from information_schema.columns
+    where lower(column_name) = '{{ column_name }}'
+    and lower(table_schema) in (
+      {%- for schema in relations | map(attribute='schema') | map('lower') | unique -%}
+        '{{ schema }}'{% if not loop.last %}, {% endif %}
+      {%- endfor -%}
+    )
+  {%- endset -%}
+  {{ return(table_names(run_query(query))) }}
+{%- endmacro %}
+
+{% macro bigquery__tables_with_column(relations, column_name) -%}
+  {#- BigQuery has one INFORMATION_SCHEMA per dataset -#}
+  {%- set datasets = [] -%}
+  {%- for relation in relations -%}
+    {%- set dataset = adapter.quote(relation.database) ~ '.' ~ relation.schema -%}
+    {%- if dataset not in datasets -%}
+      {% do datasets.append(dataset) %}
+    {%- endif -%}
+  {%- endfor -%}
+  {%- set query -%}
+    {%- for dataset in datasets %}
+    select table_schema, table_name
+    from {{ dataset }}.INFORMATION_SCHEMA.COLUMNS
+    where lower(column_name) = '{{ column_name }}'
+    {% if not loop.last %}union all{% endif %}
+    {%- endfor %}
+  {%- endset -%}
+  {{ return(table_names(run_query(query))) }}
+{%- endmacro %}
+
+{% macro table_names(results) -%}
+  {%- set names = [] -%}
+  {%- for row in results.rows -%}
+    {% do names.append((row[0] ~ '.' ~ row[1]) | lower) %}
+  {%- endfor -%}
+  {{ return(names) }}
+{%- endmacro %}
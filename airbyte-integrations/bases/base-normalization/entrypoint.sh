@@ -31,8 +31,19 @@ function configuredbt() {
     transform-config --config "${CONFIG_FILE}" --integration-type "${INTEGRATION_TYPE}" --out "${PROJECT_DIR}"
     if [[ -n "${CATALOG_FILE}" ]]; then
       # If catalog file is provided, generate normalization models, otherwise skip it
-      echo "Running: transform-catalog --integration-type ${INTEGRATION_TYPE} --profile-config-dir ${PROJECT_DIR} --catalog ${CATALOG_FILE} --out ${PROJECT_DIR}/models/generated/ --json-column _airbyte_data"
-      transform-catalog --integration-type "${INTEGRATION_TYPE}" --profile-config-dir "${PROJECT_DIR}" --catalog "${CATALOG_FILE}" --out "${PROJECT_DIR}/models/generated/" --json-column "_airbyte_data"
+      TRANSFORM_CATALOG_ARGS=(--integration-type "${INTEGRATION_TYPE}" --profile-config-dir "${PROJECT_DIR}" --catalog "${CATALOG_FILE}" --out "${PROJECT_DIR}/models/generated/" --json-column "_airbyte_data")
+      if [[ -n "${STREAMS_WITH_DATA_FILE}" ]]; then
+        # Generate the "streams_with_data" dbt selector to only run the models of the streams which received records
+        TRANSFORM_CATALOG_ARGS+=(--streams-with-data "${STREAMS_WITH_DATA_FILE}" --selectors-file "${PROJECT_DIR}/selectors.yml")
+      fi
+      if [[ -n "${TRANSFORM_CATALOG_CACHE_FILE}" ]]; then
+        # Reuse the models generated by previous runs for the streams whose schema didn't change, the cache file must be on a volume
+        # kept between runs since every run starts from a new workspace. The platform doesn't set this variable (nor mount such a volume)
+        # yet, so the cache is opt-in and unused by regular syncs.
+        TRANSFORM_CATALOG_ARGS+=(--cache-file "${TRANSFORM_CATALOG_CACHE_FILE}")
+      fi
+      echo "Running: transform-catalog ${TRANSFORM_CATALOG_ARGS[*]}"
+      transform-catalog "${TRANSFORM_CATALOG_ARGS[@]}"
     fi
   else
     # Use git repository as a base workspace folder for dbt projects
@@ -85,6 +96,10 @@ function main() {
       GIT_BRANCH="$2"
       shift 2
       ;;
+    --streams-with-data)
+      STREAMS_WITH_DATA_FILE="$2"
+      shift 2
+      ;;
     *)
       error "Unknown option: $1"
       ;;
@@ -95,7 +110,12 @@ function main() {
   run)
     configuredbt
     # Run dbt to compile and execute the generated normalization models
-    dbt run --profiles-dir "${PROJECT_DIR}" --project-dir "${PROJECT_DIR}"
+    if [[ -f "${PROJECT_DIR}/selectors.yml" && -n "${STREAMS_WITH_DATA_FILE}" && -z "${GIT_REPO}" ]]; then
+      # Only rebuild the models of the streams which received records in this sync
+      dbt run --profiles-dir "${PROJECT_DIR}" --project-dir "${PROJECT_DIR}" --selector streams_with_data
+    else
+      dbt run --profiles-dir "${PROJECT_DIR}" --project-dir "${PROJECT_DIR}"
+    fi
     ;;
   configure-dbt)
     configuredbt
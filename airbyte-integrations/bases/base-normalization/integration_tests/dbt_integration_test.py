@@ -202,20 +202,21 @@ class DbtIntegrationTest(object):
             process.wait()
         return process.returncode == 0
 
-    def dbt_run(self, test_root_dir: str):
+    def dbt_run(self, test_root_dir: str, output_dir: str = "final"):
         """
         Run the dbt CLI to perform transformations on the test raw data in the destination
+        The SQL queries run by dbt are written in the output_dir folder of test_root_dir
         """
         # Perform sanity check on dbt project settings
         assert self.run_check_dbt_command("debug", test_root_dir)
         assert self.run_check_dbt_command("deps", test_root_dir)
-        final_sql_files = os.path.join(test_root_dir, "final")
+        final_sql_files = os.path.join(test_root_dir, output_dir)
         shutil.rmtree(final_sql_files, ignore_errors=True)
         # Compile dbt models files into destination sql dialect, then run the transformation queries
-        assert self.run_check_dbt_command("run", test_root_dir)
+        assert self.run_check_dbt_command("run", test_root_dir, output_dir)
 
     @staticmethod
-    def run_check_dbt_command(command: str, cwd: str) -> bool:
+    def run_check_dbt_command(command: str, cwd: str, output_dir: str = "final") -> bool:
         """
         Run dbt subprocess while checking and counting for "ERROR", "FAIL" or "WARNING" printed in its outputs
         """
@@ -230,7 +231,7 @@ class DbtIntegrationTest(object):
             "-v",
             f"{cwd}/build:/build",
             "-v",
-            f"{cwd}/final:/build/run/airbyte_utils/models/generated",
+            f"{cwd}/{output_dir}:/build/run/airbyte_utils/models/generated",
             "-v",
             "/tmp:/tmp",
             "--network",
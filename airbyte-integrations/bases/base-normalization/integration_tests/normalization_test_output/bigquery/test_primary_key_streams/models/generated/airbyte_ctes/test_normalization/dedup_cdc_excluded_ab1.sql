@@ -1,4 +1,4 @@
-{{ config(schema="_airbyte_test_normalization", tags=["top-level-intermediate"]) }}
+{{ config(schema="_airbyte_test_normalization", tags=["top-level-intermediate", "airbyte_stream_dedup_cdc_excluded"]) }}
 -- SQL model to parse JSON blob stored in a single column and extract into separated field columns as described by the JSON Schema
 select
     {{ json_extract_scalar('_airbyte_data', ['id'], ['id']) }} as id,
@@ -8,5 +8,6 @@ select
     {{ json_extract_scalar('_airbyte_data', ['_ab_cdc_deleted_at'], ['_ab_cdc_deleted_at']) }} as _ab_cdc_deleted_at,
     _airbyte_emitted_at
 from {{ source('test_normalization', '_airbyte_raw_dedup_cdc_excluded') }} as table_alias
+where {{ incremental_filter('dedup_cdc_excluded_ab4') }}
 -- dedup_cdc_excluded
 
@@ -1,4 +1,4 @@
-{{ config(schema="_airbyte_test_normalization", tags=["nested-intermediate"]) }}
+{{ config(schema="_airbyte_test_normalization", tags=["nested-intermediate", "airbyte_stream_nested_stream_with_complex_columns_resulting_into_long_names"]) }}
 -- SQL model to parse JSON blob stored in a single column and extract into separated field columns as described by the JSON Schema
 {{ unnest_cte('nested_stream_with_complex_columns_resulting_into_long_names_partition', 'partition', 'DATA') }}
 select
@@ -1,4 +1,4 @@
-{{ config(schema="_airbyte_test_normalization", tags=["top-level-intermediate"]) }}
+{{ config(schema="_airbyte_test_normalization", tags=["top-level-intermediate", "airbyte_stream_non_nested_stream_without_namespace_resulting_into_long_names"]) }}
 -- SQL model to build a hash column based on the values of this record
 select
     *,
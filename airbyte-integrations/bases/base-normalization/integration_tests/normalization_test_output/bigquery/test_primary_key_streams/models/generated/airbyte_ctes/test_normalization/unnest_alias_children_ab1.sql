@@ -1,4 +1,4 @@
-{{ config(schema="_airbyte_test_normalization", tags=["nested-intermediate"]) }}
+{{ config(schema="_airbyte_test_normalization", tags=["nested-intermediate", "airbyte_stream_unnest_alias"]) }}
 -- SQL model to parse JSON blob stored in a single column and extract into separated field columns as described by the JSON Schema
 {{ unnest_cte('unnest_alias', 'unnest_alias', 'children') }}
 select
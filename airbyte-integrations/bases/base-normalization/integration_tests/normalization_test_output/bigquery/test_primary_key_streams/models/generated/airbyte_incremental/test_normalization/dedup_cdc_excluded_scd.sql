@@ -0,0 +1,67 @@
+{{ config(unique_key='_airbyte_dedup_cdc_excluded_hashid', schema="test_normalization", tags=["top-level", "airbyte_stream_dedup_cdc_excluded"]) }}
+-- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+-- On incremental runs, only the history of the primary keys touched by new records is ordered again and merged into the table
+with
+{% if is_incremental() %}
+new_data as (
+    select *
+    from {{ ref('dedup_cdc_excluded_ab4') }}
+    where {{ incremental_filter('dedup_cdc_excluded_scd') }}
+),
+new_data_ids as (
+    select distinct {{ dbt_utils.surrogate_key(['id']) }} as _airbyte_unique_key
+    from new_data
+),
+previous_scd_data as (
+    select this_data.*
+    from {{ this }} as this_data
+    join new_data_ids on this_data._airbyte_unique_key = new_data_ids._airbyte_unique_key
+),
+input_data as (
+    select
+        id,
+        name,
+        _ab_cdc_lsn,
+        _ab_cdc_updated_at,
+        _ab_cdc_deleted_at,
+        _airbyte_emitted_at,
+        _airbyte_dedup_cdc_excluded_hashid
+    from new_data
+    union all
+    select
+        id,
+        name,
+        _ab_cdc_lsn,
+        _ab_cdc_updated_at,
+        _ab_cdc_deleted_at,
+        _airbyte_emitted_at,
+        _airbyte_dedup_cdc_excluded_hashid
+    from previous_scd_data
+)
+{% else %}
+input_data as (
+    select *
+    from {{ ref('dedup_cdc_excluded_ab4') }}
+)
+{% endif %}
+select
+    {{ dbt_utils.surrogate_key(['id']) }} as _airbyte_unique_key,
+    id,
+    name,
+    _ab_cdc_lsn,
+    _ab_cdc_updated_at,
+    _ab_cdc_deleted_at,
+    _airbyte_emitted_at as _airbyte_start_at,
+    lag(_airbyte_emitted_at) over (
+        partition by id
+        order by _airbyte_emitted_at is null asc, _airbyte_emitted_at desc, _airbyte_emitted_at desc
+    ) as _airbyte_end_at,
+    lag(_airbyte_emitted_at) over (
+        partition by id
+        order by _airbyte_emitted_at is null asc, _airbyte_emitted_at desc, _airbyte_emitted_at desc, _ab_cdc_updated_at desc
+    ) is null and _ab_cdc_deleted_at is null as _airbyte_active_row,
+    _airbyte_emitted_at,
+    _airbyte_dedup_cdc_excluded_hashid
+from input_data
+-- dedup_cdc_excluded from {{ source('test_normalization', '_airbyte_raw_dedup_cdc_excluded') }}
+
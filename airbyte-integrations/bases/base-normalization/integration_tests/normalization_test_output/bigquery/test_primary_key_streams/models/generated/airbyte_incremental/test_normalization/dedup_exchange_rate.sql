@@ -1,6 +1,7 @@
-{{ config(schema="test_normalization", tags=["top-level"]) }}
+{{ config(unique_key='_airbyte_unique_key', schema="test_normalization", tags=["top-level", "airbyte_stream_dedup_exchange_rate"]) }}
 -- Final base SQL model
 select
+    _airbyte_unique_key,
     id,
     currency,
     date,
@@ -14,4 +15,11 @@ select
 from {{ ref('dedup_exchange_rate_scd') }}
 -- dedup_exchange_rate from {{ source('test_normalization', '_airbyte_raw_dedup_exchange_rate') }}
 where _airbyte_active_row = True
+{% if is_incremental() %}
+and _airbyte_unique_key in (
+    select _airbyte_unique_key
+    from {{ ref('dedup_exchange_rate_scd') }}
+    where {{ incremental_filter('dedup_exchange_rate') }}
+)
+{% endif %}
 
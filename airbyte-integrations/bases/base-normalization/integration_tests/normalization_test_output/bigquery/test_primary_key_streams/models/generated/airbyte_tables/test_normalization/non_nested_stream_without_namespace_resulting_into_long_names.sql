@@ -1,4 +1,4 @@
-{{ config(schema="test_normalization", tags=["top-level"]) }}
+{{ config(schema="test_normalization", tags=["top-level", "airbyte_stream_non_nested_stream_without_namespace_resulting_into_long_names"]) }}
 -- Final base SQL model
 select
     id,
@@ -1,4 +1,4 @@
-{{ config(schema="_airbyte_test_normalization", tags=["top-level-intermediate"]) }}
+{{ config(schema="_airbyte_test_normalization", tags=["top-level-intermediate", "airbyte_stream_nested_stream_with_co__lting_into_long_names"]) }}
 -- SQL model to parse JSON blob stored in a single column and extract into separated field columns as described by the JSON Schema
 select
     {{ json_extract_scalar('_airbyte_data', ['id'], ['id']) }} as id,
@@ -6,5 +6,6 @@ select
     {{ json_extract('table_alias', '_airbyte_data', ['partition'], ['partition']) }} as {{ adapter.quote('partition') }},
     _airbyte_emitted_at
 from {{ source('test_normalization', '_airbyte_raw_nested_s__lting_into_long_names') }} as table_alias
+where {{ incremental_filter('nested_stream_with_co_1g_into_long_names_ab4') }}
 -- nested_stream_with_co__lting_into_long_names
 
@@ -1,4 +1,4 @@
-{{ config(schema="_airbyte_test_normalization", tags=["nested-intermediate"]) }}
+{{ config(schema="_airbyte_test_normalization", tags=["nested-intermediate", "airbyte_stream_nested_stream_with_co__lting_into_long_names"]) }}
 -- SQL model to cast each column to its adequate SQL type converted from the JSON schema type
 select
     _airbyte_nested_strea__nto_long_names_hashid,
@@ -1,4 +1,4 @@
-{{ config(schema="_airbyte_test_normalization_namespace", tags=["top-level-intermediate"]) }}
+{{ config(schema="_airbyte_test_normalization_namespace", tags=["top-level-intermediate", "airbyte_stream_simple_stream_with_na__lting_into_long_names"]) }}
 -- SQL model to cast each column to its adequate SQL type converted from the JSON schema type
 select
     cast(id as {{ dbt_utils.type_string() }}) as id,
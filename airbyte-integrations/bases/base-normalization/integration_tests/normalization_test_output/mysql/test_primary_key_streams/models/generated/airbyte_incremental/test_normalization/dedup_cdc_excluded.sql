@@ -0,0 +1,22 @@
+{{ config(unique_key='_airbyte_unique_key', schema="test_normalization", tags=["top-level", "airbyte_stream_dedup_cdc_excluded"], post_hook="delete from {{ this }} where _airbyte_unique_key in (select _airbyte_unique_key from {{ ref('dedup_cdc_excluded_scd') }} where _airbyte_end_at is null and _ab_cdc_deleted_at is not null)") }}
+-- Final base SQL model
+select
+    _airbyte_unique_key,
+    id,
+    {{ adapter.quote('name') }},
+    _ab_cdc_lsn,
+    _ab_cdc_updated_at,
+    _ab_cdc_deleted_at,
+    _airbyte_emitted_at,
+    _airbyte_dedup_cdc_excluded_hashid
+from {{ ref('dedup_cdc_excluded_scd') }}
+-- dedup_cdc_excluded from {{ source('test_normalization', '_airbyte_raw_dedup_cdc_excluded') }}
+where _airbyte_active_row = True
+{% if is_incremental() %}
+and _airbyte_unique_key in (
+    select _airbyte_unique_key
+    from {{ ref('dedup_cdc_excluded_scd') }}
+    where {{ incremental_filter('dedup_cdc_excluded') }}
+)
+{% endif %}
+
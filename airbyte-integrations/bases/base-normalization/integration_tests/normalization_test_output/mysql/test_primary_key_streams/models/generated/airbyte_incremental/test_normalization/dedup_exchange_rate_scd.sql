@@ -0,0 +1,76 @@
+{{ config(unique_key='_airbyte_dedup_exchange_rate_hashid', schema="test_normalization", tags=["top-level", "airbyte_stream_dedup_exchange_rate"]) }}
+-- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+-- On incremental runs, only the history of the primary keys touched by new records is ordered again and merged into the table
+with
+{% if is_incremental() %}
+new_data as (
+    select *
+    from {{ ref('dedup_exchange_rate_ab4') }}
+    where {{ incremental_filter('dedup_exchange_rate_scd') }}
+),
+new_data_ids as (
+    select distinct {{ dbt_utils.surrogate_key(['id', 'currency', 'nzd']) }} as _airbyte_unique_key
+    from new_data
+),
+previous_scd_data as (
+    select this_data.*
+    from {{ this }} as this_data
+    join new_data_ids on this_data._airbyte_unique_key = new_data_ids._airbyte_unique_key
+),
+input_data as (
+    select
+        id,
+        currency,
+        {{ adapter.quote('date') }},
+        timestamp_col,
+        {{ adapter.quote('HKD@spéçiäl & characters') }},
+        hkd_special___characters,
+        nzd,
+        usd,
+        _airbyte_emitted_at,
+        _airbyte_dedup_exchange_rate_hashid
+    from new_data
+    union all
+    select
+        id,
+        currency,
+        {{ adapter.quote('date') }},
+        timestamp_col,
+        {{ adapter.quote('HKD@spéçiäl & characters') }},
+        hkd_special___characters,
+        nzd,
+        usd,
+        _airbyte_emitted_at,
+        _airbyte_dedup_exchange_rate_hashid
+    from previous_scd_data
+)
+{% else %}
+input_data as (
+    select *
+    from {{ ref('dedup_exchange_rate_ab4') }}
+)
+{% endif %}
+select
+    {{ dbt_utils.surrogate_key(['id', 'currency', 'nzd']) }} as _airbyte_unique_key,
+    id,
+    currency,
+    {{ adapter.quote('date') }},
+    timestamp_col,
+    {{ adapter.quote('HKD@spéçiäl & characters') }},
+    hkd_special___characters,
+    nzd,
+    usd,
+    {{ adapter.quote('date') }} as _airbyte_start_at,
+    lag({{ adapter.quote('date') }}) over (
+        partition by id, currency, cast(nzd as {{ dbt_utils.type_string() }})
+        order by {{ adapter.quote('date') }} is null asc, {{ adapter.quote('date') }} desc, _airbyte_emitted_at desc
+    ) as _airbyte_end_at,
+    lag({{ adapter.quote('date') }}) over (
+        partition by id, currency, cast(nzd as {{ dbt_utils.type_string() }})
+        order by {{ adapter.quote('date') }} is null asc, {{ adapter.quote('date') }} desc, _airbyte_emitted_at desc
+    ) is null as _airbyte_active_row,
+    _airbyte_emitted_at,
+    _airbyte_dedup_exchange_rate_hashid
+from input_data
+-- dedup_exchange_rate from {{ source('test_normalization', '_airbyte_raw_dedup_exchange_rate') }}
+
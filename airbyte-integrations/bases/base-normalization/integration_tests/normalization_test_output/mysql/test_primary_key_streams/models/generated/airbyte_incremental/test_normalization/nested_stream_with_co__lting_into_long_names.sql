@@ -0,0 +1,20 @@
+{{ config(unique_key='_airbyte_unique_key', schema="test_normalization", tags=["top-level", "airbyte_stream_nested_stream_with_co__lting_into_long_names"]) }}
+-- Final base SQL model
+select
+    _airbyte_unique_key,
+    id,
+    {{ adapter.quote('date') }},
+    {{ adapter.quote('partition') }},
+    _airbyte_emitted_at,
+    _airbyte_nested_strea__nto_long_names_hashid
+from {{ ref('nested_stream_with_co_1g_into_long_names_scd') }}
+-- nested_stream_with_co__lting_into_long_names from {{ source('test_normalization', '_airbyte_raw_nested_s__lting_into_long_names') }}
+where _airbyte_active_row = True
+{% if is_incremental() %}
+and _airbyte_unique_key in (
+    select _airbyte_unique_key
+    from {{ ref('nested_stream_with_co_1g_into_long_names_scd') }}
+    where {{ incremental_filter('nested_stream_with_co__lting_into_long_names') }}
+)
+{% endif %}
+
@@ -1,4 +1,4 @@
-{{ config(schema="test_normalization_namespace", tags=["top-level"]) }}
+{{ config(schema="test_normalization_namespace", tags=["top-level", "airbyte_stream_simple_stream_with_na__lting_into_long_names"]) }}
 -- Final base SQL model
 select
     id,
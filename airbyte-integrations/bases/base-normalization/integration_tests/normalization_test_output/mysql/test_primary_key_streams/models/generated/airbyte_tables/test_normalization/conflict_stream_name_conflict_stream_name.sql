@@ -1,4 +1,4 @@
-{{ config(schema="test_normalization", tags=["nested"]) }}
+{{ config(schema="test_normalization", tags=["nested", "airbyte_stream_conflict_stream_name"]) }}
 -- Final base SQL model
 select
     _airbyte_conflict_stream_name_hashid,
@@ -1,4 +1,4 @@
-{{ config(schema="test_normalization", tags=["nested"]) }}
+{{ config(schema="test_normalization", tags=["nested", "airbyte_stream_unnest_alias"]) }}
 -- Final base SQL model
 select
     _airbyte_unnest_alias_hashid,
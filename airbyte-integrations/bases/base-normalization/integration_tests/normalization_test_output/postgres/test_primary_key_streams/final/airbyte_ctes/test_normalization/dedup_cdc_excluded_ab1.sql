@@ -10,5 +10,6 @@ select
     jsonb_extract_path_text(_airbyte_data, '_ab_cdc_deleted_at') as _ab_cdc_deleted_at,
     _airbyte_emitted_at
 from "postgres".test_normalization._airbyte_raw_dedup_cdc_excluded as table_alias
+where 1 = 1
 -- dedup_cdc_excluded
   );
@@ -13,5 +13,6 @@ select
     jsonb_extract_path_text(_airbyte_data, 'USD') as usd,
     _airbyte_emitted_at
 from "postgres".test_normalization._airbyte_raw_dedup_exchange_rate as table_alias
+where 1 = 1
 -- dedup_exchange_rate
   );
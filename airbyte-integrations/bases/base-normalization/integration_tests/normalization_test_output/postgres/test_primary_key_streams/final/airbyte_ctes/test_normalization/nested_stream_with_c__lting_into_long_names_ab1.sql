@@ -10,5 +10,6 @@ select
      as "partition",
     _airbyte_emitted_at
 from "postgres".test_normalization._airbyte_raw_nested_stream_with_complex_columns_resulting_into_long_names as table_alias
+where 1 = 1
 -- nested_stream_with_c__lting_into_long_names
   );
@@ -1,10 +1,12 @@
 
+      
 
-  create  table "postgres".test_normalization."dedup_cdc_excluded__dbt_tmp"
+  create  table "postgres".test_normalization."dedup_cdc_excluded"
   as (
     
 -- Final base SQL model
 select
+    _airbyte_unique_key,
     "id",
     "name",
     _ab_cdc_lsn,
@@ -15,4 +17,6 @@ select
 from "postgres".test_normalization."dedup_cdc_excluded_scd"
 -- dedup_cdc_excluded from "postgres".test_normalization._airbyte_raw_dedup_cdc_excluded
 where _airbyte_active_row = True
-  );
\ No newline at end of file
+
+  );
+  
\ No newline at end of file
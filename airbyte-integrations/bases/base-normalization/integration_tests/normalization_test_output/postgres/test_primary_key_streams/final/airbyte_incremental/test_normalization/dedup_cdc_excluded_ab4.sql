@@ -1,7 +1,11 @@
 
-  create view "postgres"._airbyte_test_normalization."dedup_cdc_excluded_ab4__dbt_tmp" as (
+      
+
+  create  table "postgres"._airbyte_test_normalization."dedup_cdc_excluded_ab4"
+  as (
     
--- SQL model to prepare for deduplicating records based on the hash record column
+-- SQL model to deduplicate records based on the hash record column, new records are appended to this table on each run
+select * from (
 select
   *,
   row_number() over (
@@ -9,5 +13,9 @@ select
     order by _airbyte_emitted_at asc
   ) as _airbyte_row_num
 from "postgres"._airbyte_test_normalization."dedup_cdc_excluded_ab3"
+
+) as new_records
+where _airbyte_row_num = 1
 -- dedup_cdc_excluded from "postgres".test_normalization._airbyte_raw_dedup_cdc_excluded
   );
+  
\ No newline at end of file
@@ -1,10 +1,12 @@
 
+      
 
-  create  table "postgres".test_normalization."dedup_exchange_rate__dbt_tmp"
+  create  table "postgres".test_normalization."dedup_exchange_rate"
   as (
     
 -- Final base SQL model
 select
+    _airbyte_unique_key,
     "id",
     currency,
     "date",
@@ -18,4 +20,6 @@ select
 from "postgres".test_normalization."dedup_exchange_rate_scd"
 -- dedup_exchange_rate from "postgres".test_normalization._airbyte_raw_dedup_exchange_rate
 where _airbyte_active_row = True
-  );
\ No newline at end of file
+
+  );
+  
\ No newline at end of file
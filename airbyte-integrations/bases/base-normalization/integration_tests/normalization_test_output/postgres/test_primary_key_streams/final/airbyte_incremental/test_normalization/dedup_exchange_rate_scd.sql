@@ -1,10 +1,32 @@
 
+      
 
-  create  table "postgres".test_normalization."dedup_exchange_rate_scd__dbt_tmp"
+  create  table "postgres".test_normalization."dedup_exchange_rate_scd"
   as (
     
 -- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+-- On incremental runs, only the history of the primary keys touched by new records is ordered again and merged into the table
+with
+
+input_data as (
+    select *
+    from "postgres"._airbyte_test_normalization."dedup_exchange_rate_ab4"
+)
+
 select
+    md5(cast(
+    
+    coalesce(cast("id" as 
+    varchar
+), '') || '-' || coalesce(cast(currency as 
+    varchar
+), '') || '-' || coalesce(cast(nzd as 
+    varchar
+), '')
+
+ as 
+    varchar
+)) as _airbyte_unique_key,
     "id",
     currency,
     "date",
@@ -28,7 +50,7 @@ select
     ) is null as _airbyte_active_row,
     _airbyte_emitted_at,
     _airbyte_dedup_exchange_rate_hashid
-from "postgres"._airbyte_test_normalization."dedup_exchange_rate_ab4"
+from input_data
 -- dedup_exchange_rate from "postgres".test_normalization._airbyte_raw_dedup_exchange_rate
-where _airbyte_row_num = 1
-  );
\ No newline at end of file
+  );
+  
\ No newline at end of file
@@ -1,10 +1,12 @@
 
+      
 
-  create  table "postgres".test_normalization."nested_stream_with_c__lting_into_long_names__dbt_tmp"
+  create  table "postgres".test_normalization."nested_stream_with_c__lting_into_long_names"
   as (
     
 -- Final base SQL model
 select
+    _airbyte_unique_key,
     "id",
     "date",
     "partition",
@@ -13,4 +15,6 @@ select
 from "postgres".test_normalization."nested_stream_with_c__lting_into_long_names_scd"
 -- nested_stream_with_c__lting_into_long_names from "postgres".test_normalization._airbyte_raw_nested_stream_with_complex_columns_resulting_into_long_names
 where _airbyte_active_row = True
-  );
\ No newline at end of file
+
+  );
+  
\ No newline at end of file
@@ -1,7 +1,11 @@
 
-  create view "postgres"._airbyte_test_normalization."nested_stream_with_c__lting_into_long_names_ab4__dbt_tmp" as (
+      
+
+  create  table "postgres"._airbyte_test_normalization."nested_stream_with_c__lting_into_long_names_ab4"
+  as (
     
--- SQL model to prepare for deduplicating records based on the hash record column
+-- SQL model to deduplicate records based on the hash record column, new records are appended to this table on each run
+select * from (
 select
   *,
   row_number() over (
@@ -9,5 +13,9 @@ select
     order by _airbyte_emitted_at asc
   ) as _airbyte_row_num
 from "postgres"._airbyte_test_normalization."nested_stream_with_c__lting_into_long_names_ab3"
+
+) as new_records
+where _airbyte_row_num = 1
 -- nested_stream_with_c__lting_into_long_names from "postgres".test_normalization._airbyte_raw_nested_stream_with_complex_columns_resulting_into_long_names
   );
+  
\ No newline at end of file
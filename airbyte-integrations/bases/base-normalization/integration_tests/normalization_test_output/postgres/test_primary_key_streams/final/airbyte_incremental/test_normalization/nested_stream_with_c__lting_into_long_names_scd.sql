@@ -1,10 +1,28 @@
 
+      
 
-  create  table "postgres".test_normalization."nested_stream_with_c__lting_into_long_names_scd__dbt_tmp"
+  create  table "postgres".test_normalization."nested_stream_with_c__lting_into_long_names_scd"
   as (
     
 -- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+-- On incremental runs, only the history of the primary keys touched by new records is ordered again and merged into the table
+with
+
+input_data as (
+    select *
+    from "postgres"._airbyte_test_normalization."nested_stream_with_c__lting_into_long_names_ab4"
+)
+
 select
+    md5(cast(
+    
+    coalesce(cast("id" as 
+    varchar
+), '')
+
+ as 
+    varchar
+)) as _airbyte_unique_key,
     "id",
     "date",
     "partition",
@@ -19,7 +37,7 @@ select
     ) is null as _airbyte_active_row,
     _airbyte_emitted_at,
     _airbyte_nested_stre__nto_long_names_hashid
-from "postgres"._airbyte_test_normalization."nested_stream_with_c__lting_into_long_names_ab4"
+from input_data
 -- nested_stream_with_c__lting_into_long_names from "postgres".test_normalization._airbyte_raw_nested_stream_with_complex_columns_resulting_into_long_names
-where _airbyte_row_num = 1
-  );
\ No newline at end of file
+  );
+  
\ No newline at end of file
@@ -0,0 +1,14 @@
+
+      delete
+    from "postgres"._airbyte_test_normalization."dedup_cdc_excluded_ab4"
+    where (_airbyte_dedup_cdc_excluded_hashid) in (
+        select (_airbyte_dedup_cdc_excluded_hashid)
+        from "dedup_cdc_excluded_ab4__dbt_tmp210502003827"
+    );
+
+    insert into "postgres"._airbyte_test_normalization."dedup_cdc_excluded_ab4" ("id", "name", "_ab_cdc_lsn", "_ab_cdc_updated_at", "_ab_cdc_deleted_at", "_airbyte_emitted_at", "_airbyte_dedup_cdc_excluded_hashid", "_airbyte_row_num")
+    (
+       select "id", "name", "_ab_cdc_lsn", "_ab_cdc_updated_at", "_ab_cdc_deleted_at", "_airbyte_emitted_at", "_airbyte_dedup_cdc_excluded_hashid", "_airbyte_row_num"
+       from "dedup_cdc_excluded_ab4__dbt_tmp210502003827"
+    );
+  
\ No newline at end of file
@@ -0,0 +1,14 @@
+
+      delete
+    from "postgres".test_normalization."dedup_cdc_excluded_scd"
+    where (_airbyte_dedup_cdc_excluded_hashid) in (
+        select (_airbyte_dedup_cdc_excluded_hashid)
+        from "dedup_cdc_excluded_scd__dbt_tmp210502575987"
+    );
+
+    insert into "postgres".test_normalization."dedup_cdc_excluded_scd" ("_airbyte_unique_key", "id", "name", "_ab_cdc_lsn", "_ab_cdc_updated_at", "_ab_cdc_deleted_at", "_airbyte_start_at", "_airbyte_end_at", "_airbyte_active_row", "_airbyte_emitted_at", "_airbyte_dedup_cdc_excluded_hashid")
+    (
+       select "_airbyte_unique_key", "id", "name", "_ab_cdc_lsn", "_ab_cdc_updated_at", "_ab_cdc_deleted_at", "_airbyte_start_at", "_airbyte_end_at", "_airbyte_active_row", "_airbyte_emitted_at", "_airbyte_dedup_cdc_excluded_hashid"
+       from "dedup_cdc_excluded_scd__dbt_tmp210502575987"
+    );
+  
\ No newline at end of file
@@ -0,0 +1,14 @@
+
+      delete
+    from "postgres".test_normalization."dedup_exchange_rate"
+    where (_airbyte_unique_key) in (
+        select (_airbyte_unique_key)
+        from "dedup_exchange_rate__dbt_tmp210502977212"
+    );
+
+    insert into "postgres".test_normalization."dedup_exchange_rate" ("_airbyte_unique_key", "id", "currency", "date", "timestamp_col", "HKD@spéçiäl & characters", "hkd_special___characters", "nzd", "usd", "_airbyte_emitted_at", "_airbyte_dedup_exchange_rate_hashid")
+    (
+       select "_airbyte_unique_key", "id", "currency", "date", "timestamp_col", "HKD@spéçiäl & characters", "hkd_special___characters", "nzd", "usd", "_airbyte_emitted_at", "_airbyte_dedup_exchange_rate_hashid"
+       from "dedup_exchange_rate__dbt_tmp210502977212"
+    );
+  
\ No newline at end of file
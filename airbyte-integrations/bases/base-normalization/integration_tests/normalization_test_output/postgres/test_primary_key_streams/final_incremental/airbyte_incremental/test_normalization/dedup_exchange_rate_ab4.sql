@@ -0,0 +1,14 @@
+
+      delete
+    from "postgres"._airbyte_test_normalization."dedup_exchange_rate_ab4"
+    where (_airbyte_dedup_exchange_rate_hashid) in (
+        select (_airbyte_dedup_exchange_rate_hashid)
+        from "dedup_exchange_rate_ab4__dbt_tmp210501769385"
+    );
+
+    insert into "postgres"._airbyte_test_normalization."dedup_exchange_rate_ab4" ("id", "currency", "date", "timestamp_col", "HKD@spéçiäl & characters", "hkd_special___characters", "nzd", "usd", "_airbyte_emitted_at", "_airbyte_dedup_exchange_rate_hashid", "_airbyte_row_num")
+    (
+       select "id", "currency", "date", "timestamp_col", "HKD@spéçiäl & characters", "hkd_special___characters", "nzd", "usd", "_airbyte_emitted_at", "_airbyte_dedup_exchange_rate_hashid", "_airbyte_row_num"
+       from "dedup_exchange_rate_ab4__dbt_tmp210501769385"
+    );
+  
\ No newline at end of file
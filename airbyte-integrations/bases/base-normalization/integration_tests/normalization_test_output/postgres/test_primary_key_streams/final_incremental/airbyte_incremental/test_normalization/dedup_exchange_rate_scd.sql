@@ -0,0 +1,14 @@
+
+      delete
+    from "postgres".test_normalization."dedup_exchange_rate_scd"
+    where (_airbyte_dedup_exchange_rate_hashid) in (
+        select (_airbyte_dedup_exchange_rate_hashid)
+        from "dedup_exchange_rate_scd__dbt_tmp210502505303"
+    );
+
+    insert into "postgres".test_normalization."dedup_exchange_rate_scd" ("_airbyte_unique_key", "id", "currency", "date", "timestamp_col", "HKD@spéçiäl & characters", "hkd_special___characters", "nzd", "usd", "_airbyte_start_at", "_airbyte_end_at", "_airbyte_active_row", "_airbyte_emitted_at", "_airbyte_dedup_exchange_rate_hashid")
+    (
+       select "_airbyte_unique_key", "id", "currency", "date", "timestamp_col", "HKD@spéçiäl & characters", "hkd_special___characters", "nzd", "usd", "_airbyte_start_at", "_airbyte_end_at", "_airbyte_active_row", "_airbyte_emitted_at", "_airbyte_dedup_exchange_rate_hashid"
+       from "dedup_exchange_rate_scd__dbt_tmp210502505303"
+    );
+  
\ No newline at end of file
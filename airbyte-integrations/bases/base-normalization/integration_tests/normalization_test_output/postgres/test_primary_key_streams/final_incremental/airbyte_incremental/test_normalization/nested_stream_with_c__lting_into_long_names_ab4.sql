@@ -0,0 +1,14 @@
+
+      delete
+    from "postgres"._airbyte_test_normalization."nested_stream_with_c__lting_into_long_names_ab4"
+    where (_airbyte_nested_stre__nto_long_names_hashid) in (
+        select (_airbyte_nested_stre__nto_long_names_hashid)
+        from "nested_stream_with_c__lting_into_long_name__dbt_tmp210501780945"
+    );
+
+    insert into "postgres"._airbyte_test_normalization."nested_stream_with_c__lting_into_long_names_ab4" ("id", "date", "partition", "_airbyte_emitted_at", "_airbyte_nested_stre__nto_long_names_hashid", "_airbyte_row_num")
+    (
+       select "id", "date", "partition", "_airbyte_emitted_at", "_airbyte_nested_stre__nto_long_names_hashid", "_airbyte_row_num"
+       from "nested_stream_with_c__lting_into_long_name__dbt_tmp210501780945"
+    );
+  
\ No newline at end of file
@@ -1,4 +1,4 @@
-{{ config(schema="_airbyte_test_normalization", tags=["nested-intermediate"]) }}
+{{ config(schema="_airbyte_test_normalization", tags=["nested-intermediate", "airbyte_stream_conflict_stream_name"]) }}
 -- SQL model to cast each column to its adequate SQL type converted from the JSON schema type
 select
     _airbyte_conflict_stream_name_2_hashid,
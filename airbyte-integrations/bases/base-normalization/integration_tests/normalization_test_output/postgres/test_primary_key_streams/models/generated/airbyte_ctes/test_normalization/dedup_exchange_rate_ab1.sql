@@ -1,4 +1,4 @@
-{{ config(schema="_airbyte_test_normalization", tags=["top-level-intermediate"]) }}
+{{ config(schema="_airbyte_test_normalization", tags=["top-level-intermediate", "airbyte_stream_dedup_exchange_rate"]) }}
 -- SQL model to parse JSON blob stored in a single column and extract into separated field columns as described by the JSON Schema
 select
     {{ json_extract_scalar('_airbyte_data', ['id'], ['id']) }} as {{ adapter.quote('id') }},
@@ -11,5 +11,6 @@ select
     {{ json_extract_scalar('_airbyte_data', ['USD'], ['USD']) }} as usd,
     _airbyte_emitted_at
 from {{ source('test_normalization', '_airbyte_raw_dedup_exchange_rate') }} as table_alias
+where {{ incremental_filter('dedup_exchange_rate_ab4') }}
 -- dedup_exchange_rate
 
@@ -1,6 +1,7 @@
-{{ config(schema="test_normalization", tags=["top-level"]) }}
+{{ config(unique_key='_airbyte_unique_key', schema="test_normalization", tags=["top-level", "airbyte_stream_nested_stream_with_c__lting_into_long_names"]) }}
 -- Final base SQL model
 select
+    _airbyte_unique_key,
     {{ adapter.quote('id') }},
     {{ adapter.quote('date') }},
     {{ adapter.quote('partition') }},
@@ -9,4 +10,11 @@ select
 from {{ ref('nested_stream_with_c__lting_into_long_names_scd') }}
 -- nested_stream_with_c__lting_into_long_names from {{ source('test_normalization', '_airbyte_raw_nested_stream_with_complex_columns_resulting_into_long_names') }}
 where _airbyte_active_row = True
+{% if is_incremental() %}
+and _airbyte_unique_key in (
+    select _airbyte_unique_key
+    from {{ ref('nested_stream_with_c__lting_into_long_names_scd') }}
+    where {{ incremental_filter('nested_stream_with_c__lting_into_long_names') }}
+)
+{% endif %}
 
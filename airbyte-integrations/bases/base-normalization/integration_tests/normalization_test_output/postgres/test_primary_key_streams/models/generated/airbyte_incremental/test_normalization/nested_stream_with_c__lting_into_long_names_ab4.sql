@@ -0,0 +1,18 @@
+{{ config(unique_key='_airbyte_nested_stre__nto_long_names_hashid', schema="_airbyte_test_normalization", tags=["top-level-intermediate", "airbyte_stream_nested_stream_with_c__lting_into_long_names"]) }}
+-- SQL model to deduplicate records based on the hash record column, new records are appended to this table on each run
+select * from (
+select
+  *,
+  row_number() over (
+    partition by _airbyte_nested_stre__nto_long_names_hashid
+    order by _airbyte_emitted_at asc
+  ) as _airbyte_row_num
+from {{ ref('nested_stream_with_c__lting_into_long_names_ab3') }}
+{% if is_incremental() %}
+-- records already normalized by a previous run are kept with their first emission time
+where _airbyte_nested_stre__nto_long_names_hashid not in (select _airbyte_nested_stre__nto_long_names_hashid from {{ this }})
+{% endif %}
+) as new_records
+where _airbyte_row_num = 1
+-- nested_stream_with_c__lting_into_long_names from {{ source('test_normalization', '_airbyte_raw_nested_stream_with_complex_columns_resulting_into_long_names') }}
+
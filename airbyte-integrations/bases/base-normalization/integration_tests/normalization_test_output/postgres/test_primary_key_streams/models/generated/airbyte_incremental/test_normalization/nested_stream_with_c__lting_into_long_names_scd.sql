@@ -0,0 +1,61 @@
+{{ config(unique_key='_airbyte_nested_stre__nto_long_names_hashid', schema="test_normalization", tags=["top-level", "airbyte_stream_nested_stream_with_c__lting_into_long_names"]) }}
+-- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+-- On incremental runs, only the history of the primary keys touched by new records is ordered again and merged into the table
+with
+{% if is_incremental() %}
+new_data as (
+    select *
+    from {{ ref('nested_stream_with_c__lting_into_long_names_ab4') }}
+    where {{ incremental_filter('nested_stream_with_c__lting_into_long_names_scd') }}
+),
+new_data_ids as (
+    select distinct {{ dbt_utils.surrogate_key([adapter.quote('id')]) }} as _airbyte_unique_key
+    from new_data
+),
+previous_scd_data as (
+    select this_data.*
+    from {{ this }} as this_data
+    join new_data_ids on this_data._airbyte_unique_key = new_data_ids._airbyte_unique_key
+),
+input_data as (
+    select
+        {{ adapter.quote('id') }},
+        {{ adapter.quote('date') }},
+        {{ adapter.quote('partition') }},
+        _airbyte_emitted_at,
+        _airbyte_nested_stre__nto_long_names_hashid
+    from new_data
+    union all
+    select
+        {{ adapter.quote('id') }},
+        {{ adapter.quote('date') }},
+        {{ adapter.quote('partition') }},
+        _airbyte_emitted_at,
+        _airbyte_nested_stre__nto_long_names_hashid
+    from previous_scd_data
+)
+{% else %}
+input_data as (
+    select *
+    from {{ ref('nested_stream_with_c__lting_into_long_names_ab4') }}
+)
+{% endif %}
+select
+    {{ dbt_utils.surrogate_key([adapter.quote('id')]) }} as _airbyte_unique_key,
+    {{ adapter.quote('id') }},
+    {{ adapter.quote('date') }},
+    {{ adapter.quote('partition') }},
+    {{ adapter.quote('date') }} as _airbyte_start_at,
+    lag({{ adapter.quote('date') }}) over (
+        partition by {{ adapter.quote('id') }}
+        order by {{ adapter.quote('date') }} is null asc, {{ adapter.quote('date') }} desc, _airbyte_emitted_at desc
+    ) as _airbyte_end_at,
+    lag({{ adapter.quote('date') }}) over (
+        partition by {{ adapter.quote('id') }}
+        order by {{ adapter.quote('date') }} is null asc, {{ adapter.quote('date') }} desc, _airbyte_emitted_at desc
+    ) is null as _airbyte_active_row,
+    _airbyte_emitted_at,
+    _airbyte_nested_stre__nto_long_names_hashid
+from input_data
+-- nested_stream_with_c__lting_into_long_names from {{ source('test_normalization', '_airbyte_raw_nested_stream_with_complex_columns_resulting_into_long_names') }}
+
@@ -1,4 +1,4 @@
-{{ config(schema="test_normalization", tags=["nested"]) }}
+{{ config(schema="test_normalization", tags=["nested", "airbyte_stream_nested_stream_with_c__lting_into_long_names"]) }}
 -- Final base SQL model
 select
     _airbyte_nested_stre__nto_long_names_hashid,
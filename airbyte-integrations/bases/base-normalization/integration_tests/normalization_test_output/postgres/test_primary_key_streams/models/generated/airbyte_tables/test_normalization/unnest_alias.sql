@@ -1,4 +1,4 @@
-{{ config(schema="test_normalization", tags=["top-level"]) }}
+{{ config(schema="test_normalization", tags=["top-level", "airbyte_stream_unnest_alias"]) }}
 -- Final base SQL model
 select
     {{ adapter.quote('id') }},
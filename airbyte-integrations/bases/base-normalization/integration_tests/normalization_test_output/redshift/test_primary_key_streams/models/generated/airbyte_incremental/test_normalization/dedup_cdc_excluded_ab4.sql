@@ -0,0 +1,18 @@
+{{ config(unique_key='_airbyte_dedup_cdc_excluded_hashid', schema="_airbyte_test_normalization", tags=["top-level-intermediate", "airbyte_stream_dedup_cdc_excluded"]) }}
+-- SQL model to deduplicate records based on the hash record column, new records are appended to this table on each run
+select * from (
+select
+  *,
+  row_number() over (
+    partition by _airbyte_dedup_cdc_excluded_hashid
+    order by _airbyte_emitted_at asc
+  ) as _airbyte_row_num
+from {{ ref('dedup_cdc_excluded_ab3') }}
+{% if is_incremental() %}
+-- records already normalized by a previous run are kept with their first emission time
+where _airbyte_dedup_cdc_excluded_hashid not in (select _airbyte_dedup_cdc_excluded_hashid from {{ this }})
+{% endif %}
+) as new_records
+where _airbyte_row_num = 1
+-- dedup_cdc_excluded from {{ source('test_normalization', '_airbyte_raw_dedup_cdc_excluded') }}
+
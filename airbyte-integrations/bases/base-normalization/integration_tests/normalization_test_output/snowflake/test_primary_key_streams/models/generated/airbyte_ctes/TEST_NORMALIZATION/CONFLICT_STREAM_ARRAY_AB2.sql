@@ -1,4 +1,4 @@
-{{ config(schema="_AIRBYTE_TEST_NORMALIZATION", tags=["top-level-intermediate"]) }}
+{{ config(schema="_AIRBYTE_TEST_NORMALIZATION", tags=["top-level-intermediate", "airbyte_stream_CONFLICT_STREAM_ARRAY"]) }}
 -- SQL model to cast each column to its adequate SQL type converted from the JSON schema type
 select
     cast(ID as {{ dbt_utils.type_string() }}) as ID,
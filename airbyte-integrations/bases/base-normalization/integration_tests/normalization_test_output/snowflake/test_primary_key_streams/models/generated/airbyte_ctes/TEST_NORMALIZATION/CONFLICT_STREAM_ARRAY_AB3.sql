@@ -1,4 +1,4 @@
-{{ config(schema="_AIRBYTE_TEST_NORMALIZATION", tags=["top-level-intermediate"]) }}
+{{ config(schema="_AIRBYTE_TEST_NORMALIZATION", tags=["top-level-intermediate", "airbyte_stream_CONFLICT_STREAM_ARRAY"]) }}
 -- SQL model to build a hash column based on the values of this record
 select
     *,
@@ -1,4 +1,4 @@
-{{ config(schema="_AIRBYTE_TEST_NORMALIZATION", tags=["top-level-intermediate"]) }}
+{{ config(schema="_AIRBYTE_TEST_NORMALIZATION", tags=["top-level-intermediate", "airbyte_stream_CONFLICT_STREAM_NAME"]) }}
 -- SQL model to parse JSON blob stored in a single column and extract into separated field columns as described by the JSON Schema
 select
     {{ json_extract_scalar('_airbyte_data', ['id'], ['id']) }} as ID,
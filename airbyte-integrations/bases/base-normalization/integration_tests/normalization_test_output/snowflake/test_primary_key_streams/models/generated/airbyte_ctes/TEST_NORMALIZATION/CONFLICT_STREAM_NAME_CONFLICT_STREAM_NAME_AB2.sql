@@ -1,4 +1,4 @@
-{{ config(schema="_AIRBYTE_TEST_NORMALIZATION", tags=["nested-intermediate"]) }}
+{{ config(schema="_AIRBYTE_TEST_NORMALIZATION", tags=["nested-intermediate", "airbyte_stream_CONFLICT_STREAM_NAME"]) }}
 -- SQL model to cast each column to its adequate SQL type converted from the JSON schema type
 select
     _AIRBYTE_CONFLICT_STREAM_NAME_HASHID,
@@ -1,4 +1,4 @@
-{{ config(schema="_AIRBYTE_TEST_NORMALIZATION", tags=["nested-intermediate"]) }}
+{{ config(schema="_AIRBYTE_TEST_NORMALIZATION", tags=["nested-intermediate", "airbyte_stream_CONFLICT_STREAM_NAME"]) }}
 -- SQL model to build a hash column based on the values of this record
 select
     *,
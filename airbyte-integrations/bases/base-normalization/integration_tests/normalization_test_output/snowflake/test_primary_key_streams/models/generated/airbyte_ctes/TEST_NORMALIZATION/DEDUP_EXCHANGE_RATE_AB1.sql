@@ -1,4 +1,4 @@
-{{ config(schema="_AIRBYTE_TEST_NORMALIZATION", tags=["top-level-intermediate"]) }}
+{{ config(schema="_AIRBYTE_TEST_NORMALIZATION", tags=["top-level-intermediate", "airbyte_stream_DEDUP_EXCHANGE_RATE"]) }}
 -- SQL model to parse JSON blob stored in a single column and extract into separated field columns as described by the JSON Schema
 select
     {{ json_extract_scalar('_airbyte_data', ['id'], ['id']) }} as ID,
@@ -11,5 +11,6 @@ select
     {{ json_extract_scalar('_airbyte_data', ['USD'], ['USD']) }} as USD,
     _airbyte_emitted_at
 from {{ source('TEST_NORMALIZATION', '_AIRBYTE_RAW_DEDUP_EXCHANGE_RATE') }} as table_alias
+where {{ incremental_filter('DEDUP_EXCHANGE_RATE_AB4') }}
 -- DEDUP_EXCHANGE_RATE
 
@@ -1,4 +1,4 @@
-{{ config(schema="_AIRBYTE_TEST_NORMALIZATION_NAMESPACE", tags=["top-level-intermediate"]) }}
+{{ config(schema="_AIRBYTE_TEST_NORMALIZATION_NAMESPACE", tags=["top-level-intermediate", "airbyte_stream_SIMPLE_STREAM_WITH_NAMESPACE_RESULTING_INTO_LONG_NAMES"]) }}
 -- SQL model to build a hash column based on the values of this record
 select
     *,
@@ -0,0 +1,22 @@
+{{ config(unique_key='_airbyte_unique_key', schema="TEST_NORMALIZATION", tags=["top-level", "airbyte_stream_DEDUP_CDC_EXCLUDED"], post_hook="delete from {{ this }} where _airbyte_unique_key in (select _airbyte_unique_key from {{ ref('DEDUP_CDC_EXCLUDED_SCD') }} where _airbyte_end_at is null and _ab_cdc_deleted_at is not null)") }}
+-- Final base SQL model
+select
+    _airbyte_unique_key,
+    ID,
+    NAME,
+    _AB_CDC_LSN,
+    _AB_CDC_UPDATED_AT,
+    _AB_CDC_DELETED_AT,
+    _airbyte_emitted_at,
+    _AIRBYTE_DEDUP_CDC_EXCLUDED_HASHID
+from {{ ref('DEDUP_CDC_EXCLUDED_SCD') }}
+-- DEDUP_CDC_EXCLUDED from {{ source('TEST_NORMALIZATION', '_AIRBYTE_RAW_DEDUP_CDC_EXCLUDED') }}
+where _airbyte_active_row = True
+{% if is_incremental() %}
+and _airbyte_unique_key in (
+    select _airbyte_unique_key
+    from {{ ref('DEDUP_CDC_EXCLUDED_SCD') }}
+    where {{ incremental_filter('DEDUP_CDC_EXCLUDED') }}
+)
+{% endif %}
+
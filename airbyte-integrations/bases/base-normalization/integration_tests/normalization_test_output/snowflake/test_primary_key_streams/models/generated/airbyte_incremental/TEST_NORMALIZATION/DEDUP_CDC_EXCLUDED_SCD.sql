@@ -0,0 +1,67 @@
+{{ config(unique_key='_AIRBYTE_DEDUP_CDC_EXCLUDED_HASHID', schema="TEST_NORMALIZATION", tags=["top-level", "airbyte_stream_DEDUP_CDC_EXCLUDED"]) }}
+-- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+-- On incremental runs, only the history of the primary keys touched by new records is ordered again and merged into the table
+with
+{% if is_incremental() %}
+new_data as (
+    select *
+    from {{ ref('DEDUP_CDC_EXCLUDED_AB4') }}
+    where {{ incremental_filter('DEDUP_CDC_EXCLUDED_SCD') }}
+),
+new_data_ids as (
+    select distinct {{ dbt_utils.surrogate_key(['ID']) }} as _airbyte_unique_key
+    from new_data
+),
+previous_scd_data as (
+    select this_data.*
+    from {{ this }} as this_data
+    join new_data_ids on this_data._airbyte_unique_key = new_data_ids._airbyte_unique_key
+),
+input_data as (
+    select
+        ID,
+        NAME,
+        _AB_CDC_LSN,
+        _AB_CDC_UPDATED_AT,
+        _AB_CDC_DELETED_AT,
+        _airbyte_emitted_at,
+        _AIRBYTE_DEDUP_CDC_EXCLUDED_HASHID
+    from new_data
+    union all
+    select
+        ID,
+        NAME,
+        _AB_CDC_LSN,
+        _AB_CDC_UPDATED_AT,
+        _AB_CDC_DELETED_AT,
+        _airbyte_emitted_at,
+        _AIRBYTE_DEDUP_CDC_EXCLUDED_HASHID
+    from previous_scd_data
+)
+{% else %}
+input_data as (
+    select *
+    from {{ ref('DEDUP_CDC_EXCLUDED_AB4') }}
+)
+{% endif %}
+select
+    {{ dbt_utils.surrogate_key(['ID']) }} as _airbyte_unique_key,
+    ID,
+    NAME,
+    _AB_CDC_LSN,
+    _AB_CDC_UPDATED_AT,
+    _AB_CDC_DELETED_AT,
+    _airbyte_emitted_at as _airbyte_start_at,
+    lag(_airbyte_emitted_at) over (
+        partition by ID
+        order by _airbyte_emitted_at is null asc, _airbyte_emitted_at desc, _airbyte_emitted_at desc
+    ) as _airbyte_end_at,
+    lag(_airbyte_emitted_at) over (
+        partition by ID
+        order by _airbyte_emitted_at is null asc, _airbyte_emitted_at desc, _airbyte_emitted_at desc, _ab_cdc_updated_at desc
+    ) is null and _ab_cdc_deleted_at is null as _airbyte_active_row,
+    _airbyte_emitted_at,
+    _AIRBYTE_DEDUP_CDC_EXCLUDED_HASHID
+from input_data
+-- DEDUP_CDC_EXCLUDED from {{ source('TEST_NORMALIZATION', '_AIRBYTE_RAW_DEDUP_CDC_EXCLUDED') }}
+
@@ -1,6 +1,7 @@
-{{ config(schema="TEST_NORMALIZATION", tags=["top-level"]) }}
+{{ config(unique_key='_airbyte_unique_key', schema="TEST_NORMALIZATION", tags=["top-level", "airbyte_stream_DEDUP_EXCHANGE_RATE"]) }}
 -- Final base SQL model
 select
+    _airbyte_unique_key,
     ID,
     CURRENCY,
     DATE,
@@ -14,4 +15,11 @@ select
 from {{ ref('DEDUP_EXCHANGE_RATE_SCD') }}
 -- DEDUP_EXCHANGE_RATE from {{ source('TEST_NORMALIZATION', '_AIRBYTE_RAW_DEDUP_EXCHANGE_RATE') }}
 where _airbyte_active_row = True
+{% if is_incremental() %}
+and _airbyte_unique_key in (
+    select _airbyte_unique_key
+    from {{ ref('DEDUP_EXCHANGE_RATE_SCD') }}
+    where {{ incremental_filter('DEDUP_EXCHANGE_RATE') }}
+)
+{% endif %}
 
@@ -0,0 +1,18 @@
+{{ config(unique_key='_AIRBYTE_DEDUP_EXCHANGE_RATE_HASHID', schema="_AIRBYTE_TEST_NORMALIZATION", tags=["top-level-intermediate", "airbyte_stream_DEDUP_EXCHANGE_RATE"]) }}
+-- SQL model to deduplicate records based on the hash record column, new records are appended to this table on each run
+select * from (
+select
+  *,
+  row_number() over (
+    partition by _AIRBYTE_DEDUP_EXCHANGE_RATE_HASHID
+    order by _airbyte_emitted_at asc
+  ) as _airbyte_row_num
+from {{ ref('DEDUP_EXCHANGE_RATE_AB3') }}
+{% if is_incremental() %}
+-- records already normalized by a previous run are kept with their first emission time
+where _AIRBYTE_DEDUP_EXCHANGE_RATE_HASHID not in (select _AIRBYTE_DEDUP_EXCHANGE_RATE_HASHID from {{ this }})
+{% endif %}
+) as new_records
+where _airbyte_row_num = 1
+-- DEDUP_EXCHANGE_RATE from {{ source('TEST_NORMALIZATION', '_AIRBYTE_RAW_DEDUP_EXCHANGE_RATE') }}
+
@@ -0,0 +1,76 @@
+{{ config(unique_key='_AIRBYTE_DEDUP_EXCHANGE_RATE_HASHID', schema="TEST_NORMALIZATION", tags=["top-level", "airbyte_stream_DEDUP_EXCHANGE_RATE"]) }}
+-- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+-- On incremental runs, only the history of the primary keys touched by new records is ordered again and merged into the table
+with
+{% if is_incremental() %}
+new_data as (
+    select *
+    from {{ ref('DEDUP_EXCHANGE_RATE_AB4') }}
+    where {{ incremental_filter('DEDUP_EXCHANGE_RATE_SCD') }}
+),
+new_data_ids as (
+    select distinct {{ dbt_utils.surrogate_key(['ID', 'CURRENCY', 'NZD']) }} as _airbyte_unique_key
+    from new_data
+),
+previous_scd_data as (
+    select this_data.*
+    from {{ this }} as this_data
+    join new_data_ids on this_data._airbyte_unique_key = new_data_ids._airbyte_unique_key
+),
+input_data as (
+    select
+        ID,
+        CURRENCY,
+        DATE,
+        TIMESTAMP_COL,
+        {{ adapter.quote('HKD@spéçiäl & characters') }},
+        HKD_SPECIAL___CHARACTERS,
+        NZD,
+        USD,
+        _airbyte_emitted_at,
+        _AIRBYTE_DEDUP_EXCHANGE_RATE_HASHID
+    from new_data
+    union all
+    select
+        ID,
+        CURRENCY,
+        DATE,
+        TIMESTAMP_COL,
+        {{ adapter.quote('HKD@spéçiäl & characters') }},
+        HKD_SPECIAL___CHARACTERS,
+        NZD,
+        USD,
+        _airbyte_emitted_at,
+        _AIRBYTE_DEDUP_EXCHANGE_RATE_HASHID
+    from previous_scd_data
+)
+{% else %}
+input_data as (
+    select *
+    from {{ ref('DEDUP_EXCHANGE_RATE_AB4') }}
+)
+{% endif %}
+select
+    {{ dbt_utils.surrogate_key(['ID', 'CURRENCY', 'NZD']) }} as _airbyte_unique_key,
+    ID,
+    CURRENCY,
+    DATE,
+    TIMESTAMP_COL,
+    {{ adapter.quote('HKD@spéçiäl & characters') }},
+    HKD_SPECIAL___CHARACTERS,
+    NZD,
+    USD,
+    DATE as _airbyte_start_at,
+    lag(DATE) over (
+        partition by ID, CURRENCY, cast(NZD as {{ dbt_utils.type_string() }})
+        order by DATE is null asc, DATE desc, _airbyte_emitted_at desc
+    ) as _airbyte_end_at,
+    lag(DATE) over (
+        partition by ID, CURRENCY, cast(NZD as {{ dbt_utils.type_string() }})
+        order by DATE is null asc, DATE desc, _airbyte_emitted_at desc
+    ) is null as _airbyte_active_row,
+    _airbyte_emitted_at,
+    _AIRBYTE_DEDUP_EXCHANGE_RATE_HASHID
+from input_data
+-- DEDUP_EXCHANGE_RATE from {{ source('TEST_NORMALIZATION', '_AIRBYTE_RAW_DEDUP_EXCHANGE_RATE') }}
+
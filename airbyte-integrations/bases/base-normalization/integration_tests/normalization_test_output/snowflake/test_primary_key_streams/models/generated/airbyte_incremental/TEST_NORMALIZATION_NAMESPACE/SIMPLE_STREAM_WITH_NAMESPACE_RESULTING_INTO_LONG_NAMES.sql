@@ -1,4 +1,4 @@
-{{ config(schema="TEST_NORMALIZATION_NAMESPACE", tags=["top-level"]) }}
+{{ config(schema="TEST_NORMALIZATION_NAMESPACE", tags=["top-level", "airbyte_stream_SIMPLE_STREAM_WITH_NAMESPACE_RESULTING_INTO_LONG_NAMES"]) }}
 -- Final base SQL model
 select
     ID,
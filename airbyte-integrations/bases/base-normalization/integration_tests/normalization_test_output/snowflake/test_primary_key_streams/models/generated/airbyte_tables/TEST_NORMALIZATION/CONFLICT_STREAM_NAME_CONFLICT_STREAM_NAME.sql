@@ -1,4 +1,4 @@
-{{ config(schema="TEST_NORMALIZATION", tags=["nested"]) }}
+{{ config(schema="TEST_NORMALIZATION", tags=["nested", "airbyte_stream_CONFLICT_STREAM_NAME"]) }}
 -- Final base SQL model
 select
     _AIRBYTE_CONFLICT_STREAM_NAME_HASHID,
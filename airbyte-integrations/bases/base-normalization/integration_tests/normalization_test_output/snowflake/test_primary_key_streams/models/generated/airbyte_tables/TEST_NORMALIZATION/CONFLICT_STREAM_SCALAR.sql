@@ -1,4 +1,4 @@
-{{ config(schema="TEST_NORMALIZATION", tags=["top-level"]) }}
+{{ config(schema="TEST_NORMALIZATION", tags=["top-level", "airbyte_stream_CONFLICT_STREAM_SCALAR"]) }}
 -- Final base SQL model
 select
     ID,
@@ -1,4 +1,4 @@
-{{ config(schema="TEST_NORMALIZATION", tags=["nested"]) }}
+{{ config(schema="TEST_NORMALIZATION", tags=["nested", "airbyte_stream_NESTED_STREAM_WITH_COMPLEX_COLUMNS_RESULTING_INTO_LONG_NAMES"]) }}
 -- Final base SQL model
 select
     _AIRBYTE_NESTED_STREAM_WITH_COMPLEX_COLUMNS_RESULTING_INTO_LONG_NAMES_HASHID,
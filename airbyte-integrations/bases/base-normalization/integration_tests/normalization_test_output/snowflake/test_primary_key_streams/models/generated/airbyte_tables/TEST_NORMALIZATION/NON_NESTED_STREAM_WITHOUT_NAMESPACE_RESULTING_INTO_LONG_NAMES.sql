@@ -1,4 +1,4 @@
-{{ config(schema="TEST_NORMALIZATION", tags=["top-level"]) }}
+{{ config(schema="TEST_NORMALIZATION", tags=["top-level", "airbyte_stream_NON_NESTED_STREAM_WITHOUT_NAMESPACE_RESULTING_INTO_LONG_NAMES"]) }}
 -- Final base SQL model
 select
     ID,
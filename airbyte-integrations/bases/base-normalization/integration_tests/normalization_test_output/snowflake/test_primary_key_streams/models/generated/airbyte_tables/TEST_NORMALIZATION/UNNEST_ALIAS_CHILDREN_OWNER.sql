@@ -1,4 +1,4 @@
-{{ config(schema="TEST_NORMALIZATION", tags=["nested"]) }}
+{{ config(schema="TEST_NORMALIZATION", tags=["nested", "airbyte_stream_UNNEST_ALIAS"]) }}
 -- Final base SQL model
 select
     _AIRBYTE_CHILDREN_HASHID,
@@ -28,7 +28,7 @@ import pathlib
 import re
 import shutil
 import tempfile
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 import pytest
 from integration_tests.dbt_integration_test import DbtIntegrationTest
@@ -92,6 +92,10 @@ def test_normalization(destination_type: DestinationType, test_resource_name: st
     # Run checks on Tests results
     dbt_test(destination_type, test_resource_name, test_root_dir)
     check_outputs(destination_type, test_resource_name, test_root_dir)
+    # Incremental step: normalize new records on top of the tables built by the previous run
+    if setup_incremental_input_raw_data(integration_type, test_resource_name, test_root_dir):
+        dbt_test_utils.dbt_run(test_root_dir, output_dir="final_incremental")
+        dbt_test(destination_type, test_resource_name, test_root_dir, data_tests="dbt_data_tests_incremental")
 
 
 def setup_test_dir(integration_type: str, test_resource_name: str) -> str:
@@ -148,7 +152,28 @@ def setup_input_raw_data(integration_type: str, test_resource_name: str, test_ro
     config_file = os.path.join(test_root_dir, "destination_config.json")
     with open(config_file, "w") as f:
         f.write(json.dumps(destination_config))
-    commands = [
+    commands = destination_commands(integration_type, test_root_dir)
+    # Force a reset in destination raw tables
+    assert dbt_test_utils.run_destination_process("", test_root_dir, commands + ["/data/reset_catalog.json"])
+    # Run a sync to create raw tables in destinations
+    return dbt_test_utils.run_destination_process(message_file, test_root_dir, commands + ["/data/destination_catalog.json"])
+
+
+def setup_incremental_input_raw_data(integration_type: str, test_resource_name: str, test_root_dir: str) -> bool:
+    """
+    If the test case provides a messages_incremental.txt file, its records are synced on top of the raw tables of the
+    previous sync (without any reset) to test the incremental runs of normalization.
+    """
+    message_file = os.path.join("resources", test_resource_name, "data_input", "messages_incremental.txt")
+    if not os.path.exists(message_file):
+        return False
+    commands = destination_commands(integration_type, test_root_dir)
+    assert dbt_test_utils.run_destination_process(message_file, test_root_dir, commands + ["/data/destination_catalog.json"])
+    return True
+
+
+def destination_commands(integration_type: str, test_root_dir: str) -> List[str]:
+    return [
         "docker",
         "run",
         "--rm",
@@ -164,10 +189,6 @@ def setup_input_raw_data(integration_type: str, test_resource_name: str, test_ro
         "/data/destination_config.json",
         "--catalog",
     ]
-    # Force a reset in destination raw tables
-    assert dbt_test_utils.run_destination_process("", test_root_dir, commands + ["/data/reset_catalog.json"])
-    # Run a sync to create raw tables in destinations
-    return dbt_test_utils.run_destination_process(message_file, test_root_dir, commands + ["/data/destination_catalog.json"])
 
 
 def generate_dbt_models(destination_type: DestinationType, test_resource_name: str, test_root_dir: str):
@@ -180,7 +201,7 @@ def generate_dbt_models(destination_type: DestinationType, test_resource_name: s
     )
 
 
-def dbt_test(destination_type: DestinationType, test_resource_name: str, test_root_dir: str):
+def dbt_test(destination_type: DestinationType, test_resource_name: str, test_root_dir: str, data_tests: str = "dbt_data_tests"):
     """
     dbt provides a way to run dbt tests as described here: https://docs.getdbt.com/docs/building-a-dbt-project/tests
     - Schema tests are added in .yml files from the schema_tests directory
@@ -188,6 +209,7 @@ def dbt_test(destination_type: DestinationType, test_resource_name: str, test_ro
     - Data tests are added in .sql files from the data_tests directory and should return 0 records to be successful
 
     We use this mechanism to verify the output of our integration tests.
+    The data tests are read from the `data_tests` folder of the test case, so each run can check its own expected outputs.
     """
     replace_identifiers = os.path.join("resources", test_resource_name, "data_input", "replace_identifiers.json")
     copy_test_files(
@@ -197,7 +219,7 @@ def dbt_test(destination_type: DestinationType, test_resource_name: str, test_ro
         replace_identifiers,
     )
     copy_test_files(
-        os.path.join("resources", test_resource_name, "dbt_data_tests"),
+        os.path.join("resources", test_resource_name, data_tests),
         os.path.join(test_root_dir, "tests"),
         destination_type,
         replace_identifiers,
@@ -247,7 +269,8 @@ def copy_test_files(src: str, dst: str, destination_type: DestinationType, repla
 
                 shutil.copytree(src, temp_dir + "/replace", copy_function=copy_replace_identifiers)
                 src = temp_dir + "/replace"
-        # final copy
+        # final copy, replacing the test files of a previous run
+        shutil.rmtree(dst, ignore_errors=True)
         shutil.copytree(src, dst)
 
 
@@ -23,9 +23,15 @@
 #
 
 
+import glob
+import hashlib
 import json
+import math
 import os
-from typing import Any, Dict, List, Set
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import yaml
 from airbyte_protocol.models.airbyte_protocol import DestinationSyncMode, SyncMode
@@ -43,22 +49,44 @@ class CatalogProcessor:
     This processor reads the catalog file, extracts streams descriptions and transforms them to final tables in their
     targeted destination schema.
 
-    This is relying on a StreamProcessor to handle the conversion of a stream to a table one at a time.
+    This is relying on a StreamProcessor to handle the conversion of a stream (and of its nested streams) to tables.
+    Independent top level streams are converted in parallel, and the models generated for a stream are cached by a hash of
+    everything they depend on, so that unchanged streams don't need to be converted again by the next run.
     """
 
-    def __init__(self, output_directory: str, destination_type: DestinationType):
+    def __init__(
+        self,
+        output_directory: str,
+        destination_type: DestinationType,
+        cache_file: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        selectors_file: Optional[str] = None,
+        streams_with_data: Optional[List[Dict[str, str]]] = None,
+    ):
         """
         @param output_directory is the path to the directory where this processor should write the resulting SQL files (DBT models)
         @param destination_type is the destination type of warehouse
+        @param cache_file is the path to the file where generated models are cached between runs, no cache is used if not set
+        @param max_workers is the number of processes converting streams in parallel, defaults to the number of CPUs
+        @param selectors_file is the path to the selectors.yml file where the selector of the streams with new data is written
+        @param streams_with_data lists the name (and optionally the namespace) of the streams which received records in the last sync
         """
         self.output_directory: str = output_directory
         self.destination_type: DestinationType = destination_type
         self.name_transformer: DestinationNameTransformer = DestinationNameTransformer(destination_type)
+        self.cache_file: Optional[str] = cache_file
+        self.max_workers: int = max_workers or os.cpu_count() or 1
+        # cache keys of the streams processed so far, other cached streams are dropped from the cache file
+        self.cache_keys: Set[str] = set()
+        self.selectors_file: Optional[str] = selectors_file
+        self.streams_with_data: Optional[List[Dict[str, str]]] = streams_with_data
+        # tags of the models to run in order to normalize the streams with new data (see StreamProcessor.get_stream_tag)
+        self.selected_tags: Set[str] = set()
 
     def process(self, catalog_file: str, json_column_name: str, default_schema: str):
         """
-        This method first parse and build models to handle top-level streams.
-        In a second loop will go over the substreams that were nested in a breadth-first traversal manner.
+        This method first collects the table names of all streams to resolve naming conflicts.
+        Then it builds the models of each top-level stream together with its nested substreams (see process_stream).
 
         @param catalog_file input AirbyteCatalog file in JSON Schema describing the structure of the raw data
         @param json_column_name is the column name containing the JSON Blob with the raw data
@@ -68,7 +96,6 @@ class CatalogProcessor:
         schema_to_source_tables: Dict[str, Set[str]] = {}
         catalog = read_json(catalog_file)
         # print(json.dumps(catalog, separators=(",", ":")))
-        substreams = []
         stream_processors = self.build_stream_processor(
             catalog=catalog,
             json_column_name=json_column_name,
@@ -90,13 +117,61 @@ class CatalogProcessor:
             raw_table_name = self.name_transformer.normalize_table_name(f"_airbyte_raw_{stream_processor.stream_name}", truncate=truncate)
             add_table_to_sources(schema_to_source_tables, stream_processor.schema, raw_table_name)
 
-            nested_processors = stream_processor.process()
-            if nested_processors and len(nested_processors) > 0:
-                substreams += nested_processors
-            for file in stream_processor.sql_outputs:
-                output_sql_file(os.path.join(self.output_directory, file), stream_processor.sql_outputs[file])
+        cache = read_cache(self.cache_file)
+        stream_keys = [get_stream_cache_key(stream_processor) for stream_processor in stream_processors]
+        pending = [(key, stream_processor) for key, stream_processor in zip(stream_keys, stream_processors) if key not in cache]
+        start_time = time.monotonic()
+        generated = dict(zip([key for key, _ in pending], self.process_streams([stream_processor for _, stream_processor in pending])))
+        elapsed_time = time.monotonic() - start_time
+
+        timings = []
+        for key, stream_processor in zip(stream_keys, stream_processors):
+            if key in generated:
+                sql_outputs, stream_time = generated[key]
+                cache[key] = sql_outputs
+            else:
+                sql_outputs, stream_time = cache[key], None
+            timings.append((stream_processor, len(sql_outputs), stream_time))
+            for file in sql_outputs:
+                output_sql_file(os.path.join(self.output_directory, file), sql_outputs[file])
         self.write_yaml_sources_file(schema_to_source_tables)
-        self.process_substreams(substreams, tables_registry)
+        # only keep the streams of this catalog in the cache
+        self.cache_keys.update(stream_keys)
+        write_cache(self.cache_file, {key: cache[key] for key in self.cache_keys if key in cache})
+        print_timing_report(timings, elapsed_time)
+        if self.selectors_file and self.streams_with_data is not None:
+            for stream_processor in stream_processors:
+                if self.has_new_data(stream_processor):
+                    self.selected_tags.add(stream_processor.get_stream_tag())
+            self.write_yaml_selectors_file()
+
+    def process_streams(self, stream_processors: List[StreamProcessor]) -> List[Tuple[Dict[str, str], float]]:
+        """
+        Build the models of these top-level streams, in parallel processes if there's more than one to process.
+        @return for each stream, the generated models (see StreamProcessor.sql_outputs) and the time it took to generate them
+        """
+        if self.max_workers <= 1 or len(stream_processors) <= 1:
+            return [process_stream(stream_processor) for stream_processor in stream_processors]
+        max_workers = min(self.max_workers, len(stream_processors))
+        # streams are sent in chunks to the worker processes so that the tables registry they share is only serialized once per chunk
+        chunk_size = math.ceil(len(stream_processors) / (max_workers * 4))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(process_stream, stream_processors, chunksize=chunk_size))
+
+    def has_new_data(self, stream_processor: StreamProcessor) -> bool:
+        """
+        Whether the raw table of a top-level stream changed in the last sync, in which case its models have to be run again.
+        Streams listed without a namespace match the streams of that name in every namespace.
+        """
+        if stream_processor.destination_sync_mode.value == DestinationSyncMode.overwrite.value:
+            # the raw table of an overwritten stream is replaced even if no records were emitted, so its tables have to be emptied too
+            return True
+        for stream in self.streams_with_data:
+            if stream["name"] == stream_processor.stream_name:
+                namespace = stream.get("namespace")
+                if not namespace or self.name_transformer.normalize_schema_name(namespace, truncate=False) == stream_processor.schema:
+                    return True
+        return False
 
     @staticmethod
     def build_stream_processor(
@@ -161,21 +236,6 @@ class CatalogProcessor:
             result.append(stream_processor)
         return result
 
-    def process_substreams(self, substreams: List[StreamProcessor], tables_registry: TableNameRegistry):
-        """
-        Handle nested stream/substream/children
-        """
-        while substreams:
-            children = substreams
-            substreams = []
-            for substream in children:
-                substream.tables_registry = tables_registry
-                nested_processors = substream.process()
-                if nested_processors:
-                    substreams += nested_processors
-                for file in substream.sql_outputs:
-                    output_sql_file(os.path.join(self.output_directory, file), substream.sql_outputs[file])
-
     def write_yaml_sources_file(self, schema_to_source_tables: Dict[str, Set[str]]):
         """
         Generate the sources.yaml file as described in https://docs.getdbt.com/docs/building-a-dbt-project/using-sources/
@@ -209,10 +269,120 @@ class CatalogProcessor:
         with open(source_path, "w") as fh:
             fh.write(yaml.dump(source_config, sort_keys=False))
 
+    def write_yaml_selectors_file(self):
+        """
+        Generate the selectors.yml file as described in https://docs.getdbt.com/reference/node-selection/yaml-selectors
+        with a "streams_with_data" selector of the models normalizing the streams which received records in the last sync
+        """
+        tags = [{"method": "tag", "value": tag} for tag in sorted(self.selected_tags)]
+        if tags:
+            definition = {"union": tags}
+        else:
+            # nothing to run, use a tag that is not defined by any model
+            definition = {"method": "tag", "value": "airbyte_no_stream_with_data"}
+        selectors = {
+            "selectors": [
+                {
+                    "name": "streams_with_data",
+                    "description": "Models of the streams which received records in the last sync, including their nested streams",
+                    "definition": definition,
+                }
+            ]
+        }
+        output_dir = os.path.dirname(self.selectors_file)
+        if output_dir and not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+        with open(self.selectors_file, "w") as fh:
+            fh.write(yaml.dump(selectors, sort_keys=False))
+
 
 # Static Functions
 
 
+def process_stream(stream_processor: StreamProcessor) -> Tuple[Dict[str, str], float]:
+    """
+    Build the models of a top-level stream and of all its nested substreams in a breadth-first traversal manner.
+    @return the generated models (see StreamProcessor.sql_outputs) and the time it took to generate them
+    """
+    start_time = time.monotonic()
+    sql_outputs = {}
+    stream_processors = [stream_processor]
+    while stream_processors:
+        current = stream_processors.pop(0)
+        stream_processors += current.process()
+        sql_outputs.update(current.sql_outputs)
+    return sql_outputs, time.monotonic() - start_time
+
+
+@lru_cache(maxsize=None)
+def get_generator_version() -> str:
+    """
+    Hash of the code generating the models, so that cached models are generated again when normalization is upgraded
+    """
+    h = hashlib.sha256()
+    for file in sorted(glob.glob(os.path.join(os.path.dirname(__file__), "*.py"))):
+        with open(file, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def get_stream_cache_key(stream_processor: StreamProcessor) -> str:
+    """
+    Hash of everything the models generated for a top-level stream depend on: its configuration and json schema, the destination
+    type, the names resolved for its tables (which depend on the other streams of the catalog) and the version of normalization.
+    """
+    content = {
+        "generator_version": get_generator_version(),
+        "destination_type": stream_processor.destination_type.value,
+        "stream_name": stream_processor.stream_name,
+        "raw_schema": stream_processor.raw_schema,
+        "schema": stream_processor.schema,
+        "source_sync_mode": stream_processor.source_sync_mode.value,
+        "destination_sync_mode": stream_processor.destination_sync_mode.value,
+        "cursor_field": stream_processor.cursor_field,
+        "primary_key": stream_processor.primary_key,
+        "json_column_name": stream_processor.json_column_name,
+        "properties": stream_processor.properties,
+        "from_table": stream_processor.from_table,
+        "table_names": stream_processor.tables_registry.get_stream_names(stream_processor.schema, stream_processor.json_path),
+    }
+    return hashlib.sha256(json.dumps(content, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def read_cache(cache_file: Optional[str]) -> Dict[str, Dict[str, str]]:
+    """
+    Reads the models generated by a previous run, indexed by the cache key of their stream (see get_stream_cache_key)
+    """
+    if not cache_file or not os.path.exists(cache_file):
+        return {}
+    try:
+        return read_json(cache_file)
+    except ValueError as e:
+        print(f"WARN: Ignoring invalid cache file {cache_file}: {e}")
+        return {}
+
+
+def write_cache(cache_file: Optional[str], cache: Dict[str, Dict[str, str]]):
+    if not cache_file:
+        return
+    output_dir = os.path.dirname(cache_file)
+    if output_dir and not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+    with open(cache_file, "w") as f:
+        json.dump(cache, f)
+
+
+def print_timing_report(timings: List[Tuple[StreamProcessor, int, Optional[float]]], elapsed_time: float):
+    """
+    Print the time spent generating the models of each stream, slowest first
+    """
+    cached_count = len([stream_time for _, _, stream_time in timings if stream_time is None])
+    print(f"Generated models of {len(timings)} streams in {elapsed_time:.2f}s ({cached_count} streams unchanged since the last run)")
+    for stream_processor, model_count, stream_time in sorted(timings, key=lambda timing: -(timing[2] or 0)):
+        duration = "cached" if stream_time is None else f"{stream_time:.3f}s"
+        print(f"  {duration:>8} {stream_processor.schema}.{stream_processor.stream_name} ({model_count} models)")
+
+
 def read_json(input_path: str) -> Any:
     """
     Reads and load a json file
@@ -24,6 +24,7 @@
 
 
 import os
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 from airbyte_protocol.models.airbyte_protocol import DestinationSyncMode, SyncMode
@@ -227,25 +228,62 @@ class StreamProcessor(object):
             self.generate_id_hashing_model(from_table, column_names), is_intermediate=True, column_count=column_count, suffix="ab3"
         )
         if self.destination_sync_mode.value == DestinationSyncMode.append_dedup.value:
-            from_table = self.add_to_outputs(self.generate_dedup_record_model(from_table, column_names), is_intermediate=True, suffix="ab4")
-            where_clause = "\nwhere _airbyte_row_num = 1"
             from_table = self.add_to_outputs(
-                self.generate_scd_type_2_model(from_table, column_names) + where_clause,
+                self.generate_dedup_record_model(from_table, column_names),
+                is_intermediate=True,
+                suffix="ab4",
+                is_incremental=True,
+                unique_key=self.hash_id(in_jinja=True),
+            )
+            from_table = self.add_to_outputs(
+                self.generate_scd_type_2_model(from_table, column_names),
                 is_intermediate=False,
                 column_count=column_count,
                 suffix="scd",
+                is_incremental=True,
+                unique_key=self.hash_id(in_jinja=True),
             )
-            where_clause = "\nwhere _airbyte_active_row = True"
             from_table = self.add_to_outputs(
-                self.generate_final_model(from_table, column_names) + where_clause, is_intermediate=False, column_count=column_count
+                self.generate_final_model(from_table, column_names, unique_key="_airbyte_unique_key") + self.active_rows_clause(from_table),
+                is_intermediate=False,
+                column_count=column_count,
+                is_incremental=True,
+                unique_key="'_airbyte_unique_key'",
+                post_hook=self.cdc_deletion_hook(from_table, column_names),
             )
             # TODO generate yaml file to dbt test final table where primary keys should be unique
         else:
             from_table = self.add_to_outputs(
-                self.generate_final_model(from_table, column_names), is_intermediate=False, column_count=column_count
+                self.generate_final_model(from_table, column_names),
+                is_intermediate=False,
+                column_count=column_count,
+                is_incremental=self.is_incremental_mode(),
             )
         return self.find_children_streams(from_table, column_names)
 
+    def is_incremental_mode(self) -> bool:
+        """
+        Whether this stream only processes the raw rows emitted since the last normalization run, appending them to an incremental
+        table instead of rebuilding it from the whole history:
+         - in append mode, into the final table
+         - in append_dedup mode, into the table of unique records (ab4), the SCD and final tables then only update the history of
+           the primary keys of these new records
+         - nested streams are always in append mode (see create_from_parent) but are extracted from their parent final table,
+           so they can only be incremental if their parent final table is an incremental one too.
+        In overwrite mode, the raw table only contains the last sync anyway.
+        """
+        if self.parent:
+            return self.parent.is_incremental_mode() and self.parent.destination_sync_mode.value == DestinationSyncMode.append.value
+        return self.destination_sync_mode.value in [DestinationSyncMode.append.value, DestinationSyncMode.append_dedup.value]
+
+    def incremental_model_name(self) -> str:
+        """
+        Name of the incremental model whose last run tells which raw rows still have to be processed, see is_incremental_mode
+        """
+        if self.destination_sync_mode.value == DestinationSyncMode.append_dedup.value:
+            return self.get_model_name(is_intermediate=True, suffix="ab4")
+        return self.get_model_name(is_intermediate=False)
+
     def extract_column_names(self) -> Dict[str, Tuple[str, str]]:
         """
         Generate a mapping of JSON properties to normalized SQL Column names, handling collisions and avoid duplicate names
@@ -312,7 +350,7 @@ class StreamProcessor(object):
         return children
 
     def generate_json_parsing_model(self, from_table: str, column_names: Dict[str, Tuple[str, str]]) -> str:
-        template = Template(
+        template = compile_template(
             """
 -- SQL model to parse JSON blob stored in a single column and extract into separated field columns as described by the JSON Schema
 {{ unnesting_before_query }}
@@ -326,6 +364,9 @@ select
     _airbyte_emitted_at
 from {{ from_table }} as table_alias
 {{ unnesting_after_query }}
+{%- if incremental_filter %}
+{% if unnesting_after_query %}and{% else %}where{% endif %} {{ incremental_filter }}
+{%- endif %}
 {{ sql_table_comment }}
 """
         )
@@ -335,10 +376,16 @@ from {{ from_table }} as table_alias
             fields=self.extract_json_columns(column_names),
             from_table=jinja_call(from_table),
             unnesting_after_query=self.unnesting_after_query(),
+            incremental_filter=self.incremental_filter(),
             sql_table_comment=self.sql_table_comment(),
         )
         return sql
 
+    def incremental_filter(self) -> str:
+        if self.is_incremental_mode():
+            return jinja_call(f"incremental_filter('{self.incremental_model_name()}')")
+        return ""
+
     def extract_json_columns(self, column_names: Dict[str, Tuple[str, str]]) -> List[str]:
         return [
             StreamProcessor.extract_json_column(field, self.json_column_name, self.properties[field], column_names[field][0], "table_alias")
@@ -365,7 +412,7 @@ from {{ from_table }} as table_alias
         return f"{json_extract} as {column_name}"
 
     def generate_column_typing_model(self, from_table: str, column_names: Dict[str, Tuple[str, str]]) -> str:
-        template = Template(
+        template = compile_template(
             """
 -- SQL model to cast each column to its adequate SQL type converted from the JSON schema type
 select
@@ -420,7 +467,7 @@ from {{ from_table }}
         return f"cast({column_name} as {sql_type}) as {column_name}"
 
     def generate_id_hashing_model(self, from_table: str, column_names: Dict[str, Tuple[str, str]]) -> str:
-        template = Template(
+        template = compile_template(
             """
 -- SQL model to build a hash column based on the values of this record
 select
@@ -464,9 +511,10 @@ from {{ from_table }}
             return column_name
 
     def generate_dedup_record_model(self, from_table: str, column_names: Dict[str, Tuple[str, str]]) -> str:
-        template = Template(
+        template = compile_template(
             """
--- SQL model to prepare for deduplicating records based on the hash record column
+-- SQL model to deduplicate records based on the hash record column, new records are appended to this table on each run
+select * from (
 select
   *,
   row_number() over (
@@ -474,6 +522,12 @@ select
     order by _airbyte_emitted_at asc
   ) as _airbyte_row_num
 from {{ from_table }}
+{{ '{%' }} if is_incremental() {{ '%}' }}
+-- records already normalized by a previous run are kept with their first emission time
+where {{ hash_id }} not in (select {{ hash_id }} from {{ '{{' }} this {{ '}}' }})
+{{ '{%' }} endif {{ '%}' }}
+) as new_records
+where _airbyte_row_num = 1
 {{ sql_table_comment }}
         """
         )
@@ -483,10 +537,57 @@ from {{ from_table }}
         return sql
 
     def generate_scd_type_2_model(self, from_table: str, column_names: Dict[str, Tuple[str, str]]) -> str:
-        template = Template(
+        template = compile_template(
             """
 -- SQL model to build a Type 2 Slowly Changing Dimension (SCD) table for each record identified by their primary key
+-- On incremental runs, only the history of the primary keys touched by new records is ordered again and merged into the table
+with
+{{ '{%' }} if is_incremental() {{ '%}' }}
+new_data as (
+    select *
+    from {{ from_table }}
+    where {{ incremental_filter }}
+),
+new_data_ids as (
+    select distinct {{ unique_key }} as _airbyte_unique_key
+    from new_data
+),
+previous_scd_data as (
+    select this_data.*
+    from {{ '{{' }} this {{ '}}' }} as this_data
+    join new_data_ids on this_data._airbyte_unique_key = new_data_ids._airbyte_unique_key
+),
+input_data as (
+    select
+  {%- if parent_hash_id %}
+        {{ parent_hash_id }},
+  {%- endif %}
+  {%- for field in fields %}
+        {{ field }},
+  {%- endfor %}
+        _airbyte_emitted_at,
+        {{ hash_id }}
+    from new_data
+    union all
+    select
+  {%- if parent_hash_id %}
+        {{ parent_hash_id }},
+  {%- endif %}
+  {%- for field in fields %}
+        {{ field }},
+  {%- endfor %}
+        _airbyte_emitted_at,
+        {{ hash_id }}
+    from previous_scd_data
+)
+{{ '{%' }} else {{ '%}' }}
+input_data as (
+    select *
+    from {{ from_table }}
+)
+{{ '{%' }} endif {{ '%}' }}
 select
+    {{ unique_key }} as _airbyte_unique_key,
   {%- if parent_hash_id %}
     {{ parent_hash_id }},
   {%- endif %}
@@ -504,7 +605,7 @@ select
     ) is null {{ cdc_active_row }}as _airbyte_active_row,
     _airbyte_emitted_at,
     {{ hash_id }}
-from {{ from_table }}
+from input_data
 {{ sql_table_comment }}
         """
         )
@@ -520,14 +621,45 @@ from {{ from_table }}
             fields=self.list_fields(column_names),
             cursor_field=self.get_cursor_field(column_names),
             primary_key=self.get_primary_key(column_names),
+            unique_key=self.get_unique_key(column_names),
             hash_id=self.hash_id(),
             from_table=jinja_call(from_table),
+            incremental_filter=jinja_call(f"incremental_filter('{self.get_model_name(is_intermediate=False, suffix='scd')}')"),
             sql_table_comment=self.sql_table_comment(include_from_table=True),
             cdc_active_row=cdc_active_row_pattern,
             cdc_updated_at_order=cdc_updated_order_pattern,
         )
         return sql
 
+    def active_rows_clause(self, scd_table: str) -> str:
+        """
+        Filter of the final model of a deduplicated stream keeping the active record of each primary key. On incremental runs,
+        only the primary keys whose history was changed since the last run are merged into the final table.
+        """
+        model_name = self.get_model_name(is_intermediate=False)
+        return f"""
+where _airbyte_active_row = True
+{{% if is_incremental() %}}
+and _airbyte_unique_key in (
+    select _airbyte_unique_key
+    from {jinja_call(scd_table)}
+    where {jinja_call(f"incremental_filter('{model_name}')")}
+)
+{{% endif %}}"""
+
+    def cdc_deletion_hook(self, scd_table: str, column_names: Dict[str, Tuple[str, str]]) -> str:
+        """
+        Records deleted in the source (CDC) don't have an active row anymore, so they aren't merged into the final table by
+        incremental runs and have to be removed from it instead.
+        """
+        if "_ab_cdc_deleted_at" not in column_names.keys():
+            return ""
+        return (
+            "delete from {{ this }} where _airbyte_unique_key in ("
+            f"select _airbyte_unique_key from {jinja_call(scd_table)} where _airbyte_end_at is null and _ab_cdc_deleted_at is not null"
+            ")"
+        )
+
     def get_cursor_field(self, column_names: Dict[str, Tuple[str, str]]) -> str:
         if not self.cursor_field:
             return "_airbyte_emitted_at"
@@ -546,6 +678,21 @@ from {{ from_table }}
         else:
             raise ValueError(f"No primary key specified for stream {self.stream_name}")
 
+    def get_unique_key(self, column_names: Dict[str, Tuple[str, str]]) -> str:
+        """
+        Expression hashing the (composite) primary key of a record into a single column, used to merge records into incremental tables
+        """
+        if not self.primary_key:
+            raise ValueError(f"No primary key specified for stream {self.stream_name}")
+        fields = []
+        for path in self.primary_key:
+            if not path or len(path) > 1:
+                # reuse the validation and error messages of get_primary_key_from_path
+                self.get_primary_key_from_path(column_names, path)
+            field = path[0]
+            fields.append(f"'{field}'" if is_airbyte_column(field) else column_names[field][1])
+        return jinja_call(f"dbt_utils.surrogate_key([{', '.join(fields)}])")
+
     def get_primary_key_from_path(self, column_names: Dict[str, Tuple[str, str]], path: List[str]) -> str:
         if path and len(path) == 1:
             field = path[0]
@@ -568,11 +715,14 @@ from {{ from_table }}
             else:
                 raise ValueError(f"No path specified for stream {self.stream_name}")
 
-    def generate_final_model(self, from_table: str, column_names: Dict[str, Tuple[str, str]]) -> str:
-        template = Template(
+    def generate_final_model(self, from_table: str, column_names: Dict[str, Tuple[str, str]], unique_key: str = "") -> str:
+        template = compile_template(
             """
 -- Final base SQL model
 select
+  {%- if unique_key %}
+    {{ unique_key }},
+  {%- endif %}
   {%- if parent_hash_id %}
     {{ parent_hash_id }},
   {%- endif %}
@@ -586,6 +736,7 @@ from {{ from_table }}
     """
         )
         sql = template.render(
+            unique_key=unique_key,
             parent_hash_id=self.parent_hash_id(),
             fields=self.list_fields(column_names),
             hash_id=self.hash_id(),
@@ -598,14 +749,25 @@ from {{ from_table }}
     def list_fields(column_names: Dict[str, Tuple[str, str]]) -> List[str]:
         return [column_names[field][0] for field in column_names]
 
-    def add_to_outputs(self, sql: str, is_intermediate: bool, column_count: int = 0, suffix: str = "") -> str:
+    def add_to_outputs(
+        self,
+        sql: str,
+        is_intermediate: bool,
+        column_count: int = 0,
+        suffix: str = "",
+        is_incremental: bool = False,
+        unique_key: str = "",
+        post_hook: str = "",
+    ) -> str:
         schema = self.get_schema(is_intermediate)
         # MySQL table names need to be manually truncated, because it does not do it automatically
         truncate_name = self.destination_type == DestinationType.MYSQL
         table_name = self.tables_registry.get_table_name(schema, self.json_path, self.stream_name, suffix, truncate_name)
-        file_name = self.tables_registry.get_file_name(schema, self.json_path, self.stream_name, suffix, truncate_name)
+        file_name = self.get_model_name(is_intermediate, suffix)
         file = f"{file_name}.sql"
-        if is_intermediate:
+        if is_incremental:
+            output = os.path.join("airbyte_incremental", self.schema, file)
+        elif is_intermediate:
             if column_count <= MAXIMUM_COLUMNS_TO_USE_EPHEMERAL:
                 output = os.path.join("airbyte_ctes", self.schema, file)
             else:
@@ -615,11 +777,15 @@ from {{ from_table }}
         else:
             output = os.path.join("airbyte_tables", self.schema, file)
         tags = self.get_model_tags(is_intermediate)
+        config = f'schema="{schema}", tags=[{tags}]'
         # The alias() macro configs a model's final table name.
         if file_name != table_name:
-            header = jinja_call(f'config(alias="{table_name}", schema="{schema}", tags=[{tags}])')
-        else:
-            header = jinja_call(f'config(schema="{schema}", tags=[{tags}])')
+            config = f'alias="{table_name}", {config}'
+        if unique_key:
+            config = f"unique_key={unique_key}, {config}"
+        if post_hook:
+            config = f'{config}, post_hook="{post_hook}"'
+        header = jinja_call(f"config({config})")
         self.sql_outputs[
             output
         ] = f"""
@@ -630,6 +796,14 @@ from {{ from_table }}
         print(f"  Generating {output} from {json_path}")
         return ref_table(file_name)
 
+    def get_model_name(self, is_intermediate: bool, suffix: str = "") -> str:
+        """
+        Name of the dbt model (and of its file) generated for this stream with the given suffix
+        """
+        # MySQL table names need to be manually truncated, because it does not do it automatically
+        truncate_name = self.destination_type == DestinationType.MYSQL
+        return self.tables_registry.get_file_name(self.get_schema(is_intermediate), self.json_path, self.stream_name, suffix, truncate_name)
+
     def get_model_tags(self, is_intermediate: bool) -> str:
         tags = ""
         if self.parent:
@@ -638,7 +812,15 @@ from {{ from_table }}
             tags += "top-level"
         if is_intermediate:
             tags += "-intermediate"
-        return f'"{tags}"'
+        return f'"{tags}", "{self.get_stream_tag()}"'
+
+    def get_stream_tag(self) -> str:
+        """
+        Tag shared by the models of a top-level stream and of all its nested substreams, so they can be selected together in dbt runs
+        """
+        if self.parent:
+            return self.parent.get_stream_tag()
+        return f"airbyte_stream_{self.get_model_name(False)}"
 
     def get_schema(self, is_intermediate: bool) -> str:
         if is_intermediate:
@@ -665,12 +847,12 @@ from {{ from_table }}
             result += f" from {from_table}"
         return result
 
-    def hash_id(self) -> str:
+    def hash_id(self, in_jinja: bool = False) -> str:
         if self.parent:
             if self.normalized_stream_name().lower() == self.parent.stream_name.lower():
                 level = len(self.json_path)
-                return self.name_transformer.normalize_column_name(f"_airbyte_{self.normalized_stream_name()}_{level}_hashid")
-        return self.name_transformer.normalize_column_name(f"_airbyte_{self.normalized_stream_name()}_hashid")
+                return self.name_transformer.normalize_column_name(f"_airbyte_{self.normalized_stream_name()}_{level}_hashid", in_jinja)
+        return self.name_transformer.normalize_column_name(f"_airbyte_{self.normalized_stream_name()}_hashid", in_jinja)
 
     # Nested Streams
 
@@ -707,6 +889,14 @@ where {column_name} is not null"""
 # Static Functions
 
 
+@lru_cache(maxsize=None)
+def compile_template(source: str) -> Template:
+    """
+    Templates are compiled once and then rendered for every stream and model
+    """
+    return Template(source)
+
+
 def ref_table(file_name: str) -> str:
     return f"ref('{file_name}')"
 
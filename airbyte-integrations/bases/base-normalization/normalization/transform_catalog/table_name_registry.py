@@ -328,6 +328,21 @@ class TableNameRegistry:
 
         return self.name_transformer.normalize_table_name(f"{file_name}{norm_suffix}", False, truncate, conflict, conflict_solver)
 
+    def get_stream_names(self, schema: str, json_path: List[str]) -> Dict[str, List[str]]:
+        """
+        List the resolved names of the tables (in both intermediate_schema and schema) of the stream at json_path and of its substreams
+        """
+        schema = self.name_transformer.normalize_schema_name(schema, False, False)
+        result = {}
+        for key in self.simple_table_registry:
+            for value in self.simple_table_registry[key]:
+                if value.schema == schema and value.json_path[: len(json_path)] == json_path:
+                    for registry_schema in [value.intermediate_schema, value.schema]:
+                        registry_key = self.get_registry_key(registry_schema, value.json_path, value.stream_name)
+                        resolved = self.registry[registry_key]
+                        result[registry_key] = [resolved.schema, resolved.table_name, resolved.file_name]
+        return result
+
     def to_dict(self, apply_function=(lambda x: x)) -> Dict:
         """
         Converts to a pure dict to serialize as json
@@ -24,8 +24,9 @@
 
 
 import argparse
+import json
 import os
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 import yaml
 from normalization.destination_type import DestinationType
@@ -41,7 +42,9 @@ python3 main_dev_transform_catalog.py \
   --profile-config-dir . \
   --catalog integration_tests/catalog.json \
   --out dir \
-  --json-column json_blob
+  --json-column json_blob \
+  --streams-with-data streams.json \
+  --selectors-file selectors.yml
 ```
     """
 
@@ -61,7 +64,29 @@ python3 main_dev_transform_catalog.py \
         parser.add_argument("--catalog", nargs="+", type=str, required=True, help="path to Catalog (JSON Schema) file")
         parser.add_argument("--out", type=str, required=True, help="path to output generated DBT Models to")
         parser.add_argument("--json-column", type=str, required=False, help="name of the column containing the json blob")
+        parser.add_argument(
+            "--cache-file",
+            type=str,
+            required=False,
+            help="path to the cache of generated DBT Models, it must be kept between runs (e.g. on a persistent volume) to be of any use. "
+            "No cache is used if not set, which is the case of the syncs run by the platform for now",
+        )
+        parser.add_argument("--max-workers", type=int, required=False, help="number of processes generating DBT Models in parallel")
+        parser.add_argument(
+            "--streams-with-data",
+            type=str,
+            required=False,
+            help="path to a JSON list of the streams which received records in the last sync, as objects with a name and a namespace",
+        )
+        parser.add_argument(
+            "--selectors-file",
+            type=str,
+            required=False,
+            help="path to the DBT selectors.yml to write the selector of the streams with data to",
+        )
         parsed_args = parser.parse_args(args)
+        if parsed_args.streams_with_data and not parsed_args.selectors_file:
+            parser.error("--selectors-file is required with --streams-with-data")
         profiles_yml = read_profiles_yml(parsed_args.profile_config_dir)
         self.config = {
             "integration_type": parsed_args.integration_type,
@@ -69,6 +94,10 @@ python3 main_dev_transform_catalog.py \
             "catalog": parsed_args.catalog,
             "output_path": parsed_args.out,
             "json_column": parsed_args.json_column,
+            "cache_file": parsed_args.cache_file,
+            "max_workers": parsed_args.max_workers,
+            "streams_with_data": parsed_args.streams_with_data,
+            "selectors_file": parsed_args.selectors_file,
         }
 
     def process_catalog(self) -> None:
@@ -76,7 +105,14 @@ python3 main_dev_transform_catalog.py \
         schema = self.config["schema"]
         output = self.config["output_path"]
         json_col = self.config["json_column"]
-        processor = CatalogProcessor(output_directory=output, destination_type=destination_type)
+        processor = CatalogProcessor(
+            output_directory=output,
+            destination_type=destination_type,
+            cache_file=self.config["cache_file"],
+            max_workers=self.config["max_workers"],
+            selectors_file=self.config["selectors_file"],
+            streams_with_data=read_streams_with_data(self.config["streams_with_data"]),
+        )
         for catalog_file in self.config["catalog"]:
             print(f"Processing {catalog_file}...")
             processor.process(catalog_file=catalog_file, json_column_name=json_col, default_schema=schema)
@@ -89,6 +125,13 @@ def read_profiles_yml(profile_dir: str) -> Any:
         return obj
 
 
+def read_streams_with_data(streams_file: Optional[str]) -> Optional[List[Dict[str, str]]]:
+    if not streams_file:
+        return None
+    with open(streams_file, "r") as file:
+        return json.load(file)
+
+
 def extract_schema(profiles_yml: Dict) -> str:
     if "dataset" in profiles_yml:
         return str(profiles_yml["dataset"])
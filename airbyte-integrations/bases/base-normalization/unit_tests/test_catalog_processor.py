@@ -0,0 +1,140 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import json
+import os
+
+import pytest
+import yaml
+from normalization.destination_type import DestinationType
+from normalization.transform_catalog.catalog_processor import CatalogProcessor
+
+
+@pytest.fixture(scope="function", autouse=True)
+def before_tests(request):
+    # This makes the test run whether it is executed from the tests folder (with pytest/gradle)
+    # or from the base-normalization folder (through pycharm)
+    unit_tests_dir = os.path.join(request.fspath.dirname, "unit_tests")
+    if os.path.exists(unit_tests_dir):
+        os.chdir(unit_tests_dir)
+    else:
+        os.chdir(request.fspath.dirname)
+    yield
+    os.chdir(request.config.invocation_dir)
+
+
+def read_models(output_directory: str):
+    models = {}
+    for root, _, files in os.walk(output_directory):
+        for file in files:
+            if file.endswith(".sql"):
+                with open(os.path.join(root, file), "r") as f:
+                    models[os.path.relpath(os.path.join(root, file), output_directory)] = f.read()
+    return models
+
+
+def process_catalog(output_directory: str, catalog_file: str, cache_file: str = None, max_workers: int = 1):
+    processor = CatalogProcessor(output_directory, DestinationType.POSTGRES, cache_file=cache_file, max_workers=max_workers)
+    processor.process(catalog_file, "_airbyte_data", "schema_test")
+
+
+@pytest.mark.parametrize("catalog_file", ["nested_catalog", "long_name_truncate_collisions_catalog", "un-nesting_collisions_catalog"])
+def test_parallel_processing(tmp_path, catalog_file: str):
+    catalog_file = f"resources/{catalog_file}.json"
+    process_catalog(str(tmp_path / "serial"), catalog_file, max_workers=1)
+    process_catalog(str(tmp_path / "parallel"), catalog_file, max_workers=2)
+    serial_models = read_models(str(tmp_path / "serial"))
+    assert serial_models
+    assert serial_models == read_models(str(tmp_path / "parallel"))
+
+
+def test_cached_models(tmp_path, capsys):
+    cache_file = str(tmp_path / "cache.json")
+    catalog_file = "resources/un-nesting_collisions_catalog.json"
+    process_catalog(str(tmp_path / "first"), catalog_file, cache_file=cache_file)
+    with open(cache_file, "r") as f:
+        cache = json.load(f)
+    stream_count = len(cache)
+    assert "(0 streams unchanged since the last run)" in capsys.readouterr().out
+
+    process_catalog(str(tmp_path / "second"), catalog_file, cache_file=cache_file)
+    assert f"({stream_count} streams unchanged since the last run)" in capsys.readouterr().out
+    assert read_models(str(tmp_path / "first")) == read_models(str(tmp_path / "second"))
+
+    # a stream whose schema changed is generated again, and the cache only keeps the streams of the last catalog
+    with open(catalog_file, "r") as f:
+        catalog = json.load(f)
+    catalog["streams"][0]["stream"]["json_schema"]["properties"]["new_column"] = {"type": "string"}
+    changed_catalog_file = str(tmp_path / "catalog.json")
+    with open(changed_catalog_file, "w") as f:
+        json.dump(catalog, f)
+    process_catalog(str(tmp_path / "third"), changed_catalog_file, cache_file=cache_file)
+    assert f"({stream_count - 1} streams unchanged since the last run)" in capsys.readouterr().out
+    with open(cache_file, "r") as f:
+        assert len(json.load(f)) == stream_count
+
+
+@pytest.mark.parametrize(
+    "streams_with_data, expected_tags",
+    [
+        ([], []),
+        ([{"name": "unknown_stream"}], []),
+        ([{"name": "simple"}], ["airbyte_stream_simple"]),
+        ([{"name": "simple", "namespace": "namespace"}], ["airbyte_stream_simple"]),
+        ([{"name": "simple", "namespace": "other_namespace"}], []),
+    ],
+)
+def test_streams_with_data_selector(tmp_path, streams_with_data, expected_tags):
+    selectors_file = str(tmp_path / "selectors.yml")
+    processor = CatalogProcessor(
+        str(tmp_path / "models"), DestinationType.POSTGRES, selectors_file=selectors_file, streams_with_data=streams_with_data
+    )
+    processor.process("resources/un-nesting_collisions_catalog.json", "_airbyte_data", "schema_test")
+    with open(selectors_file, "r") as f:
+        selector = yaml.safe_load(f)["selectors"][0]
+    assert selector["name"] == "streams_with_data"
+    if expected_tags:
+        assert selector["definition"] == {"union": [{"method": "tag", "value": tag} for tag in expected_tags]}
+    else:
+        # the selector doesn't match any model
+        assert all(selector["definition"]["value"] not in model for model in read_models(str(tmp_path / "models")).values())
+
+
+def test_nested_streams_share_stream_tag(tmp_path):
+    process_catalog(str(tmp_path), "resources/nested_catalog.json")
+    models = read_models(str(tmp_path))
+    assert len(models) > 4
+    for model in models.values():
+        assert '"airbyte_stream_adcreatives"' in model
+
+
+def test_overwritten_streams_are_always_selected(tmp_path):
+    # the raw tables of streams in overwrite mode are replaced by every sync, even when no records were emitted
+    selectors_file = str(tmp_path / "selectors.yml")
+    processor = CatalogProcessor(str(tmp_path / "models"), DestinationType.POSTGRES, selectors_file=selectors_file, streams_with_data=[])
+    processor.process("resources/nested_catalog.json", "_airbyte_data", "schema_test")
+    with open(selectors_file, "r") as f:
+        selector = yaml.safe_load(f)["selectors"][0]
+    assert selector["definition"] == {"union": [{"method": "tag", "value": "airbyte_stream_adcreatives"}]}
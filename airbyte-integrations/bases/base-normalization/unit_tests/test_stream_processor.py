@@ -118,3 +118,105 @@ def test_primary_key(
     except ValueError as e:
         if not expecting_exception:
             raise e
+
+
+@pytest.mark.parametrize(
+    "destination_sync_mode, expected_outputs, expected_filtered_model",
+    [
+        (
+            DestinationSyncMode.overwrite,
+            ["airbyte_tables/schema_name/test_stream.sql", "airbyte_tables/schema_name/test_stream_child.sql"],
+            None,
+        ),
+        (
+            DestinationSyncMode.append,
+            ["airbyte_incremental/schema_name/test_stream.sql", "airbyte_incremental/schema_name/test_stream_child.sql"],
+            "test_stream",
+        ),
+        (
+            DestinationSyncMode.append_dedup,
+            [
+                "airbyte_incremental/schema_name/test_stream_ab4.sql",
+                "airbyte_incremental/schema_name/test_stream_scd.sql",
+                "airbyte_incremental/schema_name/test_stream.sql",
+                "airbyte_tables/schema_name/test_stream_child.sql",
+            ],
+            "test_stream_ab4",
+        ),
+    ],
+)
+def test_incremental_models(destination_sync_mode: DestinationSyncMode, expected_outputs: List[str], expected_filtered_model: str):
+    tables_registry = TableNameRegistry(DestinationType.POSTGRES)
+    stream_processor = StreamProcessor.create(
+        stream_name="test_stream",
+        destination_type=DestinationType.POSTGRES,
+        raw_schema="raw_schema",
+        schema="schema_name",
+        source_sync_mode=SyncMode.incremental,
+        destination_sync_mode=destination_sync_mode,
+        cursor_field=["updated_at"],
+        primary_key=[["id"]],
+        json_column_name="_airbyte_data",
+        properties={"id": {"type": "integer"}, "updated_at": {"type": "string"}, "child": {"type": "object", "properties": {"a": {}}}},
+        tables_registry=tables_registry,
+        from_table="source('schema_name', '_airbyte_raw_test_stream')",
+    )
+    stream_processor.collect_table_names()
+    tables_registry.resolve_names()
+
+    children = stream_processor.process()
+    for child in children:
+        child.process()
+    outputs = {**stream_processor.sql_outputs, **children[0].sql_outputs}
+
+    assert all(output in outputs for output in expected_outputs)
+    parsing_model = outputs["airbyte_ctes/schema_name/test_stream_ab1.sql"]
+    child_parsing_model = outputs["airbyte_ctes/schema_name/test_stream_child_ab1.sql"]
+    if expected_filtered_model:
+        assert f"where {{{{ incremental_filter('{expected_filtered_model}') }}}}" in parsing_model
+    else:
+        assert "incremental_filter" not in parsing_model
+    if destination_sync_mode == DestinationSyncMode.append:
+        assert "and {{ incremental_filter('test_stream_child') }}" in child_parsing_model
+    else:
+        assert "incremental_filter" not in child_parsing_model
+    if destination_sync_mode == DestinationSyncMode.append_dedup:
+        assert "unique_key='_airbyte_test_stream_hashid'" in outputs["airbyte_incremental/schema_name/test_stream_ab4.sql"]
+        scd_model = outputs["airbyte_incremental/schema_name/test_stream_scd.sql"]
+        assert "unique_key='_airbyte_test_stream_hashid'" in scd_model
+        assert "where {{ incremental_filter('test_stream_scd') }}" in scd_model
+        assert "{{ dbt_utils.surrogate_key([adapter.quote('id')]) }} as _airbyte_unique_key" in scd_model
+        final_model = outputs["airbyte_incremental/schema_name/test_stream.sql"]
+        assert "unique_key='_airbyte_unique_key'" in final_model
+        assert "where {{ incremental_filter('test_stream') }}" in final_model
+        assert "post_hook" not in final_model
+
+
+def test_cdc_deletions_are_removed_from_incremental_final_table():
+    tables_registry = TableNameRegistry(DestinationType.POSTGRES)
+    stream_processor = StreamProcessor.create(
+        stream_name="test_stream",
+        destination_type=DestinationType.POSTGRES,
+        raw_schema="raw_schema",
+        schema="schema_name",
+        source_sync_mode=SyncMode.incremental,
+        destination_sync_mode=DestinationSyncMode.append_dedup,
+        cursor_field=["_ab_cdc_lsn"],
+        primary_key=[["id"], ["_ab_cdc_lsn"]],
+        json_column_name="_airbyte_data",
+        properties={"id": {"type": "integer"}, "_ab_cdc_lsn": {"type": "number"}, "_ab_cdc_deleted_at": {"type": "string"}},
+        tables_registry=tables_registry,
+        from_table="source('schema_name', '_airbyte_raw_test_stream')",
+    )
+    stream_processor.collect_table_names()
+    tables_registry.resolve_names()
+
+    stream_processor.process()
+
+    final_model = stream_processor.sql_outputs["airbyte_incremental/schema_name/test_stream.sql"]
+    assert (
+        'post_hook="delete from {{ this }} where _airbyte_unique_key in (select _airbyte_unique_key '
+        "from {{ ref('test_stream_scd') }} where _airbyte_end_at is null and _ab_cdc_deleted_at is not null)\"" in final_model
+    )
+    scd_model = stream_processor.sql_outputs["airbyte_incremental/schema_name/test_stream_scd.sql"]
+    assert "{{ dbt_utils.surrogate_key([adapter.quote('id'), '_ab_cdc_lsn']) }} as _airbyte_unique_key" in scd_model
@@ -25,7 +25,7 @@
 
 from setuptools import find_packages, setup
 
-MAIN_REQUIREMENTS = ["airbyte-cdk~=0.1.12", "requests_oauthlib~=1.3.0", "pytz~=2021.1", "pendulum~=1.5.1"]
+MAIN_REQUIREMENTS = ["airbyte-cdk~=0.1.19", "requests_oauthlib~=1.3.0", "pytz~=2021.1", "pendulum~=1.5.1"]
 
 TEST_REQUIREMENTS = [
     "pytest~=6.1",
@@ -29,6 +29,7 @@ from airbyte_cdk.logger import AirbyteLogger
 from airbyte_cdk.models import ConnectorSpecification
 from airbyte_cdk.sources import AbstractSource
 from airbyte_cdk.sources.streams import Stream
+from airbyte_cdk.sources.streams.http import TokenBucketRateLimiter
 from airbyte_cdk.sources.streams.http.auth import Oauth2Authenticator
 
 from .spec import AmazonAdsConfig
@@ -54,6 +55,9 @@ from .streams import (
 
 # Oauth 2.0 authentication URL for amazon
 TOKEN_URL = "https://api.amazon.com/auth/o2/token"
+# Amazon Ads doesn't publish its rate limits, this budget is shared by all the
+# streams, including the report dates read in parallel.
+MAX_REQUESTS_PER_SECOND = 10
 
 
 class SourceAmazonAds(AbstractSource):
@@ -79,7 +83,8 @@ class SourceAmazonAds(AbstractSource):
         """
         config = AmazonAdsConfig(**config)
         auth = self._make_authenticator(config)
-        stream_args = {"config": config, "authenticator": auth}
+        rate_limiter = TokenBucketRateLimiter(max_requests=MAX_REQUESTS_PER_SECOND, burst=MAX_REQUESTS_PER_SECOND)
+        stream_args = {"config": config, "authenticator": auth, "rate_limiter": rate_limiter}
         # All data for individual Amazon Ads stream divided into sets of data for
         # each profile. Every API request except profiles has required
         # paramater passed over "Amazon-Advertising-API-Scope" http header and
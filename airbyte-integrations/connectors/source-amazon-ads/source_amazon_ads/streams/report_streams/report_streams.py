@@ -25,6 +25,7 @@
 import json
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
@@ -39,8 +40,10 @@ import pytz
 import requests
 from airbyte_cdk.logger import AirbyteLogger
 from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams.http import TokenBucketRateLimiter
 from airbyte_cdk.sources.streams.http.auth import Oauth2Authenticator
 from pydantic import BaseModel
+from requests.adapters import HTTPAdapter
 from source_amazon_ads.schemas import CatalogModel, MetricsReport, Profile
 from source_amazon_ads.spec import AmazonAdsConfig
 from source_amazon_ads.streams.common import BasicAmazonAdsStream
@@ -88,10 +91,24 @@ class TooManyRequests(Exception):
 class ReportStream(BasicAmazonAdsStream, ABC):
     """
     Common base class for report streams
+
+    Reports of several dates are generated at the same time: each date is a
+    stream slice and the slices are read in parallel (see max_concurrent_slices),
+    while records and state are still output date after date. Requests of all
+    the slices go through the same pool of connections and are paced by the
+    rate limiter shared by the streams of the source.
     """
 
     primary_key = None
     CHECK_INTERVAL_SECONDS = 30
+    # The interval between two status checks is doubled after every check, up
+    # to this value, as most reports take a few minutes to be generated.
+    MAX_CHECK_INTERVAL_SECONDS = 240
+    # Number of report dates whose reports are generated at the same time.
+    MAX_CONCURRENT_REPORT_DATES = 10
+    # Number of status checks and report downloads running at the same time
+    # for each report date.
+    MAX_CONCURRENT_REQUESTS = 5
     # Async report generation time is 15 minutes according to docs:
     # https://advertising.amazon.com/API/docs/en-us/get-started/developer-notes
     # (Service limits section)
@@ -100,9 +117,20 @@ class ReportStream(BasicAmazonAdsStream, ABC):
     REPORT_DATE_FORMAT = "%Y%m%d"
     cursor_field = "reportDate"
 
-    def __init__(self, config: AmazonAdsConfig, profiles: List[Profile], authenticator: Oauth2Authenticator):
+    def __init__(
+        self,
+        config: AmazonAdsConfig,
+        profiles: List[Profile],
+        authenticator: Oauth2Authenticator,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
+    ):
         self._authenticator = authenticator
+        self._rate_limiter = rate_limiter
         self._session = requests.Session()
+        # Keep a connection open for every request the slices read in parallel can send at the same time.
+        adapter = HTTPAdapter(pool_maxsize=self.MAX_CONCURRENT_REPORT_DATES * self.MAX_CONCURRENT_REQUESTS)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
         self._model = self._generate_model()
         # Set start date from config file, should be in UTC timezone.
         self._start_date = pendulum.parse(config.start_date).set(tz="UTC") if config.start_date else None
@@ -112,6 +140,10 @@ class ReportStream(BasicAmazonAdsStream, ABC):
     def model(self) -> CatalogModel:
         return self._model
 
+    @property
+    def max_concurrent_slices(self) -> int:
+        return self.MAX_CONCURRENT_REPORT_DATES
+
     def read_records(
         self,
         sync_mode: SyncMode,
@@ -125,7 +157,9 @@ class ReportStream(BasicAmazonAdsStream, ABC):
         generation works in async way: First we need to initiate creating report
         for specific profile/record type/date and then constantly check for report
         generation status - when it will have "SUCCESS" status then download the
-        report and parse result.
+        report and parse result. Statuses of all pending reports are checked at
+        once, and completed reports are downloaded in the background while the
+        others are still being generated.
         """
 
         if not stream_slice:
@@ -143,32 +177,43 @@ class ReportStream(BasicAmazonAdsStream, ABC):
         # hung forever. Store timepoint when report generation has started to
         # check if it takes to long to break a loop.
         start_time_point = datetime.now()
-        while report_infos and datetime.now() <= start_time_point + self.REPORT_WAIT_TIMEOUT:
-            completed_reports = []
-            logger.info(f"Checking report status, {len(report_infos)} report(s) remained")
-            for report_info in report_infos:
-                report_status, download_url = self._check_status(report_info)
-                if report_status == Status.FAILURE:
-                    raise Exception(f"Report for {report_info.profile_id} with {report_info.record_type} type generation failed")
-                elif report_status == Status.SUCCESS:
-                    metric_objects = self._download_report(report_info, download_url)
-                    for metric_object in metric_objects:
-                        yield self._model(
-                            profileId=report_info.profile_id,
-                            recordType=report_info.record_type,
-                            reportDate=report_date,
-                            metric=metric_object,
-                        ).dict()
-                    completed_reports.append(report_info)
-            for completed_report in completed_reports:
-                report_infos.remove(completed_report)
+        check_interval = self.CHECK_INTERVAL_SECONDS
+        # Downloads of completed reports, their records are output in the order
+        # the reports completed.
+        downloads = []
+        with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_REQUESTS) as executor:
+            while report_infos and datetime.now() <= start_time_point + self.REPORT_WAIT_TIMEOUT:
+                logger.info(f"Checking report status, {len(report_infos)} report(s) remained")
+                report_statuses = list(executor.map(self._check_status, report_infos))
+                pending_reports = []
+                for report_info, (report_status, download_url) in zip(report_infos, report_statuses):
+                    if report_status == Status.FAILURE:
+                        raise Exception(f"Report for {report_info.profile_id} with {report_info.record_type} type generation failed")
+                    elif report_status == Status.SUCCESS:
+                        downloads.append((report_info, executor.submit(self._download_report, report_info, download_url)))
+                    else:
+                        pending_reports.append(report_info)
+                report_infos = pending_reports
+                while downloads and downloads[0][1].done():
+                    yield from self._report_records(report_date, *downloads.pop(0))
+                if report_infos:
+                    logger.info(f"{len(report_infos)} report(s) remained, taking {check_interval} seconds timeout")
+                    time.sleep(check_interval)
+                    check_interval = min(check_interval * 2, self.MAX_CHECK_INTERVAL_SECONDS)
             if report_infos:
-                logger.info(f"{len(report_infos)} report(s) remained, taking {self.CHECK_INTERVAL_SECONDS} seconds timeout")
-                time.sleep(self.CHECK_INTERVAL_SECONDS)
-        if not report_infos:
-            logger.info("All reports have been processed")
-        else:
-            raise Exception("Not all reports has been processed due to timeout")
+                raise Exception("Not all reports has been processed due to timeout")
+            for report_info, download in downloads:
+                yield from self._report_records(report_date, report_info, download)
+        logger.info("All reports have been processed")
+
+    def _report_records(self, report_date: str, report_info: ReportInfo, download: Future) -> Iterable[Mapping[str, Any]]:
+        for metric_object in download.result():
+            yield self._model(
+                profileId=report_info.profile_id,
+                recordType=report_info.record_type,
+                reportDate=report_date,
+                metric=metric_object,
+            ).dict()
 
     def _generate_model(self):
         """
@@ -223,12 +268,16 @@ class ReportStream(BasicAmazonAdsStream, ABC):
     )
     def _send_http_request(self, url: str, profile_id: int, json: dict = None):
         headers = self._get_auth_headers(profile_id)
-        if json:
-            response = self._session.post(url, headers=headers, json=json)
-        else:
-            response = self._session.get(url, headers=headers)
+        request = self._session.prepare_request(requests.Request("POST" if json else "GET", url, headers=headers, json=json))
+        if self._rate_limiter:
+            self._rate_limiter.acquire(request)
+        response = self._session.send(request)
         if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+            if self._rate_limiter:
+                self._rate_limiter.on_retry(request)
             raise TooManyRequests()
+        if self._rate_limiter:
+            self._rate_limiter.on_success(request)
         return response
 
     @staticmethod
@@ -271,6 +271,53 @@ def test_display_report_stream_timeout(mocker, test_config):
         time_mock.assert_called_with(30)
 
 
+@responses.activate
+def test_display_report_stream_backoff(mocker, test_config):
+    time_mock = mock.MagicMock()
+    mocker.patch("time.sleep", time_mock)
+    setup_responses(init_response=REPORT_INIT_RESPONSE, metric_response=METRIC_RESPONSE)
+    config = AmazonAdsConfig(**test_config)
+    stream = SponsoredDisplayReportStream(config, make_profiles(), authenticator=mock.MagicMock())
+    stream.MAX_CHECK_INTERVAL_SECONDS = 100
+    checks_before_success = 4 * len(stream.metrics_map)
+
+    class StatusCallback:
+        count: int = 0
+
+        def __call__(self, request):
+            self.count += 1
+            if self.count > checks_before_success:
+                return (200, {}, REPORT_STATUS_RESPONSE)
+            return (200, {}, REPORT_STATUS_RESPONSE.replace("SUCCESS", "IN_PROGRESS"))
+
+    responses.add_callback(responses.GET, re.compile(r"https://advertising-api.amazon.com/v2/reports/[^/]+$"), callback=StatusCallback())
+
+    metrics = list(stream.read_records(SyncMode.incremental, stream_slice={"reportDate": "20210725"}))
+
+    assert len(metrics) == METRICS_COUNT * len(stream.metrics_map)
+    # all reports are checked at every poll, waiting longer and longer in between
+    assert [call.args[0] for call in time_mock.call_args_list] == [30, 60, 100, 100]
+    assert stream.max_concurrent_slices == stream.MAX_CONCURRENT_REPORT_DATES
+
+
+@responses.activate
+def test_display_report_stream_shares_rate_limiter(test_config):
+    setup_responses(init_response=REPORT_INIT_RESPONSE, status_response=REPORT_STATUS_RESPONSE, metric_response=METRIC_RESPONSE)
+    config = AmazonAdsConfig(**test_config)
+    rate_limiter = mock.MagicMock()
+    streams = [
+        SponsoredDisplayReportStream(config, make_profiles(), authenticator=mock.MagicMock(), rate_limiter=rate_limiter),
+        SponsoredProductsReportStream(config, make_profiles(), authenticator=mock.MagicMock(), rate_limiter=rate_limiter),
+    ]
+
+    list(streams[0].read_records(SyncMode.incremental, stream_slice={"reportDate": "20210725"}))
+
+    # every report is initiated, checked and downloaded once
+    assert rate_limiter.acquire.call_count == len(responses.calls) == 3 * len(streams[0].metrics_map)
+    adapter = streams[1]._session.get_adapter("https://advertising-api.amazon.com")
+    assert adapter._pool_maxsize == streams[1].MAX_CONCURRENT_REPORT_DATES * streams[1].MAX_CONCURRENT_REQUESTS
+
+
 @freeze_time("2021-07-30 04:26:08")
 @responses.activate
 def test_display_report_stream_slices_full_refresh(test_config):
@@ -26,6 +26,7 @@ import time
 import urllib.parse as urlparse
 from abc import ABC
 from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Sequence
 
@@ -271,6 +272,122 @@ class Campaigns(FBMarketingIncrementalStream):
         return self._api.account.get_campaigns(params=params)
 
 
+class InsightsJob:
+    """Async job (AdReportRun) of an insights stream, along with the fetching of its result once it completed"""
+
+    def __init__(self, report_run: AdReportRun):
+        self.report_run = report_run
+        self.start_time = pendulum.now()
+        self.result: Optional[Future] = None
+
+    def get_result(self) -> Iterator[Mapping[str, Any]]:
+        """Waits for the first page of the result of the job to be fetched and returns the records of the job"""
+        return self.result.result()
+
+
+class InsightsJobPool:
+    """Runs the async jobs of an insights stream, keeping up to `max_running_jobs` of them running at the same time.
+
+    The statuses of all running jobs are checked at once with a batch request, a new job is started as soon as one completes and
+    the first page of the result of completed jobs is fetched in the background. Jobs are still output in the order they were scheduled in, so
+    that the state of the stream is committed date after date.
+    """
+
+    def __init__(self, stream: "AdsInsights", max_running_jobs: int, max_jobs_ahead: int):
+        """
+        :param stream: stream creating the jobs and fetching their results
+        :param max_running_jobs: maximum number of jobs running at the same time
+        :param max_jobs_ahead: maximum number of jobs which are running or whose result is kept until earlier jobs are output
+        """
+        self._stream = stream
+        self._max_running_jobs = max_running_jobs
+        self._max_jobs_ahead = max(max_jobs_ahead, max_running_jobs)
+
+    def run(self, jobs_params: Iterable[Mapping[str, Any]]) -> Iterator[InsightsJob]:
+        """Starts a job for each of the params and yields the jobs in the same order, once they completed"""
+        jobs_params = iter(jobs_params)
+        jobs = deque()
+        sleep_seconds = 0
+        with ThreadPoolExecutor(max_workers=self._max_running_jobs) as executor:
+            while True:
+                running_jobs = [job for job in jobs if job.result is None]
+                while len(running_jobs) < self._max_running_jobs and len(jobs) < self._max_jobs_ahead:
+                    params = next(jobs_params, None)
+                    if params is None:
+                        break
+                    job = InsightsJob(self._stream._create_insights_job(params))
+                    jobs.append(job)
+                    running_jobs.append(job)
+
+                completed_jobs = 0
+                while jobs and jobs[0].result is not None:
+                    yield jobs.popleft()
+                    completed_jobs += 1
+                if not running_jobs:
+                    if completed_jobs:
+                        # jobs may not have been started because of the completed ones waiting to be output
+                        continue
+                    return
+
+                if sleep_seconds:
+                    self._stream.logger.info(
+                        f"Sleeping {sleep_seconds} seconds while waiting for {len(running_jobs)} AdReportRun(s) to complete"
+                    )
+                    time.sleep(sleep_seconds)
+                if self._update_jobs(running_jobs, executor):
+                    sleep_seconds = 0
+                else:
+                    sleep_seconds = min(max(sleep_seconds * 2, 2), self._stream.MAX_ASYNC_SLEEP.in_seconds())
+
+    def _update_jobs(self, running_jobs: List[InsightsJob], executor: ThreadPoolExecutor) -> bool:
+        """Updates the status of the running jobs and starts fetching the results of completed ones. Returns whether any completed."""
+        requests = [job.report_run.api_get(pending=True) for job in running_jobs]
+        responses = []
+        for requests_batch in batch(requests, size=self._stream.batch_size):
+            responses.extend(self._get_statuses(requests_batch))
+
+        any_completed = False
+        for job, response in zip(running_jobs, responses):
+            job.report_run._set_data(response)
+            if self._check_status(job):
+                job.result = executor.submit(self._stream._fetch_job_result, job.report_run)
+                any_completed = True
+        return any_completed
+
+    @retry_pattern(backoff.expo, FacebookAPIException, max_tries=5, factor=5)
+    def _get_statuses(self, requests: Sequence[FacebookRequest]) -> Sequence[MutableMapping[str, Any]]:
+        """Checks the status of jobs with a batch request. Errors returned by the API are retried by `execute_in_batch` according to the
+        backoff policy, requests that the batch failed to send (e.g. on connection errors) are retried here.
+        """
+        return self._stream.execute_in_batch(requests)
+
+    def _check_status(self, job: InsightsJob) -> bool:
+        """Returns whether the job completed, raises if it failed or took too long"""
+        report_run = job.report_run
+        job_progress_pct = report_run["async_percent_completion"]
+        self._stream.logger.info(f"ReportRunId {report_run['report_run_id']} is {job_progress_pct}% complete")
+        runtime = pendulum.now() - job.start_time
+
+        if report_run["async_status"] == "Job Completed":
+            return True
+        elif report_run["async_status"] == "Job Failed":
+            raise JobTimeoutException(f"AdReportRun {report_run} failed after {runtime.in_seconds()} seconds.")
+        elif report_run["async_status"] == "Job Skipped":
+            raise JobTimeoutException(f"AdReportRun {report_run} skipped after {runtime.in_seconds()} seconds.")
+
+        if runtime > self._stream.MAX_WAIT_TO_START and job_progress_pct == 0:
+            raise JobTimeoutException(
+                f"AdReportRun {report_run} did not start after {runtime.in_seconds()} seconds."
+                f" This is an intermittent error which may be fixed by retrying the job. Aborting."
+            )
+        elif runtime > self._stream.MAX_WAIT_TO_FINISH:
+            raise JobTimeoutException(
+                f"AdReportRun {report_run} did not finish after {runtime.in_seconds()} seconds."
+                f" This is an intermittent error which may be fixed by retrying the job. Aborting."
+            )
+        return False
+
+
 class AdsInsights(FBMarketingIncrementalStream):
     """doc: https://developers.facebook.com/docs/marketing-api/insights"""
 
@@ -296,12 +413,15 @@ class AdsInsights(FBMarketingIncrementalStream):
     MAX_WAIT_TO_FINISH = pendulum.duration(minutes=30)
     MAX_ASYNC_SLEEP = pendulum.duration(minutes=5)
     MAX_ASYNC_JOBS = 3
+    # completed jobs whose first page of result is kept in memory until the jobs of earlier dates complete, plus running jobs
+    MAX_JOBS_AHEAD = 10
     INSIGHTS_RETENTION_PERIOD = pendulum.duration(days=37 * 30)
 
     action_breakdowns = ALL_ACTION_BREAKDOWNS
     level = "ad"
     action_attribution_windows = ALL_ACTION_ATTRIBUTION_WINDOWS
     time_increment = 1
+    batch_size = 50
 
     breakdowns = []
 
@@ -317,12 +437,9 @@ class AdsInsights(FBMarketingIncrementalStream):
         stream_slice: Mapping[str, Any] = None,
         stream_state: Mapping[str, Any] = None,
     ) -> Iterable[Mapping[str, Any]]:
-        """Waits for current job to finish (slice) and yield its result"""
-        result = self.wait_for_job(stream_slice["job"])
+        """Yields the result of the job of the slice, fetched by the job pool"""
         # because we query `lookback_window` days before actual cursor we might get records older then cursor
-
-        for obj in result.get_result():
-            yield obj.export_all_data()
+        yield from stream_slice["job"].get_result()
 
     def stream_slices(self, stream_state: Mapping[str, Any] = None, **kwargs) -> Iterable[Optional[Mapping[str, Any]]]:
         """Slice by date periods and schedule async job for each period, run at most MAX_ASYNC_JOBS jobs at the same time.
@@ -330,53 +447,20 @@ class AdsInsights(FBMarketingIncrementalStream):
         1. we should commit state after each successful job
         2. we should run as many job as possible before checking for result
         3. we shouldn't proceed to consumption of the next job before previous succeed
+        Jobs are run by InsightsJobPool, which yields them in date order once they completed.
         """
         stream_state = stream_state or {}
-        running_jobs = deque()
-        date_ranges = list(self._date_ranges(stream_state=stream_state))
-        for params in date_ranges:
-            params = deep_merge(params, self.request_params(stream_state=stream_state))
-            job = self._create_insights_job(params)
-            running_jobs.append(job)
-            if len(running_jobs) >= self.MAX_ASYNC_JOBS:
-                yield {"job": running_jobs.popleft()}
-
-        while running_jobs:
-            yield {"job": running_jobs.popleft()}
+        jobs_params = (deep_merge(params, self.request_params(stream_state=stream_state)) for params in self._date_ranges(stream_state))
+        job_pool = InsightsJobPool(self, max_running_jobs=self.MAX_ASYNC_JOBS, max_jobs_ahead=self.MAX_JOBS_AHEAD)
+        for job in job_pool.run(jobs_params):
+            yield {"job": job}
 
     @backoff_policy
-    def wait_for_job(self, job) -> AdReportRun:
-        factor = 2
-        start_time = pendulum.now()
-        sleep_seconds = factor
-        while True:
-            job = job.api_get()
-            job_progress_pct = job["async_percent_completion"]
-            job_id = job["report_run_id"]
-            self.logger.info(f"ReportRunId {job_id} is {job_progress_pct}% complete")
-            runtime = pendulum.now() - start_time
-
-            if job["async_status"] == "Job Completed":
-                return job
-            elif job["async_status"] == "Job Failed":
-                raise JobTimeoutException(f"AdReportRun {job} failed after {runtime.in_seconds()} seconds.")
-            elif job["async_status"] == "Job Skipped":
-                raise JobTimeoutException(f"AdReportRun {job} skipped after {runtime.in_seconds()} seconds.")
-
-            if runtime > self.MAX_WAIT_TO_START and job_progress_pct == 0:
-                raise JobTimeoutException(
-                    f"AdReportRun {job} did not start after {runtime.in_seconds()} seconds."
-                    f" This is an intermittent error which may be fixed by retrying the job. Aborting."
-                )
-            elif runtime > self.MAX_WAIT_TO_FINISH:
-                raise JobTimeoutException(
-                    f"AdReportRun {job} did not finish after {runtime.in_seconds()} seconds."
-                    f" This is an intermittent error which may be fixed by retrying the job. Aborting."
-                )
-            self.logger.info(f"Sleeping {sleep_seconds} seconds while waiting for AdReportRun: {job_id} to complete")
-            time.sleep(sleep_seconds)
-            if sleep_seconds < self.MAX_ASYNC_SLEEP.in_seconds():
-                sleep_seconds *= factor
+    def _fetch_job_result(self, report_run: AdReportRun) -> Iterator[Mapping[str, Any]]:
+        """Fetches the first page of the result of a completed job, its next pages are only fetched while its records are read"""
+        cursor = report_run.get_result()
+        cursor.load_next_page()
+        return (obj.export_all_data() for obj in cursor)
 
     def request_params(self, stream_state: Mapping[str, Any], **kwargs) -> MutableMapping[str, Any]:
         params = super().request_params(stream_state=stream_state, **kwargs)
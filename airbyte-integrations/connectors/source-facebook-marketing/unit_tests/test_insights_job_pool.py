@@ -0,0 +1,197 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import json
+from typing import List
+from unittest.mock import Mock
+
+import pendulum
+import pytest
+from facebook_business.exceptions import FacebookRequestError
+from source_facebook_marketing.common import JobTimeoutException
+from source_facebook_marketing.streams import AdsInsights, InsightsJobPool
+
+
+class FakeReportRun(dict):
+    """AdReportRun completing after being checked `checks_to_complete` times"""
+
+    def __init__(self, report_run_id: int, checks_to_complete: int):
+        super().__init__(report_run_id=report_run_id, async_status="Job Running", async_percent_completion=0)
+        self.checks_to_complete = checks_to_complete
+
+    def api_get(self, pending: bool):
+        return self
+
+    def _set_data(self, data):
+        self.update(data)
+
+
+@pytest.fixture(name="stream")
+def stream_fixture(mocker):
+    mocker.patch("time.sleep")
+    stream = mocker.Mock(
+        spec=AdsInsights,
+        batch_size=50,
+        MAX_WAIT_TO_START=AdsInsights.MAX_WAIT_TO_START,
+        MAX_WAIT_TO_FINISH=AdsInsights.MAX_WAIT_TO_FINISH,
+        MAX_ASYNC_SLEEP=AdsInsights.MAX_ASYNC_SLEEP,
+    )
+    stream.batches = []
+
+    def execute_in_batch(report_runs):
+        stream.batches.append([report_run["report_run_id"] for report_run in report_runs])
+        responses = []
+        for report_run in report_runs:
+            report_run.checks_to_complete -= 1
+            if report_run.checks_to_complete:
+                responses.append({"async_status": "Job Running", "async_percent_completion": 50})
+            else:
+                responses.append({"async_status": "Job Completed", "async_percent_completion": 100})
+        return responses
+
+    stream.execute_in_batch.side_effect = execute_in_batch
+    stream._create_insights_job.side_effect = lambda params: FakeReportRun(params["id"], params["checks"])
+    stream._fetch_job_result.side_effect = lambda report_run: [{"report_run_id": report_run["report_run_id"]}]
+    return stream
+
+
+def test_jobs_are_output_in_order(stream):
+    jobs_params = [{"id": 1, "checks": 3}, {"id": 2, "checks": 1}, {"id": 3, "checks": 1}, {"id": 4, "checks": 1}]
+    job_pool = InsightsJobPool(stream, max_running_jobs=2, max_jobs_ahead=10)
+
+    results = [job.get_result() for job in job_pool.run(jobs_params)]
+
+    assert results == [[{"report_run_id": report_run_id}] for report_run_id in (1, 2, 3, 4)]
+    # all running jobs are checked at once, and a new job is started as soon as one completed
+    assert stream.batches == [[1, 2], [1, 3], [1, 4]]
+
+
+def test_jobs_ahead_are_limited(stream):
+    jobs_params = [{"id": 1, "checks": 3}, {"id": 2, "checks": 1}, {"id": 3, "checks": 1}, {"id": 4, "checks": 1}]
+    job_pool = InsightsJobPool(stream, max_running_jobs=2, max_jobs_ahead=2)
+
+    assert [job.report_run["report_run_id"] for job in job_pool.run(jobs_params)] == [1, 2, 3, 4]
+    # the second job completed first, no other job is started until the first one completed
+    assert stream.batches == [[1, 2], [1], [1], [3, 4]]
+
+
+def test_failed_job(stream):
+    def execute_in_batch(report_runs):
+        return [{"async_status": "Job Failed", "async_percent_completion": 10} for _ in report_runs]
+
+    stream.execute_in_batch.side_effect = execute_in_batch
+    job_pool = InsightsJobPool(stream, max_running_jobs=2, max_jobs_ahead=10)
+
+    with pytest.raises(JobTimeoutException, match="failed"):
+        list(job_pool.run([{"id": 1, "checks": 1}]))
+
+
+def test_job_not_started(stream):
+    def execute_in_batch(report_runs):
+        return [{"async_status": "Job Not Started", "async_percent_completion": 0} for _ in report_runs]
+
+    stream.execute_in_batch.side_effect = execute_in_batch
+    stream.MAX_WAIT_TO_START = pendulum.duration(seconds=-1)
+    job_pool = InsightsJobPool(stream, max_running_jobs=2, max_jobs_ahead=10)
+
+    with pytest.raises(JobTimeoutException, match="did not start"):
+        list(job_pool.run([{"id": 1, "checks": 1}]))
+
+
+class FakeBatch:
+    """FacebookAdsApiBatch completing the report runs, its first execution in a test fails with `first_failure`"""
+
+    def __init__(self, first_failure: str, executions: List[int]):
+        self.first_failure = first_failure
+        self.executions = executions
+        self.requests = []
+
+    def __len__(self):
+        return len(self.requests)
+
+    def add_request(self, request, success, failure):
+        self.requests.append((success, failure))
+
+    def execute(self):
+        self.executions.append(1)
+        if len(self.executions) == 1 and self.first_failure == "not_sent":
+            return self
+        for success, failure in self.requests:
+            if len(self.executions) == 1 and self.first_failure == "rate_limit":
+                body = json.dumps({"error": {"code": 17, "message": "User request limit reached"}})
+                failure(Mock(error=Mock(return_value=FacebookRequestError("Call failed", {}, 400, {}, body))))
+            else:
+                success(Mock(json=Mock(return_value={"async_status": "Job Completed", "async_percent_completion": 100})))
+        return None
+
+
+@pytest.mark.parametrize("first_failure", ["rate_limit", "not_sent"])
+def test_status_check_is_retried(stream, mocker, first_failure):
+    """The first status check fails transiently, it is retried and the jobs still complete"""
+    executions = []
+    stream._api = mocker.Mock()
+    stream._api.api.new_batch.side_effect = lambda: FakeBatch(first_failure, executions)
+    stream.execute_in_batch.side_effect = lambda requests: AdsInsights.execute_in_batch(stream, requests)
+    job_pool = InsightsJobPool(stream, max_running_jobs=2, max_jobs_ahead=10)
+
+    results = [job.get_result() for job in job_pool.run([{"id": 1, "checks": 1}, {"id": 2, "checks": 1}])]
+
+    assert results == [[{"report_run_id": 1}], [{"report_run_id": 2}]]
+    assert len(executions) == 2
+
+
+class FakeCursor:
+    """Cursor over the result of a job, loading one page at a time"""
+
+    def __init__(self, pages: List[List[dict]]):
+        self.pages = pages
+        self.loaded_pages = 0
+        self._queue = []
+
+    def load_next_page(self) -> bool:
+        if self.loaded_pages == len(self.pages):
+            return False
+        self._queue = [Mock(export_all_data=Mock(return_value=record)) for record in self.pages[self.loaded_pages]]
+        self.loaded_pages += 1
+        return True
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if not self._queue and not self.load_next_page():
+            raise StopIteration()
+        return self._queue.pop(0)
+
+
+def test_job_result_is_fetched_page_by_page(mocker):
+    cursor = FakeCursor([[{"id": 1}, {"id": 2}], [{"id": 3}]])
+    report_run = mocker.Mock(get_result=mocker.Mock(return_value=cursor))
+
+    records = AdsInsights._fetch_job_result(mocker.Mock(), report_run)
+
+    # only the first page is kept in memory until the records of the job are read
+    assert cursor.loaded_pages == 1
+    assert list(records) == [{"id": 1}, {"id": 2}, {"id": 3}]
+    assert cursor.loaded_pages == 2
@@ -23,6 +23,8 @@
 #
 
 
+import io
+import json
 from pathlib import Path
 
 import pytest
@@ -51,6 +53,7 @@ def check_read(config, expected_columns=10, expected_rows=42):
         ("excel", "xlsx", 8, 50, "demo"),
         ("feather", "feather", 9, 3, "demo"),
         ("parquet", "parquet", 9, 3, "demo"),
+        ("orc", "orc", 12, 2, "demo"),
     ],
 )
 def test_local_file_read(file_format, extension, expected_columns, expected_rows, filename):
@@ -60,6 +63,41 @@ def test_local_file_read(file_format, extension, expected_columns, expected_rows
     check_read(configs, expected_columns, expected_rows)
 
 
+@pytest.mark.parametrize("read_size", [1, 7, 1024])
+def test_json_array_read(tmp_path, monkeypatch, read_size):
+    records = [{"id": i, "value": -i * 1.5e3, "text": f"a, ]\n{i}"} for i in range(100)]
+    text = json.dumps(records, indent=2)
+    file_path = tmp_path / "array.json"
+    file_path.write_text(text)
+    monkeypatch.setattr(Client, "json_read_size", read_size)
+
+    client = Client(dataset_name="test", format="json", url=str(file_path), provider={"storage": "local"})
+    assert list(client.read()) == records
+
+    # items are cut between reads, which are of json_read_size characters unless an item is longer
+    read_sizes = []
+
+    class RecordingStringIO(io.StringIO):
+        def read(self, size=-1):
+            read_sizes.append(size)
+            return super().read(size)
+
+    assert [obj for obj, _ in Client._iterate_json(RecordingStringIO(text))] == records
+    assert read_sizes[0] == read_size
+    assert len(read_sizes) >= len(text) // max(read_sizes)
+
+
+@pytest.mark.parametrize("schema_inference_rows, expected_properties", [(10, {"id"}), (0, {"id", "extra"})])
+def test_schema_inference_rows(tmp_path, schema_inference_rows, expected_properties):
+    file_path = tmp_path / "records.json"
+    file_path.write_text(json.dumps([{"id": i} for i in range(100)] + [{"id": 100, "extra": "x"}]))
+    client = Client(
+        dataset_name="test", format="json", url=str(file_path), provider={"storage": "local"}, schema_inference_rows=schema_inference_rows
+    )
+    stream = next(iter(client.streams))
+    assert set(stream.json_schema["properties"]) == expected_properties
+
+
 def run_load_dataframes(config, expected_columns=10, expected_rows=42):
     df_list = SourceFile.load_dataframes(config=config, logger=AirbyteLogger(), skip_data=False)
     assert len(df_list) == 1  # Properly load 1 DataFrame
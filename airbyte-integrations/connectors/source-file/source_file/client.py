@@ -25,12 +25,13 @@
 
 import json
 import traceback
-from typing import Iterable
+from typing import Any, Iterable, Iterator, Tuple
 from urllib.parse import urlparse
 
 import google
 import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 import smart_open
 from airbyte_protocol import AirbyteStream
 from azure.storage.blob import BlobServiceClient
@@ -238,12 +239,23 @@ class Client:
     """Class that manages reading and parsing data from streams"""
 
     reader_class = URLFile
-
-    def __init__(self, dataset_name: str, url: str, provider: dict, format: str = None, reader_options: str = None):
+    # number of characters read at a time when parsing JSON files
+    json_read_size = 1024 * 1024
+
+    def __init__(
+        self,
+        dataset_name: str,
+        url: str,
+        provider: dict,
+        format: str = None,
+        reader_options: str = None,
+        schema_inference_rows: int = 10000,
+    ):
         self._dataset_name = dataset_name
         self._url = url
         self._provider = provider
         self._reader_format = format or "csv"
+        self._schema_inference_rows = schema_inference_rows
         self._reader_options = {}
         if reader_options:
             try:
@@ -261,36 +273,95 @@ class Client:
 
     def load_nested_json_schema(self, fp) -> dict:
         # Use Genson Library to take JSON objects and generate schemas that describe them,
+        # only the first schema_inference_rows objects are used (all of them if 0)
         builder = SchemaBuilder()
-        if self._reader_format == "jsonl":
-            for o in self.read():
-                builder.add_object(o)
-        else:
-            builder.add_object(json.load(fp))
+        for i, (obj, in_array) in enumerate(self._iterate_nested_json(fp)):
+            if self._schema_inference_rows and i >= self._schema_inference_rows:
+                break
+            # items of a JSON array are added as arrays, giving the same schema as adding the whole array at once
+            builder.add_object([obj] if in_array else obj)
 
         result = builder.to_schema()
         if "items" in result and "properties" in result["items"]:
             result = result["items"]["properties"]
         return result
 
-    def load_nested_json(self, fp) -> list:
+    def load_nested_json(self, fp) -> Iterable[dict]:
+        for obj, _ in self._iterate_nested_json(fp):
+            yield obj
+
+    def _iterate_nested_json(self, fp) -> Iterator[Tuple[Any, bool]]:
+        """Stream the objects of a JSON Lines file line by line, or of a JSON file (see _iterate_json)
+
+        :param fp: file-like object to read from
+        :return: tuples of (object, whether it is an item of a top-level JSON array)
+        """
         if self._reader_format == "jsonl":
-            result = []
-            line = fp.readline()
-            while line:
-                result.append(json.loads(line))
-                line = fp.readline()
+            for line in fp:
+                if line.strip():
+                    yield json.loads(line), False
         else:
-            result = json.load(fp)
-            if not isinstance(result, list):
-                result = [result]
-        return result
+            yield from self._iterate_json(fp)
+
+    @classmethod
+    def _iterate_json(cls, fp) -> Iterator[Tuple[Any, bool]]:
+        """Parse a JSON document incrementally: if it is an array, its items are yielded one by one as soon as they are read,
+        so the whole document is never loaded in memory. Any other document is parsed at once.
 
-    def load_dataframes(self, fp, skip_data=False) -> Iterable:
+        :param fp: file-like object (opened in text mode) to read from
+        :return: tuples of (object, whether it is an item of a top-level JSON array)
+        """
+        decoder = json.JSONDecoder()
+        buffer, position, eof = "", 0, False
+
+        def read_more(size: int):
+            nonlocal buffer, position, eof
+            chunk = fp.read(size)
+            eof = not chunk
+            buffer, position = buffer[position:] + chunk, 0
+
+        def skip_whitespace():
+            nonlocal position
+            position = json.decoder.WHITESPACE.match(buffer, position).end()
+            while position == len(buffer) and not eof:
+                read_more(cls.json_read_size)
+                position = json.decoder.WHITESPACE.match(buffer, position).end()
+
+        skip_whitespace()
+        if buffer[position : position + 1] != "[":
+            yield json.loads(buffer[position:] + fp.read()), False
+            return
+        position += 1
+        skip_whitespace()
+        if buffer[position : position + 1] == "]":
+            return
+
+        while True:
+            try:
+                obj, end = decoder.raw_decode(buffer, position)
+                end = json.decoder.WHITESPACE.match(buffer, end).end()
+                if buffer[end : end + 1] not in (",", "]"):
+                    raise json.JSONDecodeError("Expecting ',' delimiter", buffer, end)
+            except ValueError:
+                if eof:
+                    raise
+                # the item may continue in the rest of the file (e.g. a number cut in the middle): it is parsed again once more is read,
+                # reading at least as much as what is buffered so that large items aren't parsed too many times
+                read_more(max(cls.json_read_size, len(buffer) - position))
+                continue
+            yield obj, True
+
+            if buffer[end] == "]":
+                return
+            position = end + 1
+            skip_whitespace()
+
+    def load_dataframes(self, fp, skip_data=False, max_rows: int = None) -> Iterable:
         """load and return the appropriate pandas dataframe.
 
         :param fp: file-like object to read from
         :param skip_data: limit reading data
+        :param max_rows: stop reading once this number of rows is loaded (for csv, parquet and orc)
         :return: a list of dataframe loaded from files described in the configuration
         """
         readers = {
@@ -321,11 +392,40 @@ class Client:
             if skip_data:
                 reader_options["nrows"] = 0
                 reader_options["index_col"] = 0
+            elif max_rows:
+                reader_options["nrows"] = min(max_rows, reader_options.get("nrows") or max_rows)
 
             yield from reader(fp, **reader_options)
+        elif self._reader_format in ("parquet", "orc"):
+            yield from self.load_row_groups(fp, columns=reader_options.get("columns"), max_rows=max_rows)
         else:
             yield reader(fp, **reader_options)
 
+    def load_row_groups(self, fp, columns: Iterable = None, max_rows: int = None) -> Iterable[pd.DataFrame]:
+        """load parquet files row group by row group (and orc files stripe by stripe) rather than the whole file at once.
+
+        :param fp: file-like object to read from
+        :param columns: only load these columns if set, as the `columns` reader option of pandas.read_parquet/read_orc
+        :param max_rows: stop reading once this number of rows is loaded
+        :return: a dataframe per row group
+        """
+        if self._reader_format == "parquet":
+            parquet_file = pq.ParquetFile(fp)
+            row_groups = (parquet_file.read_row_group(i, columns=columns) for i in range(parquet_file.num_row_groups))
+        else:
+            # imported here like in pandas.read_orc as pyarrow.orc isn't available on every platform
+            from pyarrow import orc
+
+            orc_file = orc.ORCFile(fp)
+            row_groups = (orc_file.read_stripe(i, columns=columns) for i in range(orc_file.nstripes))
+
+        num_rows = 0
+        for row_group in row_groups:
+            yield row_group.to_pandas()
+            num_rows += row_group.num_rows
+            if max_rows and num_rows >= max_rows:
+                break
+
     @staticmethod
     def dtype_to_json_type(dtype) -> str:
         """Convert Pandas Dataframe types to Airbyte Types.
@@ -367,7 +467,7 @@ class Client:
             if self._reader_format == "json" or self._reader_format == "jsonl":
                 return self.load_nested_json_schema(fp)
 
-            df_list = self.load_dataframes(fp, skip_data=False)
+            df_list = self.load_dataframes(fp, skip_data=False, max_rows=self._schema_inference_rows)
             fields = {}
             for df in df_list:
                 for col in df.columns:
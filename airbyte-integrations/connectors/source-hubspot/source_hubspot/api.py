@@ -23,13 +23,17 @@
 #
 
 
+import queue
 import sys
+import threading
 import time
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from functools import lru_cache, partial
 from http import HTTPStatus
-from typing import Any, Callable, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Union
+from typing import Any, Callable, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 import backoff
 import pendulum as pendulum
@@ -117,15 +121,56 @@ def retry_after_handler(**kwargs):
     )
 
 
+class CallRateLimiter:
+    """Thread-safe limiter of the number of calls, allows at most `max_calls` calls in any `period` seconds for each pair of `limits`"""
+
+    def __init__(self, limits: List[Tuple[int, float]]):
+        self._limits = limits
+        self._longest_period = max(period for _, period in limits)
+        self._calls = deque()
+        self._lock = threading.Lock()
+
+    def _wait_time(self, now: float) -> float:
+        while self._calls and self._calls[0] <= now - self._longest_period:
+            self._calls.popleft()
+
+        wait_time = 0
+        for max_calls, period in self._limits:
+            if len(self._calls) >= max_calls and self._calls[-max_calls] > now - period:
+                wait_time = max(wait_time, self._calls[-max_calls] + period - now)
+        return wait_time
+
+    def acquire(self):
+        """Block until a call can be made without exceeding any of the limits"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait_time = self._wait_time(now)
+                if not wait_time:
+                    self._calls.append(now)
+                    return
+            time.sleep(wait_time)
+
+
 class API:
     """Hubspot API interface, authorize, retrieve and post, supports backoff logic"""
 
     BASE_URL = "https://api.hubapi.com"
     USER_AGENT = "Airbyte"
+    # requests budget of a portal, as (max number of requests, period in seconds),
+    # see https://developers.hubspot.com/docs/api/usage-details
+    RATE_LIMITS = [(10, 1), (100, 10)]
+    # max number of requests made in parallel by all streams
+    MAX_CONNECTIONS = 10
 
     def __init__(self, credentials: Mapping[str, Any]):
         self._credentials = {**credentials}
+        self._rate_limiter = CallRateLimiter(self.RATE_LIMITS)
+        self._token_lock = threading.Lock()
         self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=self.MAX_CONNECTIONS)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
         self._session.headers = {
             "Content-Type": "application/json",
             "User-Agent": self.USER_AGENT,
@@ -162,8 +207,9 @@ class API:
         if not self._credentials.get("access_token"):
             return None
 
-        if self._credentials["token_expires"] is None or self._credentials["token_expires"] < datetime.utcnow():
-            self._acquire_access_token_from_refresh_token()
+        with self._token_lock:
+            if self._credentials["token_expires"] is None or self._credentials["token_expires"] < datetime.utcnow():
+                self._acquire_access_token_from_refresh_token()
         return self._credentials.get("access_token")
 
     def _add_auth(self, params: Mapping[str, Any] = None) -> Mapping[str, Any]:
@@ -205,10 +251,12 @@ class API:
     @retry_connection_handler(max_tries=5, factor=5)
     @retry_after_handler(max_tries=3)
     def get(self, url: str, params=None) -> Union[MutableMapping[str, Any], List[MutableMapping[str, Any]]]:
+        self._rate_limiter.acquire()
         response = self._session.get(self.BASE_URL + url, params=self._add_auth(params))
         return self._parse_and_handle_errors(response)
 
     def post(self, url: str, data: Mapping[str, Any], params=None) -> Union[Mapping[str, Any], List[Mapping[str, Any]]]:
+        self._rate_limiter.acquire()
         response = self._session.post(self.BASE_URL + url, params=self._add_auth(params), json=data)
         return self._parse_and_handle_errors(response)
 
@@ -289,21 +337,68 @@ class Stream(ABC):
 
         return casted_value
 
+    @staticmethod
+    def _get_caster(declared_field_types: List, field_name: str) -> Callable[[Any], Any]:
+        """Compile the rules of `_cast_value` for a field into a function casting its values"""
+        if not isinstance(declared_field_types, list) or not any(t != "null" for t in declared_field_types):
+            return partial(Stream._cast_value, declared_field_types, field_name)
+
+        target_type_name = next(filter(lambda t: t != "null", declared_field_types))
+        target_type = CUSTOM_FIELD_VALUE_TYPE_CAST_REVERSED.get(target_type_name)
+        if target_type_name == "number":
+            # do not cast numeric IDs into float, use integer instead
+            target_type = int if field_name.endswith("_id") else target_type
+        if not target_type:
+            return partial(Stream._cast_value, declared_field_types, field_name)
+        empty_to_none = target_type_name != "string"
+
+        def cast(field_value):
+            if empty_to_none and field_value == "":
+                # do not cast empty strings, return None instead to be properly casted.
+                return None
+            try:
+                return target_type(field_value)
+            except ValueError:
+                logger.exception(f"Could not cast `{field_value}` to `{target_type}`")
+                return field_value
+
+        return cast
+
+    @staticmethod
+    def _get_casting_plan(properties: Mapping[str, Any]) -> Mapping[str, Tuple[set, Callable[[Any], Any]]]:
+        """Types of values kept as is, and function to cast other values, for each field"""
+        plan = {}
+        for field_name, field_props in properties.items():
+            declared_field_types = field_props.get("type") or []
+            if not isinstance(declared_field_types, Iterable):
+                declared_field_types = [declared_field_types]
+            accepted_types = {t for t, type_name in CUSTOM_FIELD_VALUE_TYPE_CAST.items() if type_name in declared_field_types}
+            if isinstance(declared_field_types, list) and "null" in declared_field_types:
+                accepted_types.add(type(None))
+            plan[field_name] = (accepted_types, Stream._get_caster(declared_field_types, field_name))
+        return plan
+
+    @property
+    @lru_cache()
+    def casting_plan(self) -> Mapping[str, Tuple[set, Callable[[Any], Any]]]:
+        """Casting plan of the properties of the stream, compiled once"""
+        return self._get_casting_plan(self.properties)
+
     def _cast_record_fields_if_needed(self, record: Mapping, properties: Mapping[str, Any] = None) -> Mapping:
 
         if self.entity not in {"contact", "engagement", "product", "quote", "ticket", "company", "deal", "line_item"}:
             return record
 
-        if not record.get("properties"):
+        record_properties = record.get("properties")
+        if not record_properties:
             return record
 
-        properties = properties or self.properties
+        plan = self._get_casting_plan(properties) if properties else self.casting_plan
 
-        for field_name, field_value in record["properties"].items():
-            declared_field_types = properties[field_name].get("type") or []
-            if not isinstance(declared_field_types, Iterable):
-                declared_field_types = [declared_field_types]
-            record["properties"][field_name] = self._cast_value(declared_field_types, field_name, field_value)
+        for field_name, field_value in record_properties.items():
+            accepted_types, cast = plan[field_name]
+            if type(field_value) not in accepted_types:
+                record_properties[field_name] = cast(field_value)
 
         return record
 
@@ -316,72 +411,83 @@ class Stream(ABC):
             yield record
 
     @staticmethod
-    def _field_to_datetime(value: Union[int, str]) -> pendulum.datetime:
+    def _field_to_datetime(value: Union[int, str]) -> datetime:
+        """Parse epoch milliseconds or ISO 8601 datetime, pendulum is only used for formats unknown to the standard library"""
         if isinstance(value, int):
-            value = pendulum.from_timestamp(value / 1000.0)
+            return datetime.fromtimestamp(value / 1000.0, tz=timezone.utc)
         elif isinstance(value, str):
-            value = pendulum.parse(value)
-        else:
-            raise ValueError(f"Unsupported type of datetime field {type(value)}")
-        return value
+            try:
+                parsed = datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+            except ValueError:
+                return pendulum.parse(value)
+            return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+        raise ValueError(f"Unsupported type of datetime field {type(value)}")
 
     def _filter_old_records(self, records: Iterable) -> Iterable:
         """Skip records that was updated before our start_date"""
+        # standard datetimes are compared much faster than pendulum ones
+        start_date = datetime.fromisoformat(self._start_date.isoformat())
         for record in records:
             updated_at = record[self.updated_at_field]
             if updated_at:
                 updated_at = self._field_to_datetime(updated_at)
-                if updated_at < self._start_date:
+                if updated_at < start_date:
                     continue
             yield record
 
+    def _parse_page(self, response, params: MutableMapping[str, Any]) -> Tuple[Iterable, Optional[MutableMapping[str, Any]]]:
+        """Extract records of a page and params of the next page, which are None if this page is the last one"""
+        if isinstance(response, Mapping):
+            if response.get("status", None) == "error":
+                """
+                When the API Key doen't have the permissions to access the endpoint,
+                we break the read, skip this stream and log warning message for the user.
+
+                Example:
+
+                response.json() = {
+                    'status': 'error',
+                    'message': 'This hapikey (....) does not have proper permissions! (requires any of [automation-access])',
+                    'correlationId': '111111-2222-3333-4444-55555555555'}
+                """
+                logger.warn(f"Stream `{self.data_field}` cannot be procced. {response.get('message')}")
+                return [], None
+
+            if response.get(self.data_field) is None:
+                """
+                When the response doen't have the stream's data, raise an exception.
+                """
+                raise RuntimeError("Unexpected API response: {} not in {}".format(self.data_field, response.keys()))
+
+            # pagination
+            if "paging" in response:  # APIv3 pagination
+                if "next" not in response["paging"]:
+                    return response[self.data_field], None
+                return response[self.data_field], {**params, "after": response["paging"]["next"]["after"]}
+
+            if not response.get(self.more_key, False):
+                return response[self.data_field], None
+            if self.page_field in response:
+                return response[self.data_field], {**params, self.page_filter: response[self.page_field]}
+            return response[self.data_field], params
+
+        response = list(response)
+        # pagination
+        if len(response) < self.limit:
+            return response, None
+        return response, {**params, self.page_filter: params.get(self.page_filter, 0) + self.limit}
+
     def _read(self, getter: Callable, params: MutableMapping[str, Any] = None) -> Iterator:
-        while True:
+        """Read all pages, the next page is requested while the records of the current one are processed"""
+        with ThreadPoolExecutor(max_workers=1) as executor:
             response = getter(params=params)
-            if isinstance(response, Mapping):
-                if response.get("status", None) == "error":
-                    """
-                    When the API Key doen't have the permissions to access the endpoint,
-                    we break the read, skip this stream and log warning message for the user.
-
-                    Example:
-
-                    response.json() = {
-                        'status': 'error',
-                        'message': 'This hapikey (....) does not have proper permissions! (requires any of [automation-access])',
-                        'correlationId': '111111-2222-3333-4444-55555555555'}
-                    """
-                    logger.warn(f"Stream `{self.data_field}` cannot be procced. {response.get('message')}")
+            while True:
+                records, params = self._parse_page(response, params)
+                next_response = executor.submit(getter, params=params) if params is not None else None
+                yield from records
+                if not next_response:
                     break
-
-                if response.get(self.data_field) is None:
-                    """
-                    When the response doen't have the stream's data, raise an exception.
-                    """
-                    raise RuntimeError("Unexpected API response: {} not in {}".format(self.data_field, response.keys()))
-
-                yield from response[self.data_field]
-
-                # pagination
-                if "paging" in response:  # APIv3 pagination
-                    if "next" in response["paging"]:
-                        params["after"] = response["paging"]["next"]["after"]
-                    else:
-                        break
-                else:
-                    if not response.get(self.more_key, False):
-                        break
-                    if self.page_field in response:
-                        params[self.page_filter] = response[self.page_field]
-            else:
-                response = list(response)
-                yield from response
-
-                # pagination
-                if len(response) < self.limit:
-                    break
-                else:
-                    params[self.page_filter] = params.get(self.page_filter, 0) + self.limit
+                response = next_response.result()
 
     def read(self, getter: Callable, params: Mapping[str, Any] = None) -> Iterator:
         default_params = {self.limit_field: self.limit, "properties": ",".join(self.properties.keys())}
@@ -432,6 +538,10 @@ class IncrementalStream(Stream, ABC):
 
     state_pk = "timestamp"
     limit = 1000
+    # max number of date chunks read in parallel, all of them share the requests budget of the portal
+    max_concurrent_chunks = 5
+    # max number of records buffered by each chunk read ahead
+    max_buffered_records = 1000
 
     @property
     @abstractmethod
@@ -466,6 +576,7 @@ class IncrementalStream(Stream, ABC):
             latest_cursor = max(cursor, latest_cursor) if latest_cursor else cursor
 
         if latest_cursor:
+            latest_cursor = pendulum.instance(latest_cursor)
             new_state = max(latest_cursor, self._state) if self._state else latest_cursor
             if new_state != self._state:
                 logger.info(f"Advancing bookmark for {self.name} stream from {self._state} to {latest_cursor}")
@@ -475,19 +586,60 @@ class IncrementalStream(Stream, ABC):
     def read_chunked(
         self, getter: Callable, params: Mapping[str, Any] = None, chunk_size: pendulum.duration = pendulum.duration(days=1)
     ) -> Iterator:
+        """Read up to `max_concurrent_chunks` chunks at a time, records are still returned chunk by chunk in chronological order.
+        Chunks read ahead of the one being returned pause once they buffered `max_buffered_records` records, so that at most
+        (max_concurrent_chunks - 1) * max_buffered_records records are held in memory, plus the pages being requested.
+        """
         params = {**params} if params else {}
         now_ts = int(pendulum.now().timestamp() * 1000)
         start_ts = int(self._start_date.timestamp() * 1000)
         chunk_size = int(chunk_size.total_seconds() * 1000)
+        # resolve dynamic properties once, before any chunk is read
+        _ = self.properties
+
+        stop_reading = threading.Event()
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_chunks) as executor:
+            chunks = deque()
+            try:
+                for ts in range(start_ts, now_ts, chunk_size):
+                    chunk_params = {**params, "startTimestamp": ts, "endTimestamp": ts + chunk_size}
+                    records = queue.Queue(maxsize=self.max_buffered_records)
+                    chunks.append((records, executor.submit(self._read_chunk, getter, chunk_params, records, stop_reading)))
+                    if len(chunks) >= self.max_concurrent_chunks:
+                        yield from self._chunk_records(*chunks.popleft())
+                while chunks:
+                    yield from self._chunk_records(*chunks.popleft())
+            finally:
+                # let the chunks read ahead stop if the read is interrupted
+                stop_reading.set()
+
+    def _read_chunk(self, getter: Callable, params: Mapping[str, Any], records: queue.Queue, stop_reading: threading.Event):
+        start_ts, end_ts = params["startTimestamp"], params["endTimestamp"]
+        logger.info(
+            f"Reading chunk from stream {self.name} between {pendulum.from_timestamp(start_ts / 1000)} and {pendulum.from_timestamp(end_ts / 1000)}"
+        )
+        for record in super().read(getter, params):
+            while True:
+                if stop_reading.is_set():
+                    return
+                try:
+                    records.put(record, timeout=0.1)
+                    break
+                except queue.Full:
+                    pass
 
-        for ts in range(start_ts, now_ts, chunk_size):
-            end_ts = ts + chunk_size
-            params["startTimestamp"] = ts
-            params["endTimestamp"] = end_ts
-            logger.info(
-                f"Reading chunk from stream {self.name} between {pendulum.from_timestamp(ts / 1000)} and {pendulum.from_timestamp(end_ts / 1000)}"
-            )
-            yield from super().read(getter, params)
+    @staticmethod
+    def _chunk_records(records: queue.Queue, reading: Future) -> Iterator:
+        while True:
+            try:
+                yield records.get(timeout=0.1)
+            except queue.Empty:
+                if reading.done():
+                    break
+        # the chunk was fully read, return what is left and raise the error of the reading if any
+        while not records.empty():
+            yield records.get_nowait()
+        reading.result()
 
 
 class CRMObjectStream(Stream):
@@ -559,10 +711,20 @@ class CampaignStream(Stream):
     limit = 500
     updated_at_field = "lastUpdatedTime"
 
+    # max number of campaigns requested in parallel
+    max_concurrent_requests = 5
+
     def list(self, fields) -> Iterable:
-        for row in self.read(getter=partial(self._api.get, url=self.url)):
-            record = self._api.get(f"/email/public/v1/campaigns/{row['id']}")
-            yield {**row, **record}
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_requests) as executor:
+            pending = deque()
+            for row in self.read(getter=partial(self._api.get, url=self.url)):
+                pending.append((row, executor.submit(self._api.get, f"/email/public/v1/campaigns/{row['id']}")))
+                if len(pending) >= self.max_concurrent_requests:
+                    row, record = pending.popleft()
+                    yield {**row, **record.result()}
+            while pending:
+                row, record = pending.popleft()
+                yield {**row, **record.result()}
 
 
 class ContactListStream(Stream):
@@ -23,6 +23,7 @@
 #
 
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Iterator, Mapping, Tuple
 
 from airbyte_protocol import AirbyteStream
@@ -79,6 +80,10 @@ class Client(BaseClient):
     @property
     def streams(self) -> Iterator[AirbyteStream]:
         """List of available streams, patch streams to append properties dynamically"""
+        # properties of all entities are requested in parallel, they are cached by the streams
+        with ThreadPoolExecutor(max_workers=API.MAX_CONNECTIONS) as executor:
+            list(executor.map(lambda api: api.properties, self._apis.values()))
+
         for stream in super().streams:
             properties = self._apis[stream.name].properties
             if properties:
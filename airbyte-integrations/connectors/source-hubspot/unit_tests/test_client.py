@@ -23,8 +23,12 @@
 #
 
 
+import time
+from collections import defaultdict
+
+import pendulum
 import pytest
-from source_hubspot.api import API
+from source_hubspot.api import API, CallRateLimiter, CRMObjectStream, EmailEventStream
 from source_hubspot.client import Client
 
 
@@ -121,3 +125,95 @@ def test_wrong_permissions_api_key(requests_mock, creds_with_wrong_permissions):
 
     # match logged expected logged warning message with output given from preudo-output
     assert expected_warining_message
+
+
+def test_call_rate_limiter():
+    """Calls above the limit wait for the oldest call of the window to expire"""
+    limiter = CallRateLimiter([(2, 0.2), (3, 1)])
+
+    start = time.monotonic()
+    for _ in range(3):
+        limiter.acquire()
+    assert time.monotonic() - start >= 0.2
+
+    limiter.acquire()
+    assert time.monotonic() - start >= 1
+
+
+def test_incremental_stream_reads_chunks_in_order(requests_mock, some_credentials):
+    """Chunks are read in parallel, but records and state follow the chronological order of the chunks"""
+
+    def events(request, context):
+        start_ts = int(request.qs["starttimestamp"][0])
+        # later chunks are answered first
+        time.sleep((now_ts - start_ts) / day_ms * 0.01)
+        created = int(request.qs["endtimestamp"][0]) - 1
+        return {"events": [{"id": start_ts, "created": created}], "hasMore": False}
+
+    day_ms = 24 * 60 * 60 * 1000
+    now_ts = int(pendulum.now().timestamp() * 1000)
+    start_date = pendulum.now().subtract(days=10)
+    requests_mock.register_uri("GET", "/email/public/v1/events", json=events)
+    stream = EmailEventStream(api=API(some_credentials), start_date=start_date.isoformat())
+
+    records = list(stream.list(fields=[]))
+
+    # one record per day, the last chunk may be split between two days
+    assert len(records) == requests_mock.call_count >= 10
+    assert [record["created"] for record in records] == sorted(record["created"] for record in records)
+    assert stream.state == {"timestamp": str(pendulum.from_timestamp(records[-1]["created"] / 1000))}
+
+
+def test_incremental_stream_buffers_few_records_ahead(some_credentials):
+    """Chunks read ahead of the one being returned pause once they buffered max_buffered_records, and stop when the read stops"""
+    pages_per_chunk, page_size = 5, 10
+    requested_pages = defaultdict(int)
+
+    def getter(params):
+        requested_pages[params["startTimestamp"]] += 1
+        offset = params.get("offset", 0)
+        events = [{"id": (params["startTimestamp"], offset + i), "created": params["endTimestamp"] - 1} for i in range(page_size)]
+        return {"events": events, "hasMore": offset + page_size < pages_per_chunk * page_size, "offset": offset + page_size}
+
+    stream = EmailEventStream(api=API(some_credentials), start_date=pendulum.now().subtract(days=5).isoformat())
+    stream.max_buffered_records = 2
+
+    records = stream.read_chunked(getter)
+    first_record = next(records)
+    time.sleep(0.5)
+
+    first_chunk = first_record["id"][0]
+    assert requested_pages[first_chunk] <= 2
+    # chunks read ahead request at most their first page and the next one, prefetched while the first page is buffered
+    assert len(requested_pages) == stream.max_concurrent_chunks
+    assert all(pages <= 2 for chunk, pages in requested_pages.items() if chunk != first_chunk)
+
+    records.close()
+    requested_pages.clear()
+    time.sleep(0.5)
+    assert not requested_pages
+
+    records = list(stream.read_chunked(getter))
+    assert [record["id"] for record in records] == sorted(record["id"] for record in records)
+    assert len(records) == len(requested_pages) * pages_per_chunk * page_size
+
+
+def test_crm_object_stream_pagination(requests_mock, some_credentials):
+    """Pages are requested with the cursor of the previous one, and returned in order"""
+    requests_mock.register_uri("GET", "/properties/v2/ticket/properties", json=[])
+    responses = [
+        {
+            "json": {
+                "results": [{"id": str(i), "updatedAt": "2021-02-02T00:00:00Z"} for i in range(page * 2, page * 2 + 2)],
+                "paging": paging,
+            }
+        }
+        for page, paging in enumerate([{"next": {"after": "2"}}, {"next": {"after": "4"}}, {}])
+    ]
+    requests_mock.register_uri("GET", "/crm/v3/objects/ticket", responses)
+    stream = CRMObjectStream(entity="ticket", api=API(some_credentials), start_date="2021-02-01T00:00:00Z")
+
+    records = list(stream.list(fields=[]))
+
+    assert [record["id"] for record in records] == [str(i) for i in range(6)]
+    assert [request.qs.get("after") for request in requests_mock.request_history[1:]] == [None, ["2"], ["4"]]
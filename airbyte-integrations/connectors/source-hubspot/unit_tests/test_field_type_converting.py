@@ -22,8 +22,16 @@
 # SOFTWARE.
 #
 
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Iterable
+
+import pendulum
 import pytest
-from source_hubspot.api import Stream
+from source_hubspot.api import API, CRMObjectStream, Stream
+
+logger = logging.getLogger(__name__)
 
 
 @pytest.mark.parametrize(
@@ -66,29 +74,118 @@ def test_bad_field_type_converting(field_type, expected, capsys):
     assert f"Unsupported type {field_type} found" in logs
 
 
+CAST_VALUE_CASES = [
+    # test for None in field_values
+    (["null", "string"], "some_field", None, None),
+    (["null", "number"], "some_field", None, None),
+    (["null", "integer"], "some_field", None, None),
+    (["null", "object"], "some_field", None, None),
+    (["null", "boolean"], "some_field", None, None),
+    # specific cases
+    ("string", "some_field", "test", "test"),
+    (["null", "number"], "some_field", "123.456", 123.456),
+    (["null", "number"], "user_id", "123", 123),
+    (["null", "string"], "some_field", "123", "123"),
+    # when string has empty field_value (empty string)
+    (["null", "string"], "some_field", "", ""),
+    # when NOT string type but has empty sting in field_value, instead of double or null,
+    # we should use None instead, to have it properly casted to the correct type
+    (["null", "number"], "some_field", "", None),
+    (["null", "integer"], "some_field", "", None),
+    (["null", "object"], "some_field", "", None),
+    (["null", "boolean"], "some_field", "", None),
+]
+
+
+@pytest.mark.parametrize("declared_field_types,field_name,field_value,casted_value", CAST_VALUE_CASES)
+def test_cast_type_if_needed(declared_field_types, field_name, field_value, casted_value):
+    assert Stream._cast_value(declared_field_types, field_name, field_value) == casted_value
+
+
+@pytest.mark.parametrize("declared_field_types,field_name,field_value,casted_value", CAST_VALUE_CASES)
+def test_casting_plan(declared_field_types, field_name, field_value, casted_value):
+    plan = Stream._get_casting_plan({field_name: {"type": declared_field_types}})
+    accepted_types, cast = plan[field_name]
+
+    assert (field_value if type(field_value) in accepted_types else cast(field_value)) == casted_value
+
+
 @pytest.mark.parametrize(
-    "declared_field_types,field_name,field_value,casted_value",
+    "value,expected",
     [
-        # test for None in field_values
-        (["null", "string"], "some_field", None, None),
-        (["null", "number"], "some_field", None, None),
-        (["null", "integer"], "some_field", None, None),
-        (["null", "object"], "some_field", None, None),
-        (["null", "boolean"], "some_field", None, None),
-        # specific cases
-        ("string", "some_field", "test", "test"),
-        (["null", "number"], "some_field", "123.456", 123.456),
-        (["null", "number"], "user_id", "123", 123),
-        (["null", "string"], "some_field", "123", "123"),
-        # when string has empty field_value (empty string)
-        (["null", "string"], "some_field", "", ""),
-        # when NOT string type but has empty sting in field_value, instead of double or null,
-        # we should use None instead, to have it properly casted to the correct type
-        (["null", "number"], "some_field", "", None),
-        (["null", "integer"], "some_field", "", None),
-        (["null", "object"], "some_field", "", None),
-        (["null", "boolean"], "some_field", "", None),
+        (1612137600000, datetime(2021, 2, 1, tzinfo=timezone.utc)),
+        ("2021-02-01T00:00:00Z", datetime(2021, 2, 1, tzinfo=timezone.utc)),
+        ("2021-02-01T00:00:00.123Z", datetime(2021, 2, 1, 0, 0, 0, 123000, tzinfo=timezone.utc)),
+        ("2021-02-01T02:00:00+02:00", datetime(2021, 2, 1, tzinfo=timezone.utc)),
+        ("2021-02-01 00:00:00", datetime(2021, 2, 1, tzinfo=timezone.utc)),
+        ("2021-02-01T00:00:00.1234Z", datetime(2021, 2, 1, 0, 0, 0, 123400, tzinfo=timezone.utc)),
     ],
 )
-def test_cast_type_if_needed(declared_field_types, field_name, field_value, casted_value):
-    assert Stream._cast_value(declared_field_types, field_name, field_value) == casted_value
+def test_field_to_datetime(value, expected):
+    assert Stream._field_to_datetime(value) == expected
+
+
+FIELD_TYPES = ["string", "number", "bool", "datetime"]
+FIELD_VALUES = {"string": "value", "number": "123.45", "bool": "true", "datetime": "2021-02-01T00:00:00.000Z"}
+WIDE_PROPERTIES = [{"name": f"field_{i}", "type": FIELD_TYPES[i % len(FIELD_TYPES)]} for i in range(400)]
+
+
+def wide_records(records_count: int):
+    return [
+        {
+            "id": str(i),
+            "updatedAt": "2021-02-02T00:00:00.000Z",
+            "properties": {row["name"]: FIELD_VALUES[row["type"]] for row in WIDE_PROPERTIES},
+        }
+        for i in range(records_count)
+    ]
+
+
+def cast_records_per_field(records, start_date):
+    """Casts and filters records the way streams did before the casting plan, by calling `_cast_value` for every field"""
+    properties = {row["name"]: Stream._get_field_props(row["type"]) for row in WIDE_PROPERTIES}
+    for record in records:
+        for field_name, field_value in record["properties"].items():
+            declared_field_types = properties[field_name].get("type") or []
+            if not isinstance(declared_field_types, Iterable):
+                declared_field_types = [declared_field_types]
+            record["properties"][field_name] = Stream._cast_value(declared_field_types, field_name, field_value)
+        if pendulum.parse(record["updatedAt"]) >= start_date:
+            yield record
+
+
+@pytest.fixture(name="wide_stream")
+def wide_stream_fixture(requests_mock):
+    requests_mock.register_uri("GET", "/properties/v2/contact/properties", json=WIDE_PROPERTIES)
+    return CRMObjectStream(entity="contact", api=API({"api_key": "key"}), start_date="2021-01-01T00:00:00Z")
+
+
+def test_casting_plan_casts_records_like_cast_value(wide_stream):
+    expected = list(cast_records_per_field(wide_records(10), wide_stream._start_date))
+
+    records = list(wide_stream._filter_old_records(wide_stream._cast_record_fields_if_needed(record) for record in wide_records(10)))
+
+    assert records == expected
+    assert records[0]["properties"]["field_1"] == 123.45
+
+
+@pytest.mark.benchmark
+def test_benchmark_cast_records_with_400_properties(wide_stream):
+    """Logs the time spent casting and filtering 2000 records of 400 properties with `_cast_value` per field and with the casting plan"""
+    records_count = 2000
+    _ = wide_stream.casting_plan
+
+    per_field_records = wide_records(records_count)
+    start = time.perf_counter()
+    list(cast_records_per_field(per_field_records, wide_stream._start_date))
+    per_field_time = time.perf_counter() - start
+
+    plan_records = wide_records(records_count)
+    start = time.perf_counter()
+    list(wide_stream._filter_old_records(wide_stream._cast_record_fields_if_needed(record) for record in plan_records))
+    plan_time = time.perf_counter() - start
+
+    logger.info(
+        f"casting of a record of 400 properties: per field {per_field_time / records_count * 1e6:.0f}us, "
+        f"with casting plan {plan_time / records_count * 1e6:.0f}us"
+    )
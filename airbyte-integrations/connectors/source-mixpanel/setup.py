@@ -26,11 +26,12 @@
 from setuptools import find_packages, setup
 
 MAIN_REQUIREMENTS = [
-    "airbyte-cdk",
+    "airbyte-cdk~=0.1.19",
 ]
 
 TEST_REQUIREMENTS = [
     "pytest~=6.1",
+    "requests-mock",
     "source-acceptance-test",
 ]
 
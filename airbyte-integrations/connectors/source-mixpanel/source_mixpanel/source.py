@@ -25,7 +25,6 @@
 
 import base64
 import json
-import time
 from abc import ABC
 from datetime import date, datetime, timedelta
 from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
@@ -37,8 +36,9 @@ from airbyte_cdk.logger import AirbyteLogger
 from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources import AbstractSource
 from airbyte_cdk.sources.streams import Stream
-from airbyte_cdk.sources.streams.http import HttpStream
+from airbyte_cdk.sources.streams.http import HttpStream, TokenBucketRateLimiter
 from airbyte_cdk.sources.streams.http.auth import HttpAuthenticator, TokenAuthenticator
+from airbyte_cdk.sources.streams.http.exceptions import DefaultBackoffException
 
 
 class MixpanelStream(HttpStream, ABC):
@@ -54,6 +54,8 @@ class MixpanelStream(HttpStream, ABC):
         because API endpoint accept requests bursts up to 3 reqs/sec
     else
         send requests with planned delay: 3600/reqs_per_hour_limit seconds
+
+    The delay is enforced by the rate limiter before each request is sent, rather than by sleeping after parsing each response.
     """
 
     url_base = "https://mixpanel.com/api/2.0/"
@@ -79,6 +81,13 @@ class MixpanelStream(HttpStream, ABC):
 
         super().__init__(authenticator=authenticator)
 
+    @property
+    def rate_limiter(self) -> TokenBucketRateLimiter:
+        # created again if stream_slices changed reqs_per_hour_limit
+        if not self._rate_limiter or self._rate_limiter.rate != self.reqs_per_hour_limit / 3600:
+            self._rate_limiter = TokenBucketRateLimiter(max_requests=self.reqs_per_hour_limit, period_seconds=3600)
+        return self._rate_limiter
+
     def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
         """Define abstract method"""
         return None
@@ -109,9 +118,6 @@ class MixpanelStream(HttpStream, ABC):
         for record in data:
             yield record
 
-        # wait for X seconds to match API limitations
-        time.sleep(3600 / self.reqs_per_hour_limit)
-
 
 class IncrementalMixpanelStream(MixpanelStream, ABC):
     def get_updated_state(self, current_stream_state: MutableMapping[str, Any], latest_record: Mapping[str, Any]) -> Mapping[str, any]:
@@ -686,17 +692,78 @@ class Export(DateSlicesMixin, IncrementalMixpanelStream):
     Raw Export API Rate Limit (https://help.mixpanel.com/hc/en-us/articles/115004602563-Rate-Limits-for-API-Endpoints):
      A maximum of 100 concurrent queries,
      3 queries per second and 60 queries per hour.
+
+    Responses are streamed and parsed line by line, as a single day of events can weigh several GB.
+    If exporting a date window fails before any record is read (e.g: the API times out on too many events), the window
+    is split in halves which are exported one after the other, and the following windows are kept as small.
+    Rate limited requests (429) are retried but never split the window, as smaller windows would only send more requests.
     """
 
     primary_key = None
     cursor_field = "time"
     reqs_per_hour_limit = 60  # 1 query per minute
+    read_timeout = 600  # seconds without receiving any data before an export request fails
+    chunk_size = 1024 * 1024  # bytes read at a time from export responses
 
     url_base = "https://data.mixpanel.com/api/2.0/"
 
+    # errors on which the date window is split, raised once the request was retried (see should_split_window())
+    window_errors = (
+        DefaultBackoffException,
+        requests.exceptions.ChunkedEncodingError,
+        requests.exceptions.ConnectionError,
+        requests.exceptions.Timeout,
+    )
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # number of days exported per request, lowered when exporting a longer window fails
+        self.export_window_size = self.date_window_size
+
     def path(self, **kwargs) -> str:
         return "export"
 
+    @staticmethod
+    def should_split_window(error: Exception) -> bool:
+        """Timeouts and server errors, i.e. everything but 429 responses which also end up in a DefaultBackoffException"""
+        if isinstance(error, DefaultBackoffException):
+            return error.response is None or error.response.status_code >= 500
+        return True
+
+    def request_kwargs(
+        self, stream_state: Mapping[str, Any], stream_slice: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None
+    ) -> Mapping[str, Any]:
+        return {"stream": True, "timeout": self.read_timeout}
+
+    def read_records(
+        self,
+        sync_mode: SyncMode,
+        cursor_field: List[str] = None,
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+    ) -> Iterable[Mapping[str, Any]]:
+        start_date = date.fromisoformat(stream_slice["start_date"])
+        end_date = date.fromisoformat(stream_slice["end_date"])
+        while start_date <= end_date:
+            window_end_date = min(start_date + timedelta(days=self.export_window_size - 1), end_date)
+            window = {**stream_slice, "start_date": str(start_date), "end_date": str(window_end_date)}
+            has_records = False
+            try:
+                for record in super().read_records(sync_mode, cursor_field=cursor_field, stream_slice=window, stream_state=stream_state):
+                    has_records = True
+                    yield record
+            except self.window_errors as e:
+                # records already read can't be told apart when reading the window again, so the error is raised
+                if has_records or window_end_date == start_date or not self.should_split_window(e):
+                    raise
+                self.export_window_size = ((window_end_date - start_date).days + 1) // 2
+                self.logger.warn(
+                    f"Stream {self.name}: failed to export events from {start_date} to {window_end_date} ({e}), "
+                    f"retrying with date windows of {self.export_window_size} day(s)"
+                )
+                continue
+            start_date = window_end_date + timedelta(days=1)
+
     def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
         """Export API return response.text in JSONL format but each line is a valid JSON object
         Raw item example:
@@ -717,21 +784,21 @@ class Export(DateSlicesMixin, IncrementalMixpanelStream):
             }
         """
 
-        for record_line in response.text.splitlines():
+        for record_line in response.iter_lines(chunk_size=self.chunk_size):
+            if not record_line:
+                continue
             record = json.loads(record_line)
             # transform record into flat dict structure
             item = {"event": record["event"]}
-            properties = record["properties"]
-            for property_name in properties:
-                this_property_name = property_name
+            for property_name, value in record["properties"].items():
                 if property_name.startswith("$"):
                     # Just remove leading '$' for 'reserved' mixpanel properties name, example:
                     # from API: '$browser'
                     # to stream: 'browser'
-                    this_property_name = this_property_name[1:]
+                    property_name = property_name[1:]
                 # Convert all values to string (this is default property type)
                 # because API does not provide properties type information
-                item[this_property_name] = str(properties[property_name])
+                item[property_name] = value if type(value) is str else str(value)
 
             # convert timestamp to datetime string
             if item.get("time") and item["time"].isdigit():
@@ -739,9 +806,6 @@ class Export(DateSlicesMixin, IncrementalMixpanelStream):
 
             yield item
 
-        # wait for X seconds to meet API limitation
-        time.sleep(3600 / self.reqs_per_hour_limit)
-
     def get_json_schema(self) -> Mapping[str, Any]:
         """
         :return: A dict of the JSON schema representing this stream.
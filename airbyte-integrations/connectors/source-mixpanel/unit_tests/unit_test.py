@@ -22,10 +22,15 @@
 # SOFTWARE.
 #
 
-from datetime import date, timedelta
+import json
+from datetime import date, datetime, timedelta
 
+import pytest
+import requests
+from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.streams.http.auth import NoAuth
-from source_mixpanel.source import Annotations
+from airbyte_cdk.sources.streams.http.exceptions import DefaultBackoffException
+from source_mixpanel.source import Annotations, Export
 
 
 def test_date_slices():
@@ -86,3 +91,101 @@ def test_date_slices():
         authenticator=NoAuth(), start_date=date.fromisoformat("2021-07-01"), end_date=date.fromisoformat("2021-07-03"), date_window_size=1
     ).stream_slices(sync_mode="any", stream_state={"date": "2021-07-02"})
     assert [{"start_date": "2021-07-02", "end_date": "2021-07-02"}, {"start_date": "2021-07-03", "end_date": "2021-07-03"}] == stream_slices
+
+
+EXPORT_URL = "https://data.mixpanel.com/api/2.0/export"
+
+
+def export_stream(**kwargs):
+    stream = Export(authenticator=NoAuth(), start_date=date(2021, 7, 1), end_date=date(2021, 7, 4), **kwargs)
+    stream.reqs_per_hour_limit = 3600 * 1000  # don't pace requests in tests
+    return stream
+
+
+def test_export_parse_response(requests_mock):
+    events = [
+        {"event": "Viewed Page", "properties": {"time": 1623860880, "$browser": "Chrome", "noninteraction": True}},
+        {"event": "Clicked", "properties": {"time": 1623860881, "$insert_id": "c5eed127", "price": 1.5, "tags": ["a"]}},
+    ]
+    requests_mock.get(EXPORT_URL, text="\n".join(json.dumps(event) for event in events) + "\n\n")
+    stream = export_stream(date_window_size=4)
+    stream.chunk_size = 16  # lines span several chunks
+
+    records = list(stream.read_records(SyncMode.full_refresh, stream_slice={"start_date": "2021-07-01", "end_date": "2021-07-04"}))
+
+    assert records == [
+        {"event": "Viewed Page", "time": datetime.fromtimestamp(1623860880).isoformat(), "browser": "Chrome", "noninteraction": "True"},
+        {
+            "event": "Clicked",
+            "time": datetime.fromtimestamp(1623860881).isoformat(),
+            "insert_id": "c5eed127",
+            "price": "1.5",
+            "tags": "['a']",
+        },
+    ]
+    assert requests_mock.call_count == 1
+
+
+def test_export_splits_failing_windows(requests_mock, monkeypatch):
+    def export(request, context):
+        from_date, to_date = date.fromisoformat(request.qs["from_date"][0]), date.fromisoformat(request.qs["to_date"][0])
+        if to_date > from_date + timedelta(days=1):
+            raise requests.exceptions.ConnectionError("Read timed out")
+        return "".join(json.dumps({"event": "e", "properties": {"day": str(from_date)}}) + "\n" for _ in range(2))
+
+    requests_mock.get(EXPORT_URL, text=export)
+    monkeypatch.setattr(Export, "max_retries", 1)
+    stream = export_stream(date_window_size=4)
+
+    records = list(stream.read_records(SyncMode.full_refresh, stream_slice={"start_date": "2021-07-01", "end_date": "2021-07-04"}))
+
+    assert [record["day"] for record in records] == ["2021-07-01"] * 2 + ["2021-07-03"] * 2
+    assert [request.qs["from_date"][0] for request in requests_mock.request_history] == ["2021-07-01", "2021-07-01", "2021-07-03"]
+    assert stream.export_window_size == 2
+
+
+def test_export_does_not_split_rate_limited_windows(requests_mock, monkeypatch):
+    requests_mock.get(EXPORT_URL, status_code=429)
+    monkeypatch.setattr(Export, "max_retries", 1)
+    stream = export_stream(date_window_size=4)
+
+    with pytest.raises(DefaultBackoffException):
+        list(stream.read_records(SyncMode.full_refresh, stream_slice={"start_date": "2021-07-01", "end_date": "2021-07-04"}))
+    assert requests_mock.call_count == 1
+    assert stream.export_window_size == 4
+
+
+def test_export_splits_windows_on_server_errors(requests_mock, monkeypatch):
+    requests_mock.get(EXPORT_URL, [{"status_code": 503}, {"text": ""}, {"text": ""}])
+    monkeypatch.setattr(Export, "max_retries", 1)
+    stream = export_stream(date_window_size=4)
+
+    assert list(stream.read_records(SyncMode.full_refresh, stream_slice={"start_date": "2021-07-01", "end_date": "2021-07-04"})) == []
+    assert requests_mock.call_count == 3
+    assert stream.export_window_size == 2
+
+
+def test_export_raises_once_records_were_read(requests_mock, monkeypatch):
+    def parse_response(self, response, **kwargs):
+        yield {"event": "e"}
+        raise requests.exceptions.ChunkedEncodingError("Connection broken")
+
+    monkeypatch.setattr(Export, "parse_response", parse_response)
+    requests_mock.get(EXPORT_URL, text="")
+    stream = export_stream(date_window_size=4)
+
+    records = stream.read_records(SyncMode.full_refresh, stream_slice={"start_date": "2021-07-01", "end_date": "2021-07-04"})
+    assert next(records) == {"event": "e"}
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        next(records)
+    assert stream.export_window_size == 4
+
+
+def test_rate_limiter_follows_planned_requests():
+    stream = Annotations(authenticator=NoAuth(), start_date=date(2021, 7, 1), end_date=date(2021, 7, 3), date_window_size=1)
+    assert stream.rate_limiter.rate == 400 / 3600
+
+    # fewer requests than allowed per hour are planned: 1 request per second
+    stream.stream_slices(sync_mode="any")
+    assert stream.rate_limiter.rate == 1
+    assert stream.rate_limiter is stream.rate_limiter
@@ -25,7 +25,7 @@
 
 from contextlib import contextmanager
 from datetime import datetime
-from typing import BinaryIO, Iterator, TextIO, Union
+from typing import BinaryIO, Iterator, Optional, TextIO, Union
 
 import boto3
 import smart_open
@@ -35,13 +35,14 @@ from botocore.client import Config as ClientConfig
 from botocore.config import Config
 from botocore.exceptions import NoCredentialsError
 
-from .source_files_abstract.storagefile import StorageFile
+from .source_files_abstract.storagefile import FileInfo, StorageFile
 
 
 class S3File(StorageFile):
-    def __init__(self, url: str, provider: dict):
-        super().__init__(url, provider)
-        self._setup_boto_session()
+    def __init__(self, url: str, provider: dict, file_info: Optional[FileInfo] = None):
+        super().__init__(url, provider, file_info)
+        # only set up when the metadata of the file has to be requested, most files already get it from the listing of the bucket
+        self._boto_s3_resource = None
 
     def _setup_boto_session(self):
         """
@@ -49,26 +50,31 @@ class S3File(StorageFile):
         Currently grabbing last_modified across multiple files asynchronously and may implement more multi-threading in future.
         See https://boto3.amazonaws.com/v1/documentation/api/latest/guide/resources.html (anchor link broken, scroll to bottom)
         """
-        if self.use_aws_account:
+        if self.use_aws_account(self._provider):
             self._boto_session = boto3session.Session(
                 aws_access_key_id=self._provider.get("aws_access_key_id"),
                 aws_secret_access_key=self._provider.get("aws_secret_access_key"),
             )
-        else:
-            self._boto_session = boto3session.Session()
-        if self.use_aws_account:
             self._boto_s3_resource = self._boto_session.resource("s3")
         else:
+            self._boto_session = boto3session.Session()
             self._boto_s3_resource = self._boto_session.resource("s3", config=Config(signature_version=UNSIGNED))
 
     @property
     def last_modified(self) -> datetime:
         """
-        Using decorator set up boto3 session & s3 resource.
+        Taken from the listing of the bucket if known, otherwise using decorator set up boto3 session & s3 resource.
         Note: slight nuance for grabbing this when we have no credentials.
 
         :return: last_modified property of the blob/file
         """
+        if self.file_info.last_modified is None:
+            self.file_info.last_modified = self._request_last_modified()
+        return self.file_info.last_modified
+
+    def _request_last_modified(self) -> datetime:
+        if self._boto_s3_resource is None:
+            self._setup_boto_session()
         bucket = self._provider.get("bucket")
         try:
             obj = self._boto_s3_resource.Object(bucket, self.url)
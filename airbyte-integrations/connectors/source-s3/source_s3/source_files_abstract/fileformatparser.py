@@ -22,33 +22,124 @@
 # SOFTWARE.
 #
 
+import io
 import json
 import multiprocessing as mp
+import multiprocessing.pool
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any, BinaryIO, Iterator, Mapping, Optional, TextIO, Tuple, Union
+from typing import Any, BinaryIO, Callable, Iterator, List, Mapping, Optional, TextIO, Tuple, Union
 
 import dill
 import pyarrow as pa
 from airbyte_cdk.logger import AirbyteLogger
 from pyarrow import csv as pa_csv
+from pyarrow import json as pa_json
+from pyarrow import parquet as pa_parquet
 
 
-def multiprocess_queuer(func, queue: mp.Queue, *args, **kwargs):
+def multiprocess_runner(func, *args, **kwargs):
     """ this is our multiprocesser helper function, lives at top-level to be Windows-compatible """
-    queue.put(dill.loads(func)(*args, **kwargs))
+    return dill.loads(func)(*args, **kwargs)
+
+
+def process_pool_initializer(ready: mp.Queue):
+    """ signals that a worker process of a ProcessPool has started, lives at top-level to be Windows-compatible """
+    ready.put(None)
+
+
+class ProcessPool:
+    """
+    Pool of worker processes reused to run functions in external processes (see CsvParser._run_in_external_process()),
+    rather than starting a new process for every call.
+    No more calls than worker processes are submitted at once, so a call starts running as soon as it is submitted.
+    Code hanging in a worker process can't be interrupted, so the whole pool is terminated (and started again on next use) when a call
+    times out, and the calls of other threads which were running in the terminated pool are submitted again.
+    """
+
+    # maximum number of seconds to wait for the worker processes to start
+    startup_timeout = 300
+    # seconds between two checks that the pool running a call wasn't terminated by another thread
+    poll_interval = 0.1
+
+    def __init__(self, processes: int = 1):
+        """
+        :param processes: number of worker processes, calls made while all of them are busy wait for one to be free, defaults to 1
+        """
+        self.processes = processes
+        self._pool = None
+        self._lock = threading.Lock()
+        self._free_workers = threading.BoundedSemaphore(processes)
+
+    def _get_pool(self) -> mp.pool.Pool:
+        with self._lock:
+            if self._pool is None:
+                # spawning rather than forking as the pool may be used from several threads, this is what happens on Windows anyway
+                context = mp.get_context("spawn")
+                ready = context.Queue()
+                pool = context.Pool(self.processes, initializer=process_pool_initializer, initargs=(ready,))
+                # starting processes takes a while, which shouldn't count in the timeout of the calls made with run()
+                try:
+                    for _ in range(self.processes):
+                        ready.get(timeout=self.startup_timeout)
+                except Exception:
+                    pool.terminate()
+                    raise
+                self._pool = pool
+            return self._pool
+
+    def run(self, fn: Callable, timeout: float, *args) -> Any:
+        """
+        :param fn: function to run in a worker process, pickled with dill for Windows-compatibility
+        :param timeout: seconds to wait for the result once fn started running, the time spent waiting for a free worker doesn't count
+        :raises mp.TimeoutError: if the result isn't available in time, in which case the pool has been terminated
+        :return: the return value of fn
+        """
+        pickled_fn = dill.dumps(fn)
+        with self._free_workers:
+            while True:
+                pool = self._get_pool()
+                async_result = pool.apply_async(multiprocess_runner, (pickled_fn, *args))
+                deadline = time.monotonic() + timeout
+                while not async_result.ready() and self._pool is pool:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.terminate(pool)
+                        raise mp.TimeoutError()
+                    async_result.wait(min(remaining, self.poll_interval))
+                if async_result.ready():
+                    return async_result.get()
+                # the pool was terminated by a call of another thread timing out, this call is submitted again to a new pool
+
+    def terminate(self, pool: mp.pool.Pool = None):
+        """
+        :param pool: only terminate the pool if it is still this one (it may already have been started again by another thread), defaults to None
+        """
+        with self._lock:
+            if self._pool is not None and (pool is None or pool is self._pool):
+                self._pool.terminate()
+                self._pool = None
+
+
+# used by parsers created without a process pool of their own
+default_process_pool = ProcessPool()
 
 
 class FileFormatParser(ABC):
-    def __init__(self, format: dict, master_schema: dict = None):
+    def __init__(self, format: dict, master_schema: dict = None, process_pool: ProcessPool = None):
         """
         :param format: file format specific mapping as described in spec.json
         :param master_schema: superset schema determined from all files, might be unused for some formats, defaults to None
+        :param process_pool: pool of worker processes to use where parsing needs to run in an external process, defaults to default_process_pool
         """
         self._format = format
         self._master_schema = (
             master_schema  # this may need to be used differently by some formats, pyarrow allows extra columns in csv schema
         )
+        self._process_pool = process_pool if process_pool is not None else default_process_pool
         self.logger = AirbyteLogger()
+        self._batch_schema, self._batch_types_of_schema = None, None
 
     @property
     @abstractmethod
@@ -68,14 +159,28 @@ class FileFormatParser(ABC):
         """
 
     @abstractmethod
-    def stream_records(self, file: Union[TextIO, BinaryIO]) -> Iterator[Mapping[str, Any]]:
+    def stream_batches(self, file: Union[TextIO, BinaryIO]) -> Iterator[pa.RecordBatch]:
         """
-        Override this with format-specifc logic to stream each data row from the file as a mapping of {columns:values}
+        Override this with format-specifc logic to stream the data rows from the file in batches of columns
         Note: avoid loading the whole file into memory to avoid OOM breakages
 
+        :param file: file-like object (opened via StorageFile)
+        :yield: PyArrow RecordBatch of data rows
+        """
+
+    def stream_records(self, file: Union[TextIO, BinaryIO]) -> Iterator[Mapping[str, Any]]:
+        """
+        Streams each data row from the file as a mapping of {columns:values}, see stream_batches()
+
         :param file: file-like object (opened via StorageFile)
         :yield: data record as a mapping of {columns:values}
         """
+        for batch in self.stream_batches(file):
+            columns = self.batch_columns(batch)
+            batch_columns = list(columns.keys())
+            # PyArrow returns lists of values for each column so we zip() these up into records which we then yield
+            for record_values in zip(*columns.values()):
+                yield dict(zip(batch_columns, record_values))
 
     @staticmethod
     def json_type_to_pyarrow_type(typ: str, reverse: bool = False, logger: AirbyteLogger = AirbyteLogger()) -> str:
@@ -130,6 +235,60 @@ class FileFormatParser(ABC):
 
         return new_schema
 
+    def _batch_types(self, schema: pa.Schema) -> List[pa.DataType]:
+        """
+        Works out the PyArrow type to cast each column of a batch to, i.e. the PyArrow type of the Json type of that column in the master schema,
+        or of the Json type of the column type if not in the master schema (see json_type_to_pyarrow_type()).
+        Consecutive batches usually share the same schema, so this is only worked out again when the schema changes.
+
+        :param schema: PyArrow schema of a batch
+        :return: list of PyArrow types in the order of the columns of the batch
+        """
+        # comparing schemas is much cheaper than hashing them
+        if self._batch_schema is None or self._batch_schema != schema:
+            master_schema = self._master_schema or {}
+            self._batch_types_of_schema = [
+                self.json_type_to_pyarrow_type(master_schema.get(field.name) or self.json_type_to_pyarrow_type(field.type, reverse=True))
+                for field in schema
+            ]
+            self._batch_schema = schema
+        return self._batch_types_of_schema
+
+    @staticmethod
+    def _column_values(column: pa.Array, pyarrow_type: pa.DataType) -> List[Any]:
+        """
+        Casts a column to the given PyArrow type and returns its values.
+        Values of nested types (e.g. lists or structs) can't be cast to strings by PyArrow, so these are serialized to JSON strings instead,
+        while scalar values failing the cast (e.g. timestamps with some versions of PyArrow) are converted with str().
+
+        :param column: PyArrow array of a batch
+        :param pyarrow_type: PyArrow type to cast the column to
+        :return: list of the column values
+        """
+        if column.type == pyarrow_type:
+            return column.to_pylist()
+        try:
+            return column.cast(pyarrow_type).to_pylist()
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            if pyarrow_type != pa.large_string():
+                raise
+            return [
+                None if value is None else json.dumps(value, default=str) if isinstance(value, (list, dict)) else str(value)
+                for value in column.to_pylist()
+            ]
+
+    def batch_columns(self, batch: pa.RecordBatch) -> Mapping[str, List[Any]]:
+        """
+        Converts a PyArrow RecordBatch to lists of values, casting each column to the type of that column in the master schema (if present)
+
+        :param batch: PyArrow RecordBatch
+        :return: mapping of {column:values} in the order of the columns of the batch
+        """
+        return {
+            name: self._column_values(column, pyarrow_type)
+            for name, column, pyarrow_type in zip(batch.schema.names, batch.columns, self._batch_types(batch.schema))
+        }
+
 
 class CsvParser(FileFormatParser):
     @property
@@ -178,20 +337,15 @@ class CsvParser(FileFormatParser):
         """
         fn passed in must return a tuple of (desired return value, Exception OR None)
         This allows propagating any errors from the process up and raising accordingly
+        fn runs in a worker process of the parser's ProcessPool, rather than in a new process for every call
 
         """
         result = None
         while result is None:
-            q_worker = mp.Queue()
-            proc = mp.Process(
-                target=multiprocess_queuer,
-                args=(dill.dumps(fn), q_worker, *args),  # use dill to pickle the function for Windows-compatibility
-            )
-            proc.start()
             try:
                 # this attempts to get return value from function with our specified timeout up to max
-                result, potential_error = q_worker.get(timeout=min(timeout, max_timeout))
-            except mp.queues.Empty:
+                result, potential_error = self._process_pool.run(fn, min(timeout, max_timeout), *args)
+            except mp.TimeoutError:
                 if timeout >= max_timeout:  # if we've got to max_timeout and tried once with that value
                     raise TimeoutError(
                         f"Timed out too many times while running {fn.__name__}, max timeout of {max_timeout} seconds reached."
@@ -203,11 +357,6 @@ class CsvParser(FileFormatParser):
                     raise potential_error
                 else:
                     return result
-            finally:
-                try:
-                    proc.terminate()
-                except Exception as e:
-                    self.logger.info(f"'{fn.__name__}' proc unterminated, error: {e}")
 
     def get_inferred_schema(self, file: Union[TextIO, BinaryIO]) -> dict:
         """
@@ -259,10 +408,9 @@ class CsvParser(FileFormatParser):
         )
         return self.json_schema_to_pyarrow_schema(schema_dict, reverse=True)
 
-    def stream_records(self, file: Union[TextIO, BinaryIO]) -> Iterator[Mapping[str, Any]]:
+    def stream_batches(self, file: Union[TextIO, BinaryIO]) -> Iterator[pa.RecordBatch]:
         """
         https://arrow.apache.org/docs/python/generated/pyarrow.csv.open_csv.html
-        PyArrow returns lists of values for each column so we zip() these up into records which we then yield
         """
         streaming_reader = pa_csv.open_csv(
             file,
@@ -277,12 +425,99 @@ class CsvParser(FileFormatParser):
             except StopIteration:
                 still_reading = False
             else:
-                batch_dict = batch.to_pydict()
-                batch_columns = [col_info.name for col_info in batch.schema]
-                # this gives us a list of lists where each nested list holds ordered values for a single column
-                # e.g. [ [1,2,3], ["a", "b", "c"], [True, True, False] ]
-                columnwise_record_values = [batch_dict[column] for column in batch_columns]
-                # we zip this to get row-by-row, e.g. [ [1, "a", True], [2, "b", True], [3, "c", False] ]
-                for record_values in zip(*columnwise_record_values):
-                    # create our record of {col: value, col: value} by dict comprehension, iterating through all cols in batch_columns
-                    yield {batch_columns[i]: record_values[i] for i in range(len(batch_columns))}
+                yield batch
+
+
+class ParquetParser(FileFormatParser):
+    """
+    https://arrow.apache.org/docs/python/generated/pyarrow.parquet.ParquetFile.html
+    Files are read one batch of rows at a time (a batch never spans several row groups), reading only the configured columns
+    """
+
+    @property
+    def is_binary(self):
+        return True
+
+    def _open_parquet_file(self, file: Union[TextIO, BinaryIO]) -> pa_parquet.ParquetFile:
+        return pa_parquet.ParquetFile(file, buffer_size=self._format.get("buffer_size", 0))
+
+    def _selected_columns(self, parquet_file: pa_parquet.ParquetFile) -> Optional[List[str]]:
+        """
+        :return: the configured columns present in this file, or None to read all the columns if no column was configured
+        """
+        columns = self._format.get("columns")
+        if not columns:
+            return None
+        return [column for column in columns if column in parquet_file.schema_arrow.names]
+
+    def get_inferred_schema(self, file: Union[TextIO, BinaryIO]) -> dict:
+        """
+        The schema is read from the metadata in the footer of the file, no data needs to be read
+        """
+        parquet_file = self._open_parquet_file(file)
+        columns = self._selected_columns(parquet_file)
+        schema_dict = {field.name: field.type for field in parquet_file.schema_arrow if columns is None or field.name in columns}
+        return self.json_schema_to_pyarrow_schema(schema_dict, reverse=True)
+
+    def stream_batches(self, file: Union[TextIO, BinaryIO]) -> Iterator[pa.RecordBatch]:
+        parquet_file = self._open_parquet_file(file)
+        batch_size = self._format.get("batch_size", 65536)
+        yield from parquet_file.iter_batches(batch_size=batch_size, columns=self._selected_columns(parquet_file))
+
+
+class JsonlParser(FileFormatParser):
+    """
+    https://arrow.apache.org/docs/python/json.html
+    PyArrow can only read whole JSON files, so files are read in chunks of complete lines of about block_size bytes,
+    each chunk being parsed into a table in memory
+    """
+
+    @property
+    def is_binary(self):
+        return True
+
+    def _chunks(self, file: Union[TextIO, BinaryIO]) -> Iterator[bytes]:
+        """
+        :yield: chunks of the file of at least block_size bytes (except for the last one) ending at the end of a line
+        """
+        block_size = self._format.get("block_size", 10000)
+        while True:
+            chunk = file.read(block_size)
+            if not chunk:
+                break
+            # read up to the end of the line the block ended in
+            yield chunk + file.readline()
+
+    def _read_chunk(self, chunk: bytes) -> pa.Table:
+        """
+        PyArrow infers timestamps from strings looking like dates, these are read again as strings to keep the values of the file
+        """
+        explicit_fields = []
+        column_names = None
+        while True:
+            table = pa_json.read_json(
+                io.BytesIO(chunk),
+                # parse the whole chunk as a single block
+                read_options=pa_json.ReadOptions(block_size=len(chunk) + 1),
+                parse_options=pa_json.ParseOptions(explicit_schema=pa.schema(explicit_fields), unexpected_field_behavior="infer"),
+            )
+            # explicit fields come first in the table, keep the order of the columns in the file
+            column_names = column_names or table.schema.names
+            timestamp_fields = [pa.field(field.name, pa.string()) for field in table.schema if pa.types.is_timestamp(field.type)]
+            if not timestamp_fields:
+                return table.select(column_names)
+            explicit_fields += timestamp_fields
+
+    def get_inferred_schema(self, file: Union[TextIO, BinaryIO]) -> dict:
+        """
+        Like CsvParser, the schema is inferred from the first block of the file
+        """
+        chunk = next(self._chunks(file), None)
+        if chunk is None:
+            raise ValueError("Empty file, unable to infer the schema of its records")
+        schema_dict = {field.name: field.type for field in self._read_chunk(chunk).schema}
+        return self.json_schema_to_pyarrow_schema(schema_dict, reverse=True)
+
+    def stream_batches(self, file: Union[TextIO, BinaryIO]) -> Iterator[pa.RecordBatch]:
+        for chunk in self._chunks(file):
+            yield from self._read_chunk(chunk).to_batches()
@@ -0,0 +1,131 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue
+from typing import Any, Callable, Iterator, List, Tuple
+
+import pyarrow as pa
+
+# put in a file's queue once all its batches have been read
+_END_OF_FILE = object()
+
+
+class SliceReader:
+    """
+    Reads the files of a stream slice concurrently: up to max_workers files are opened (i.e. downloaded) and parsed ahead of time.
+    Batches are still yielded file by file in the order of the slice, so records come out exactly as if files were read one by one.
+
+    Batches read ahead are held in memory up to memory_budget bytes, after which workers wait for batches to be consumed.
+    The file currently being consumed can always have one batch in memory beyond the budget,
+    otherwise the batches of later files could hold up the whole budget forever.
+    """
+
+    def __init__(self, read_file: Callable[[Any], Iterator[pa.RecordBatch]], max_workers: int, memory_budget: int):
+        """
+        :param read_file: function opening the given file and yielding its batches, called from the worker threads
+        :param max_workers: maximum number of files read at the same time
+        :param memory_budget: maximum size in bytes of the batches read ahead of the one being consumed
+        """
+        self._read_file = read_file
+        self._max_workers = max_workers
+        self._memory_budget = memory_budget
+        self._condition = threading.Condition()
+        self._used_memory = 0
+        self._used_memory_per_file = {}
+        self._current_index = 0
+        self._closed = False
+
+    def _acquire(self, index: int, nbytes: int) -> bool:
+        """
+        Waits until a batch of nbytes of the file at index in the slice fits in the memory budget
+
+        :return: False if reading was stopped in the meantime, in which case the batch should be dropped
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._closed
+                or self._used_memory + nbytes <= self._memory_budget
+                or (index == self._current_index and not self._used_memory_per_file.get(index))
+            )
+            if self._closed:
+                return False
+            self._used_memory += nbytes
+            self._used_memory_per_file[index] = self._used_memory_per_file.get(index, 0) + nbytes
+            return True
+
+    def _release(self, index: int, nbytes: int):
+        with self._condition:
+            self._used_memory -= nbytes
+            self._used_memory_per_file[index] -= nbytes
+            self._condition.notify_all()
+
+    def _read_into_queue(self, index: int, file: Any, queue: Queue):
+        """
+        Runs in the worker threads, puts the batches of the file (or the exception raised while reading it) in its queue
+        """
+        try:
+            for batch in self._read_file(file):
+                if not self._acquire(index, batch.nbytes):
+                    return
+                queue.put(batch)
+        except Exception as e:
+            queue.put(e)
+        else:
+            queue.put(_END_OF_FILE)
+
+    def read(self, files: List[Any]) -> Iterator[Tuple[Any, pa.RecordBatch]]:
+        """
+        :param files: files of the stream slice, passed on to read_file
+        :yield: tuples of (file, batch) in the order of the files
+        """
+        self._used_memory, self._used_memory_per_file, self._current_index, self._closed = 0, {}, 0, False
+        queues = [Queue() for _ in files]
+        executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        # files are picked up by the workers in the order of submission, so the file being consumed is always being read or done
+        futures = [executor.submit(self._read_into_queue, index, file, queue) for index, (file, queue) in enumerate(zip(files, queues))]
+        try:
+            for index, (file, queue) in enumerate(zip(files, queues)):
+                with self._condition:
+                    self._current_index = index
+                    self._condition.notify_all()
+                while True:
+                    item = queue.get()
+                    if item is _END_OF_FILE:
+                        break
+                    if isinstance(item, Exception):
+                        raise item
+                    try:
+                        yield file, item
+                    finally:
+                        self._release(index, item.nbytes)
+        finally:
+            # stops the workers if we didn't get to the end of the slice (e.g. on error)
+            with self._condition:
+                self._closed = True
+                self._condition.notify_all()
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
@@ -27,7 +27,7 @@ import json
 import re
 from copy import deepcopy
 from enum import Enum
-from typing import Optional, Union
+from typing import List, Optional, Union
 
 from jsonschema import RefResolver
 from pydantic import BaseModel, Field
@@ -107,16 +107,51 @@ class CsvFormat(BaseModel):
     )
 
 
-# We need this in as a dummy for now so that format comes out correctly as a oneOf
 class ParquetFormat(BaseModel):
     class Config:
-        title = "Coming Soon..."
+        title = "parquet"
 
     class ParquetFiletype(str, Enum):
+        """
+        This connector utilises <a href=\"https://arrow.apache.org/docs/python/generated/pyarrow.parquet.ParquetFile.html\" target=\"_blank\">PyArrow (Apache Arrow)</a> for Parquet parsing.
+        """
+
         parquet = "parquet"
 
     filetype: ParquetFiletype
 
+    columns: Optional[List[str]] = Field(
+        default=None,
+        description="If you only want to sync a subset of the columns from the file(s), add the columns you want here. Leave it empty to sync all columns.",
+    )
+    batch_size: int = Field(
+        default=65536,
+        description="Maximum number of records per batch read into memory. Batches may be smaller if there aren't enough rows in a row group of the file. Lowering this can help to avoid OOM errors if your data is particularly wide.",
+    )
+    buffer_size: int = Field(
+        default=0,
+        description="Perform read buffering when deserializing individual column chunks, with a buffer of this size in bytes. By default every column chunk is loaded fully into memory. Setting this can help to avoid OOM errors if your row groups are particularly large.",
+    )
+
+
+class JsonlFormat(BaseModel):
+    class Config:
+        title = "jsonl"
+
+    class JsonlFiletype(str, Enum):
+        """
+        This connector utilises <a href=\"https://arrow.apache.org/docs/python/json.html\" target=\"_blank\">PyArrow (Apache Arrow)</a> for JSON Lines parsing. Each line of the file(s) must be a JSON object.
+        """
+
+        jsonl = "jsonl"
+
+    filetype: JsonlFiletype
+
+    block_size: int = Field(
+        default=10000,
+        description="The chunk size in bytes to process at a time in memory from each file. The schema is detected from the first chunk of each file. Beware of raising this too high as you could hit OOM errors.",
+    )
+
 
 class SourceFilesAbstractSpec(BaseModel):
 
@@ -137,7 +172,30 @@ class SourceFilesAbstractSpec(BaseModel):
         examples=['{"column_1": "number", "column_2": "string", "column_3": "array", "column_4": "object", "column_5": "boolean"}'],
     )
 
-    format: Union[CsvFormat, ParquetFormat] = Field(default="csv")
+    format: Union[CsvFormat, ParquetFormat, JsonlFormat] = Field(default="csv")
+
+    schema_inference_strategy: str = Field(
+        default="all_files",
+        enum=["all_files", "newest_files"],
+        description="Which files to infer the schema from. <strong>all_files</strong> opens every file, which can take a long time for buckets with many files. <strong>newest_files</strong> only opens the most recently modified files (see schema_inference_sample_size), any column missing from these goes to _ab_additional_properties and the sync fails if an older file has a mismatching datatype. In incremental syncs, only files modified since the schema was saved in the state are used.",
+    )
+    schema_inference_sample_size: int = Field(
+        default=10,
+        ge=1,
+        description="The number of most recently modified files to infer the schema from, when schema_inference_strategy is newest_files.",
+    )
+
+    max_concurrent_files: int = Field(
+        default=8,
+        ge=1,
+        description="The maximum number of files to download and parse at the same time. Raising this speeds up syncs of many small files, set it to 1 to read files one by one.",
+    )
+    prefetch_memory_mb: int = Field(
+        default=256,
+        title="Prefetch Memory (MB)",
+        ge=1,
+        description="The maximum amount of data in MB held in memory from files downloaded and parsed ahead of time. Beware of raising this too high as you could hit OOM errors.",
+    )
 
     @staticmethod
     def change_format_to_oneOf(schema: dict) -> dict:
@@ -24,27 +24,43 @@
 
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
-from typing import BinaryIO, Iterator, TextIO, Union
+from typing import BinaryIO, Iterator, Optional, TextIO, Union
 
 from airbyte_cdk.logger import AirbyteLogger
 
 
+@dataclass
+class FileInfo:
+    """
+    Metadata of a blob/file as returned by the listing of the storage, so it doesn't need to be requested again for each file.
+    Any of the metadata may be unknown (None) except for the key, which is the value used as url in StorageFile().
+    """
+
+    key: str
+    last_modified: Optional[datetime] = None
+    size: Optional[int] = None
+    etag: Optional[str] = None
+
+
 class StorageFile(ABC):
-    def __init__(self, url: str, provider: dict):
+    def __init__(self, url: str, provider: dict, file_info: Optional[FileInfo] = None):
         """
         :param url: value yielded by filepath_iterator() in [Incremental]FileStream class. Blob/File path.
         :param provider: provider specific mapping as described in spec.json
+        :param file_info: metadata of the blob/file already known from the listing of the storage, defaults to None
         """
         self.url = url
         self._provider = provider
+        self.file_info = file_info if file_info is not None else FileInfo(key=url)
         self.logger = AirbyteLogger()
 
     @property
     @abstractmethod
     def last_modified(self) -> datetime:
         """
-        Override this to implement provider-specific logic
+        Override this to implement provider-specific logic, returning self.file_info.last_modified if it is already known
 
         :return: last_modified property of the blob/file
         """
@@ -25,20 +25,24 @@
 
 import concurrent
 import json
+import os
 from abc import ABC, abstractmethod
 from copy import deepcopy
 from datetime import datetime
+from itertools import repeat
 from operator import itemgetter
 from traceback import format_exc
 from typing import Any, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
 
+import pyarrow as pa
 from airbyte_cdk.logger import AirbyteLogger
 from airbyte_cdk.models.airbyte_protocol import SyncMode
 from airbyte_cdk.sources.streams import Stream
 from wcmatch.glob import GLOBSTAR, SPLIT, globmatch
 
-from .fileformatparser import CsvParser
-from .storagefile import StorageFile
+from .fileformatparser import CsvParser, JsonlParser, ParquetParser, ProcessPool
+from .slicereader import SliceReader
+from .storagefile import FileInfo, StorageFile
 
 JSON_TYPES = ["string", "number", "integer", "object", "array", "boolean", "null"]
 
@@ -51,8 +55,8 @@ class FileStream(Stream, ABC):
 
     fileformatparser_map = {
         "csv": CsvParser,
-        # 'parquet': ParquetParser,
-        # etc.
+        "parquet": ParquetParser,
+        "jsonl": JsonlParser,
     }
     # TODO: make these user configurable in spec.json
     ab_additional_col = "_ab_additional_properties"
@@ -60,19 +64,43 @@ class FileStream(Stream, ABC):
     ab_file_name_col = "_ab_source_file_url"
     airbyte_columns = [ab_additional_col, ab_last_mod_col, ab_file_name_col]
     datetime_format_string = "%Y-%m-%dT%H:%M:%S%z"
+    # when reading files concurrently, stream_slices hold (at least) this many files per worker to keep the workers busy
+    slice_files_per_worker = 10
+    schema_inference_strategies = ["all_files", "newest_files"]
 
-    def __init__(self, dataset: str, provider: dict, format: dict, path_pattern: str, schema: str = None):
+    def __init__(
+        self,
+        dataset: str,
+        provider: dict,
+        format: dict,
+        path_pattern: str,
+        schema: str = None,
+        schema_inference_strategy: str = "all_files",
+        schema_inference_sample_size: int = 10,
+        max_concurrent_files: int = 8,
+        prefetch_memory_mb: int = 256,
+    ):
         """
         :param dataset: table name for this stream
         :param provider: provider specific mapping as described in spec.json
         :param format: file format specific mapping as described in spec.json
         :param path_pattern: glob-style pattern for file-matching (https://facelessuser.github.io/wcmatch/glob/)
         :param schema: JSON-syntax user provided schema, defaults to None
+        :param schema_inference_strategy: which files to infer the schema from, one of schema_inference_strategies, defaults to all_files
+        :param schema_inference_sample_size: number of most recently modified files to infer the schema from with newest_files, defaults to 10
+        :param max_concurrent_files: maximum number of files of a stream_slice read at the same time, defaults to 8
+        :param prefetch_memory_mb: maximum size in MB of the data read ahead from the files of a stream_slice, defaults to 256
         """
         self.dataset = dataset
         self._path_pattern = path_pattern
         self._provider = provider
         self._format = format
+        if schema_inference_strategy not in self.schema_inference_strategies:
+            raise ConfigurationError(f"Invalid schema_inference_strategy, must be one of {self.schema_inference_strategies}")
+        self._schema_inference_strategy = schema_inference_strategy
+        self._schema_inference_sample_size = max(1, schema_inference_sample_size)
+        self._max_concurrent_files = max(1, max_concurrent_files)
+        self._prefetch_memory_budget = prefetch_memory_mb * 1024 * 1024
         self._schema = {}
         if schema:
             self._schema = self._parse_user_input_schema(schema)
@@ -146,6 +174,20 @@ class FileStream(Stream, ABC):
         :yield: url filepath to use in StorageFile()
         """
 
+    @classmethod
+    def file_info_iterator(cls, logger: AirbyteLogger, provider: dict) -> Iterator[FileInfo]:
+        """
+        Override this if the listing of the provider returns metadata of the files (e.g. last_modified) along with their paths,
+        so that it doesn't have to be requested separately for every file.
+        By default only the paths yielded by filepath_iterator() are known.
+
+        :param logger: instance of AirbyteLogger to use as this is a classmethod
+        :param provider: provider specific mapping as described in spec.json
+        :yield: FileInfo of each file, whose key is the url filepath to use in StorageFile()
+        """
+        for filepath in cls.filepath_iterator(logger, provider):
+            yield FileInfo(key=filepath)
+
     def pattern_matched_filepath_iterator(self, filepaths: Iterable[str]) -> Iterator[str]:
         """
         iterates through iterable filepaths and yields only those filepaths that match user-provided path patterns
@@ -157,31 +199,53 @@ class FileStream(Stream, ABC):
             if globmatch(filepath, self._path_pattern, flags=GLOBSTAR | SPLIT):
                 yield filepath
 
+    def is_file_needed(self, file_info: FileInfo) -> bool:
+        """
+        Allows skipping files early, as they are listed, based on their known metadata (which may be None)
+
+        :param file_info: FileInfo of a file matching the path patterns
+        :return: whether the file should be part of time_ordered_storagefile_iterator()
+        """
+        return True
+
     def time_ordered_storagefile_iterator(self) -> Iterable[Tuple[datetime, StorageFile]]:
         """
-        Iterates through pattern_matched_filepath_iterator(), acquiring last_modified property of each file to return in time ascending order.
-        Uses concurrent.futures to thread this asynchronously in order to improve performance when there are many files (network I/O)
+        Iterates through file_info_iterator() filtered by path patterns, to return each file with its last_modified in time ascending order.
+        When the listing doesn't return the last_modified property of a file, it's acquired with one request per file,
+        using concurrent.futures to thread this asynchronously in order to improve performance when there are many files (network I/O)
         Caches results after first run of method to avoid repeating network calls as this is used more than once
 
         :return: list in time-ascending order
         """
 
-        def get_storagefile_with_lastmod(filepath: str) -> Tuple[datetime, StorageFile]:
-            fc = self.storagefile_class(filepath, self._provider)
-            return (fc.last_modified, fc)
+        def get_storagefile_with_lastmod(storagefile: StorageFile) -> Tuple[datetime, StorageFile]:
+            return (storagefile.last_modified, storagefile)
 
         if self.storagefile_cache is None:
+            file_infos = {file_info.key: file_info for file_info in self.file_info_iterator(self.logger, self._provider)}
             storagefiles = []
-            # use concurrent future threads to parallelise grabbing last_modified from all the files
-            # TODO: don't hardcode max_workers like this
-            with concurrent.futures.ThreadPoolExecutor(max_workers=64) as executor:
+            storagefiles_without_lastmod = []
+            for filepath in self.pattern_matched_filepath_iterator(file_infos.keys()):
+                file_info = file_infos[filepath]
+                if not self.is_file_needed(file_info):
+                    continue
+                storagefile = self.storagefile_class(filepath, self._provider, file_info=file_info)
+                if file_info.last_modified is None:
+                    storagefiles_without_lastmod.append(storagefile)
+                else:
+                    storagefiles.append((file_info.last_modified, storagefile))
 
-                filepath_gen = self.pattern_matched_filepath_iterator(self.filepath_iterator(self.logger, self._provider))
+            if storagefiles_without_lastmod:
+                # use concurrent future threads to parallelise grabbing last_modified from all the files
+                # TODO: don't hardcode max_workers like this
+                with concurrent.futures.ThreadPoolExecutor(max_workers=64) as executor:
 
-                futures = [executor.submit(get_storagefile_with_lastmod, fp) for fp in filepath_gen]
+                    futures = [executor.submit(get_storagefile_with_lastmod, sf) for sf in storagefiles_without_lastmod]
 
-                for future in concurrent.futures.as_completed(futures):
-                    storagefiles.append(future.result())  # this will failfast on any errors
+                    for future in concurrent.futures.as_completed(futures):
+                        last_modified, storagefile = future.result()  # this will failfast on any errors
+                        if self.is_file_needed(storagefile.file_info):
+                            storagefiles.append((last_modified, storagefile))
 
             # The array storagefiles contain tuples of (last_modified, StorageFile), so sort by last_modified
             self.storagefile_cache = sorted(storagefiles, key=itemgetter(0))
@@ -215,8 +279,9 @@ class FileStream(Stream, ABC):
         """
         In order to auto-infer a schema across many files and/or allow for additional properties (columns),
             we need to determine the superset of schemas across all relevant files.
-        This method iterates through time_ordered_storagefile_iterator() obtaining the inferred schema (process implemented per file format),
+        This method iterates through time_ordered_storagefile_iterator() obtaining the inferred schema (see _infer_schemas()),
             to build up this superset schema (master_schema).
+        With the newest_files schema_inference_strategy, only the schema_inference_sample_size most recently modified files are used.
         This runs datatype checks to Warn or Error if we find incompatible schemas (e.g. same column is 'date' in one file but 'float' in another).
         This caches the master_schema after first run in order to avoid repeated compute and network calls to infer schema on all files.
 
@@ -227,12 +292,12 @@ class FileStream(Stream, ABC):
         if self.master_schema is None:
             master_schema = deepcopy(self._schema)
 
-            file_reader = self.fileformatparser_class(self._format)
-            # time order isn't necessary here but we might as well use this method so we cache the list for later use
-            for _, storagefile in self.time_ordered_storagefile_iterator():
-                with storagefile.open(file_reader.is_binary) as f:
-                    this_schema = file_reader.get_inferred_schema(f)
+            # time order isn't necessary with all_files but we might as well use this method so we cache the list for later use
+            storagefiles = [storagefile for _, storagefile in self.time_ordered_storagefile_iterator()]
+            if self._schema_inference_strategy == "newest_files":
+                storagefiles = storagefiles[-self._schema_inference_sample_size :]
 
+            for storagefile, this_schema in zip(storagefiles, self._infer_schemas(storagefiles)):
                 if this_schema == master_schema:
                     continue  # exact schema match so go to next file
 
@@ -269,20 +334,58 @@ class FileStream(Stream, ABC):
 
         return self.master_schema
 
+    def _infer_schemas(self, storagefiles: List[StorageFile]) -> Iterator[Mapping[str, Any]]:
+        """
+        Infers the schema of each file (process implemented per file format), up to max_concurrent_files at the same time.
+        Parsers needing to run in an external process share a ProcessPool, which is terminated once all schemas are inferred.
+
+        :param storagefiles: files to infer the schema of
+        :yield: the inferred schema of each file, in the same order as storagefiles
+        """
+        num_workers = max(1, min(self._max_concurrent_files, len(storagefiles)))
+        # inferring is CPU-bound once the file is opened, so there's no point running more processes than CPUs
+        process_pool = ProcessPool(min(num_workers, os.cpu_count() or 1))
+        file_reader = self.fileformatparser_class(self._format, process_pool=process_pool)
+
+        def infer_schema(storagefile: StorageFile) -> Mapping[str, Any]:
+            with storagefile.open(file_reader.is_binary) as f:
+                return file_reader.get_inferred_schema(f)
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=num_workers)
+        futures = [executor.submit(infer_schema, storagefile) for storagefile in storagefiles]
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            # don't wait for the remaining files if we stopped early (e.g. on mismatching datatypes)
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+            process_pool.terminate()
+
+    @property
+    def slice_size(self) -> int:
+        """
+        :return: number of files to group in a stream_slice, so that they can be read concurrently (see read_records())
+        """
+        return 1 if self._max_concurrent_files == 1 else self._max_concurrent_files * self.slice_files_per_worker
+
     def stream_slices(
         self, sync_mode: SyncMode, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None
     ) -> Iterable[Optional[Mapping[str, Any]]]:
         """
         This builds full-refresh stream_slices regardless of sync_mode param.
-        1 file == 1 stream_slice.
+        slice_size files == 1 stream_slice, in chronological order.
         Incremental stream_slices are implemented in the IncrementalFileStream child class.
         """
-
-        # TODO: this could be optimised via concurrent reads, however we'd lose chronology and need to deal with knock-ons of that
-        # we could do this concurrently both full and incremental by running batches in parallel
-        # and then incrementing the cursor per each complete batch
+        stream_slice = []
         for last_mod, storagefile in self.time_ordered_storagefile_iterator():
-            yield [{"unique_url": storagefile.url, "last_modified": last_mod, "storagefile": storagefile}]
+            stream_slice.append({"unique_url": storagefile.url, "last_modified": last_mod, "storagefile": storagefile})
+            if len(stream_slice) >= self.slice_size:
+                yield stream_slice
+                stream_slice = []
+        if len(stream_slice) > 0:
+            yield stream_slice
         # in case we have no files
         yield from [None]
 
@@ -325,6 +428,36 @@ class FileStream(Stream, ABC):
             record[key] = value
         return record
 
+    def _match_target_batch(
+        self, columns: Mapping[str, List[Any]], num_rows: int, target_columns: List, extra_map: Mapping[str, Any]
+    ) -> Iterator[Mapping[str, Any]]:
+        """
+        Batch equivalent of _match_target_schema() followed by _add_extra_fields_from_map().
+        Missing and additional fields are worked out once per batch rather than once per record,
+        and the columns are then lined up (with the extra fields as constant columns) before zipping them into records.
+
+        :param columns: mapping of {column:values} for a batch of data rows (obtained via FileFormatParser.batch_columns())
+        :param num_rows: number of data rows in the batch
+        :param target_columns: list of column names to line up the records with (obtained via self._get_schema_map().keys() as of now)
+        :param extra_map: map of additional columns and values to add to every record
+        :yield: records with columns lining up to target_columns
+        """
+        compare_columns = [c for c in target_columns if c not in [self.ab_last_mod_col, self.ab_file_name_col, self.ab_additional_col]]
+        compare_columns_set = set(compare_columns)
+        additional_columns = [c for c in columns.keys() if c not in compare_columns_set]
+        aligned = {c: columns[c] if c in columns else repeat(None, num_rows) for c in compare_columns}
+        if additional_columns:
+            additional_values = zip(*[columns[c] for c in additional_columns])
+            aligned[self.ab_additional_col] = (dict(zip(additional_columns, values)) for values in additional_values)
+        else:
+            aligned[self.ab_additional_col] = ({} for _ in range(num_rows))
+        for key, value in extra_map.items():
+            aligned[key] = repeat(value, num_rows)
+
+        record_columns = list(aligned.keys())
+        for record_values in zip(*aligned.values()):
+            yield dict(zip(record_columns, record_values))
+
     def read_records(
         self,
         sync_mode: SyncMode,
@@ -333,27 +466,31 @@ class FileStream(Stream, ABC):
         stream_state: Mapping[str, Any] = None,
     ) -> Iterable[Mapping[str, Any]]:
         """
-        Uses provider-relevant StorageFile to open file and then iterates through stream_records() using format-relevant FileFormatParser.
-        Records are mutated on the fly using _match_target_schema() and _add_extra_fields_from_map() to achieve desired final schema.
+        Uses provider-relevant StorageFile to open file and then iterates through stream_batches() using format-relevant FileFormatParser.
+        The files of the stream_slice are opened and parsed concurrently by a SliceReader, records are still output file by file.
+        Each batch is lined up to the desired final schema with _match_target_batch() before being turned into records.
         Since this is called per stream_slice, this method works for both full_refresh and incremental so sync_mode is ignored.
         """
         stream_slice = stream_slice if stream_slice is not None else []
-        file_reader = self.fileformatparser_class(self._format, self._get_master_schema())
-
-        # TODO: read all files in a stream_slice concurrently
-        for file_info in stream_slice:
-            with file_info["storagefile"].open(file_reader.is_binary) as f:
-                # TODO: make this more efficient than mutating every record one-by-one as they stream
-                for record in file_reader.stream_records(f):
-                    schema_matched_record = self._match_target_schema(record, list(self._get_schema_map().keys()))
-                    complete_record = self._add_extra_fields_from_map(
-                        schema_matched_record,
-                        {
-                            self.ab_last_mod_col: datetime.strftime(file_info["last_modified"], self.datetime_format_string),
-                            self.ab_file_name_col: file_info["unique_url"],
-                        },
-                    )
-                    yield complete_record
+        master_schema = self._get_master_schema()
+        file_reader = self.fileformatparser_class(self._format, master_schema)
+        target_columns = list(self._get_schema_map().keys())
+
+        def read_file(file_info: Mapping[str, Any]) -> Iterator[pa.RecordBatch]:
+            # each file gets its own parser as these run in different threads
+            file_parser = self.fileformatparser_class(self._format, master_schema)
+            with file_info["storagefile"].open(file_parser.is_binary) as f:
+                yield from file_parser.stream_batches(f)
+
+        slice_reader = SliceReader(read_file, min(self._max_concurrent_files, len(stream_slice)) or 1, self._prefetch_memory_budget)
+        extra_map = {}
+        for file_info, batch in slice_reader.read(stream_slice):
+            if extra_map.get(self.ab_file_name_col) != file_info["unique_url"]:
+                extra_map = {
+                    self.ab_last_mod_col: datetime.strftime(file_info["last_modified"], self.datetime_format_string),
+                    self.ab_file_name_col: file_info["unique_url"],
+                }
+            yield from self._match_target_batch(file_reader.batch_columns(batch), batch.num_rows, target_columns, extra_map)
         self.logger.info("finished reading a stream slice")
 
         # Always return an empty generator just in case no records were ever yielded
@@ -365,8 +502,16 @@ class IncrementalFileStream(FileStream, ABC):
     # TODO: ideally want to checkpoint after every file or stream slice rather than N records
     state_checkpoint_interval = None
 
-    # TODO: would be great if we could override time_ordered_storagefile_iterator() here with state awareness
-    # this would allow filtering down to only files we need early and avoid unnecessary work
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # value of the cursor in the state, files modified up to then have already been read
+        self._cursor_value: Optional[datetime] = None
+
+    def is_file_needed(self, file_info: FileInfo) -> bool:
+        """
+        Once the stream state is known (see stream_slices()), files which were already read are skipped as they are listed.
+        """
+        return self._cursor_value is None or file_info.last_modified is None or file_info.last_modified > self._cursor_value
 
     @property
     def cursor_field(self) -> str:
@@ -407,6 +552,8 @@ class IncrementalFileStream(FileStream, ABC):
         Builds either full_refresh or incremental stream_slices based on sync_mode.
         An incremental stream_slice is a group of all files with the exact same last_modified timestamp.
         This ensures we only update the cursor state to a given timestamp after ALL files with that timestamp have been successfully read.
+        To read files concurrently, consecutive groups are put in the same stream_slice until it holds at least slice_size files.
+        The state is still only updated once the whole stream_slice has been read, and never in the middle of a group.
 
         Slight nuance: as we iterate through time_ordered_storagefile_iterator(),
         we yield the stream_slice containing file(s) up to and EXcluding the file on the current iteration.
@@ -420,6 +567,8 @@ class IncrementalFileStream(FileStream, ABC):
             # TODO: ideally we could do this on __init__ but I'm not sure that's possible without breaking from cdk style implementation
             if self._schema == {} and stream_state is not None and "schema" in stream_state.keys():
                 self._schema = stream_state["schema"]
+            if stream_state is not None and self.cursor_field in stream_state.keys():
+                self._cursor_value = datetime.strptime(stream_state[self.cursor_field], self.datetime_format_string)
 
             # logic here is to bundle all files with exact same last modified timestamp together in each slice
             prev_file_last_mod = None  # init variable to hold previous iterations last modified
@@ -427,17 +576,14 @@ class IncrementalFileStream(FileStream, ABC):
 
             for last_mod, storagefile in self.time_ordered_storagefile_iterator():
                 # skip this file if last_mod is earlier than our cursor value from state
-                if (
-                    stream_state is not None
-                    and self.cursor_field in stream_state.keys()
-                    and last_mod <= datetime.strptime(stream_state[self.cursor_field], self.datetime_format_string)
-                ):
+                # (the files were listed before the state was known if the schema was inferred first)
+                if self._cursor_value is not None and last_mod <= self._cursor_value:
                     continue
 
                 # check if this storagefile belongs in the next slice, if so yield the current slice before this file
-                if (prev_file_last_mod is not None) and (last_mod != prev_file_last_mod):
+                if (prev_file_last_mod is not None) and (last_mod != prev_file_last_mod) and len(stream_slice) >= self.slice_size:
                     yield stream_slice
-                    stream_slice.clear()
+                    stream_slice = []
                 # now we either have an empty stream_slice or a stream_slice that this file shares a last modified with, so append it
                 stream_slice.append({"unique_url": storagefile.url, "last_modified": last_mod, "storagefile": storagefile})
                 # update our prev_file_last_mod to the current one for next iteration
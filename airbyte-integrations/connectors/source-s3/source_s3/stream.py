@@ -31,6 +31,7 @@ from botocore import UNSIGNED
 from botocore.config import Config
 
 from .s3file import S3File
+from .source_files_abstract.storagefile import FileInfo
 from .source_files_abstract.stream import IncrementalFileStream
 
 
@@ -40,13 +41,13 @@ class IncrementalFileStreamS3(IncrementalFileStream):
         return S3File
 
     @staticmethod
-    def _list_bucket(provider: Mapping[str, Any], accept_key=lambda k: True) -> Iterator[str]:
+    def _list_bucket(provider: Mapping[str, Any], accept_key=lambda k: True) -> Iterator[FileInfo]:
         """
         Wrapper for boto3's list_objects_v2 so we can handle pagination, filter by lambda func and operate with or without credentials
 
         :param provider: provider specific mapping as described in spec.json
         :param accept_key: lambda function to allow filtering return keys, e.g. lambda k: not k.endswith('/'), defaults to lambda k: True
-        :yield: key (name) of each object
+        :yield: key (name) of each object along with the metadata returned by the listing
         """
         if S3File.use_aws_account(provider):
             session = boto3session.Session(
@@ -74,7 +75,7 @@ class IncrementalFileStreamS3(IncrementalFileStream):
                 for c in content:
                     key = c["Key"]
                     if accept_key(key):
-                        yield key
+                        yield FileInfo(key=key, last_modified=c.get("LastModified"), size=c.get("Size"), etag=c.get("ETag"))
             ctoken = response.get("NextContinuationToken", None)
             if not ctoken:
                 break
@@ -88,6 +89,19 @@ class IncrementalFileStreamS3(IncrementalFileStream):
         :param provider: S3 provider mapping as described in spec.json
         :yield: url filepath to use in S3File()
         """
+        for file_info in IncrementalFileStreamS3.file_info_iterator(logger, provider):
+            yield file_info.key
+
+    @staticmethod
+    def file_info_iterator(logger: AirbyteLogger, provider: dict) -> Iterator[FileInfo]:
+        """
+        The listing of the bucket returns the last modified timestamp, size and etag of every object along with their keys,
+        so no request is needed per object to get these.
+
+        :param logger: instance of AirbyteLogger to use as this is a staticmethod
+        :param provider: S3 provider mapping as described in spec.json
+        :yield: FileInfo of each object, whose key is the url filepath to use in S3File()
+        """
         prefix = provider.get("path_prefix")
         if prefix is None:
             prefix = ""
@@ -95,7 +109,6 @@ class IncrementalFileStreamS3(IncrementalFileStream):
         msg = f"Iterating S3 bucket '{provider['bucket']}'"
         logger.info(msg + f" with prefix: '{prefix}' " if prefix != "" else msg)
 
-        for blob in IncrementalFileStreamS3._list_bucket(
+        yield from IncrementalFileStreamS3._list_bucket(
             provider=provider, accept_key=lambda k: not k.endswith("/")  # filter out 'folders', we just want actual blobs
-        ):
-            yield blob
+        )
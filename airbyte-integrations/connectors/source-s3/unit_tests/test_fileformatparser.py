@@ -23,8 +23,12 @@
 #
 
 
+import multiprocessing as mp
 import os
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 from typing import Any, List, Mapping
 
@@ -32,7 +36,7 @@ import pyarrow as pa
 import pytest
 from airbyte_cdk import AirbyteLogger
 from smart_open import open as smart_open
-from source_s3.source_files_abstract.fileformatparser import CsvParser, FileFormatParser
+from source_s3.source_files_abstract.fileformatparser import CsvParser, FileFormatParser, JsonlParser, ParquetParser, ProcessPool
 
 LOGGER = AirbyteLogger()
 SAMPLE_DIRECTORY = Path(__file__).resolve().parent.joinpath("sample_files/")
@@ -138,6 +142,69 @@ class TestFileFormatParserStatics:
                 FileFormatParser.json_schema_to_pyarrow_schema(pyarrow_schema, reverse=True)
                 LOGGER.debug(str(e_info))
 
+    def test_column_values_of_columns_failing_the_string_cast(self):
+        class UncastableColumn:
+            """Column of a type PyArrow can't cast to strings, as timestamps with pyarrow 4"""
+
+            def __init__(self, values: pa.Array):
+                self.type = values.type
+                self.to_pylist = values.to_pylist
+
+            def cast(self, pyarrow_type: pa.DataType):
+                raise pa.ArrowNotImplementedError(f"Unsupported cast from {self.type} to {pyarrow_type}")
+
+        timestamps = UncastableColumn(pa.array([datetime(2021, 1, 1), None], pa.timestamp("s")))
+        assert FileFormatParser._column_values(timestamps, pa.large_string()) == ["2021-01-01 00:00:00", None]
+        structs = UncastableColumn(pa.array([{"a": 1, "b": [datetime(2021, 1, 1)]}, None]))
+        assert FileFormatParser._column_values(structs, pa.large_string()) == ['{"a": 1, "b": ["2021-01-01 00:00:00"]}', None]
+        with pytest.raises(pa.ArrowNotImplementedError):
+            FileFormatParser._column_values(timestamps, pa.int64())
+
+
+class TestProcessPool:
+    def test_pool_is_reused_and_restarted_on_timeout(self):
+        def get_pid(sleep_seconds: float) -> int:
+            import os
+            import time
+
+            time.sleep(sleep_seconds)
+            return os.getpid()
+
+        process_pool = ProcessPool(processes=1)
+        try:
+            pid = process_pool.run(get_pid, 30, 0)
+            assert process_pool.run(get_pid, 30, 0) == pid  # the same worker process runs every call
+            with pytest.raises(mp.TimeoutError):
+                process_pool.run(get_pid, 0.5, 5)
+            assert process_pool.run(get_pid, 30, 0) != pid  # the hanging worker was terminated
+        finally:
+            process_pool.terminate()
+
+    def test_timeout_starts_when_the_call_runs(self):
+        process_pool = ProcessPool(processes=1)
+        try:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                busy = executor.submit(process_pool.run, time.sleep, 30, 1)
+                time.sleep(0.2)
+                # waits for the busy worker longer than its timeout, which only applies once it runs
+                assert process_pool.run(time.sleep, 0.5, 0) is None
+                assert busy.result() is None
+        finally:
+            process_pool.terminate()
+
+    def test_calls_killed_by_another_timeout_are_retried(self):
+        process_pool = ProcessPool(processes=2)
+        try:
+            process_pool.run(time.sleep, 30, 0)  # starts the pool
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                healthy = executor.submit(process_pool.run, time.sleep, 30, 1)
+                hanging = executor.submit(process_pool.run, time.sleep, 0.5, 30)
+                with pytest.raises(mp.TimeoutError):
+                    hanging.result()
+                assert healthy.result() is None
+        finally:
+            process_pool.terminate()
+
 
 class AbstractTestFileFormatParser(ABC):
     """ Prefix this class with Abstract so the tests don't run here but only in the children """
@@ -418,3 +485,150 @@ class TestCsvParser(AbstractTestFileFormatParser):
                 "fails": ["test_get_inferred_schema", "test_stream_records"],
             },
         ]
+
+
+class TestParquetParser(AbstractTestFileFormatParser):
+    @property
+    def test_files(self) -> List[Mapping[str, Any]]:
+        master_schema = {
+            "id": "integer",
+            "name": "string",
+            "valid": "boolean",
+            "code": "integer",
+            "degrees": "number",
+            "birthday": "string",
+            "last_seen": "string",
+            "tags": "array",
+        }
+        return [
+            {
+                # basic 'normal' test, the file has 3 row groups and types that are not mapped to json types (date, timestamp, list)
+                "fileformatparser": ParquetParser(format={"filetype": "parquet"}, master_schema=master_schema),
+                "filepath": os.path.join(SAMPLE_DIRECTORY, "parquet/test_file_1.parquet"),
+                "num_records": 8,
+                "inferred_schema": {
+                    "id": "integer",
+                    "name": "string",
+                    "valid": "boolean",
+                    "code": "integer",
+                    "degrees": "number",
+                    "birthday": "string",
+                    "last_seen": "string",
+                    "tags": "string",
+                },
+                "line_checks": {
+                    2: {
+                        "id": 2,
+                        "name": "j4DyXTS7",
+                        "valid": True,
+                        "code": -8,
+                        "degrees": 41.599998474121094,  # stored as a float32
+                        "birthday": "2021-07-14",
+                        "last_seen": "2021-07-14 15:30:09.224383",
+                        "tags": '["b", "c"]',
+                    },
+                    4: {
+                        "id": 4,
+                        "name": "1q6jD8Np",
+                        "valid": False,
+                        "code": -8,
+                        "degrees": -6.699999809265137,
+                        "birthday": "2021-07-14",
+                        "last_seen": "2021-07-14 15:30:09.224741",
+                        "tags": None,
+                    },
+                },
+                "fails": [],
+            },
+            {
+                # tests column projection and batches smaller than row groups
+                "test_alias": "columns and batch size",
+                "fileformatparser": ParquetParser(
+                    format={"filetype": "parquet", "columns": ["id", "tags", "not_in_file"], "batch_size": 2}, master_schema=master_schema
+                ),
+                "filepath": os.path.join(SAMPLE_DIRECTORY, "parquet/test_file_1.parquet"),
+                "num_records": 8,
+                "inferred_schema": {"id": "integer", "tags": "string"},
+                "line_checks": {6: {"id": 6, "tags": '["e", "f", "g"]'}, 8: {"id": 8, "tags": '["i"]'}},
+                "fails": [],
+            },
+            {
+                # not a parquet file, SHOULD FAIL INFER & STREAM RECORDS
+                "test_alias": "csv file",
+                "fileformatparser": ParquetParser(format={"filetype": "parquet"}, master_schema=master_schema),
+                "filepath": os.path.join(SAMPLE_DIRECTORY, "csv/test_file_1.csv"),
+                "num_records": 0,
+                "inferred_schema": {},
+                "line_checks": {},
+                "fails": ["test_get_inferred_schema", "test_stream_records"],
+            },
+        ]
+
+
+class TestJsonlParser(AbstractTestFileFormatParser):
+    @property
+    def test_files(self) -> List[Mapping[str, Any]]:
+        master_schema = {
+            "id": "integer",
+            "name": "string",
+            "valid": "boolean",
+            "code": "integer",
+            "degrees": "number",
+            "birthday": "string",
+            "last_seen": "string",
+            "tags": "array",
+            "location": "object",
+        }
+        inferred_schema = {
+            "id": "integer",
+            "name": "string",
+            "valid": "boolean",
+            "code": "integer",
+            "degrees": "number",
+            "birthday": "string",
+            "last_seen": "string",
+            "tags": "string",
+            "location": "string",
+        }
+        record_7 = {
+            "id": 7,
+            "name": "xZhh1Kyl",
+            "valid": False,
+            "code": 10,
+            "degrees": -9.2,
+            "birthday": "2021-07-14",
+            "last_seen": "2021-07-14 15:30:09.225145",
+            "tags": '["h"]',
+            "location": '{"lat": 1.5, "lon": -2}',
+        }
+        return [
+            {
+                # basic 'normal' test, dates are kept as strings and nested values are serialized to json strings
+                "fileformatparser": JsonlParser(format={"filetype": "jsonl"}, master_schema=master_schema),
+                "filepath": os.path.join(SAMPLE_DIRECTORY, "jsonl/test_file_1.jsonl"),
+                "num_records": 8,
+                "inferred_schema": inferred_schema,
+                "line_checks": {7: record_7},
+                "fails": [],
+            },
+            {
+                # tests compression: gzip, with a block size smaller than a line so every line is parsed in its own chunk
+                "test_alias": "compression: gzip, small block_size",
+                "fileformatparser": JsonlParser(format={"filetype": "jsonl", "block_size": 50}, master_schema=master_schema),
+                "filepath": os.path.join(SAMPLE_DIRECTORY, "jsonl/test_file_2.jsonl.gz"),
+                "num_records": 8,
+                "inferred_schema": inferred_schema,
+                "line_checks": {7: record_7},
+                "fails": [],
+            },
+            {
+                # tests empty file, SHOULD FAIL INFER
+                "test_alias": "empty file",
+                "fileformatparser": JsonlParser(format={"filetype": "jsonl"}, master_schema={}),
+                "filepath": os.path.join(SAMPLE_DIRECTORY, "csv/test_file_6_empty.csv"),
+                "num_records": 0,
+                "inferred_schema": {},
+                "line_checks": {},
+                "fails": ["test_get_inferred_schema"],
+            },
+        ]
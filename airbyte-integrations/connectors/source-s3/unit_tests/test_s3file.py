@@ -23,9 +23,12 @@
 #
 
 
+from datetime import datetime, timezone
+
 import pytest
 from airbyte_cdk import AirbyteLogger
 from source_s3.s3file import S3File
+from source_s3.source_files_abstract.storagefile import FileInfo
 
 LOGGER = AirbyteLogger()
 
@@ -48,3 +51,10 @@ class TestS3File:
     )
     def test_use_aws_account(self, provider, return_true):
         assert S3File.use_aws_account(provider) is return_true
+
+    def test_last_modified_from_listing(self):
+        last_modified = datetime(2021, 8, 1, tzinfo=timezone.utc)
+        s3file = S3File("file.csv", {"bucket": "dummy"}, file_info=FileInfo(key="file.csv", last_modified=last_modified))
+        assert s3file.last_modified == last_modified
+        # no boto3 session is needed to request the object metadata
+        assert s3file._boto_s3_resource is None
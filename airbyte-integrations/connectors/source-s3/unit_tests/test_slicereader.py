@@ -0,0 +1,87 @@
+#
+# MIT License
+#
+# Copyright (c) 2020 Airbyte
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import threading
+import time
+
+import pyarrow as pa
+import pytest
+from source_s3.source_files_abstract.slicereader import SliceReader
+
+
+def make_batch(file: str, index: int) -> pa.RecordBatch:
+    return pa.RecordBatch.from_arrays([pa.array([f"{file}-{index}"] * 100)], names=["value"])
+
+
+class TestSliceReader:
+    def test_batches_are_yielded_in_file_order(self):
+        def read_file(file):
+            # files later in the slice finish first
+            for index in range(3):
+                time.sleep(0.01 * (5 - file))
+                yield make_batch(str(file), index)
+
+        reader = SliceReader(read_file, max_workers=4, memory_budget=1024 * 1024)
+        values = [(file, batch.column(0)[0].as_py()) for file, batch in reader.read(list(range(5)))]
+        assert values == [(file, f"{file}-{index}") for file in range(5) for index in range(3)]
+
+    def test_files_are_read_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def read_file(file):
+            barrier.wait()  # only passes if 3 files are being read at the same time
+            yield make_batch(file, 0)
+
+        reader = SliceReader(read_file, max_workers=3, memory_budget=1024 * 1024)
+        assert [file for file, _ in reader.read(["a", "b", "c"])] == ["a", "b", "c"]
+
+    def test_memory_budget(self):
+        batch_size = make_batch("0", 0).nbytes
+        read_ahead = []
+
+        def read_file(file):
+            for index in range(5):
+                batch = make_batch(file, index)
+                read_ahead.append(batch.nbytes)
+                yield batch
+
+        reader = SliceReader(read_file, max_workers=3, memory_budget=2 * batch_size)
+        for _, batch in reader.read(["a", "b", "c"]):
+            time.sleep(0.01)  # give the workers time to read ahead
+            # the batches read ahead fit in the budget, except for one batch of the file being consumed
+            assert reader._used_memory <= 3 * batch_size
+        assert len(read_ahead) == 15
+
+    def test_errors_are_raised_when_reaching_the_file(self):
+        def read_file(file):
+            if file == "b":
+                raise ValueError("broken file")
+            yield make_batch(file, 0)
+
+        reader = SliceReader(read_file, max_workers=2, memory_budget=1024 * 1024)
+        files = []
+        with pytest.raises(ValueError, match="broken file"):
+            for file, _ in reader.read(["a", "b", "c"]):
+                files.append(file)
+        assert files == ["a"]
@@ -22,15 +22,28 @@
 # SOFTWARE.
 #
 
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from io import BytesIO
 from unittest.mock import patch
 
 import pytest
 from airbyte_cdk import AirbyteLogger
-from source_s3.source_files_abstract.stream import FileStream
+from airbyte_cdk.models import SyncMode
+from source_s3.source_files_abstract.storagefile import FileInfo, StorageFile
+from source_s3.source_files_abstract.stream import ConfigurationError, FileStream, IncrementalFileStream
 
 LOGGER = AirbyteLogger()
 
 
+@pytest.fixture(autouse=True)
+def reset_storage_file_stubs(monkeypatch):
+    """Calls recorded by the storage file stubs are reset for every test"""
+    monkeypatch.setattr(MockStorageFile, "requested_urls", [])
+    monkeypatch.setattr(InMemoryStorageFile, "files", {})
+    monkeypatch.setattr(InMemoryStorageFile, "opened_urls", [])
+
+
 class TestFileStream:
     @pytest.mark.parametrize(  # set return_schema to None for an expected fail
         "schema_string, return_schema",
@@ -153,6 +166,40 @@ class TestFileStream:
                 fs._add_extra_fields_from_map(record, extra_map)
                 LOGGER.debug(str(e_info))
 
+    @pytest.mark.parametrize(
+        "target_columns, records",
+        [
+            (["id", "first_name", "last_name"], [{"id": "1", "first_name": "Frodo", "last_name": "Baggins"}]),  # simple case
+            (  # additional columns
+                ["id", "first_name", "last_name"],
+                [
+                    {"id": "1", "first_name": "Frodo", "last_name": "Baggins", "location": "The Shire", "items": ["The One Ring"]},
+                    {"id": "2", "first_name": "Samwise", "last_name": "Gamgee", "location": None, "items": ["Rope", "Pans"]},
+                ],
+            ),
+            (  # missing columns
+                ["id", "first_name", "last_name", "location", "items"],
+                [{"id": "1", "first_name": "Frodo", "last_name": "Baggins"}, {"id": "2", "first_name": "Samwise", "last_name": "Gamgee"}],
+            ),
+            (  # additional and missing columns
+                ["id", "first_name", "last_name", "friends", "enemies", "_ab_source_file_url"],
+                [{"id": "1", "first_name": "Frodo", "last_name": "Baggins", "location": "The Shire"}],
+            ),
+            (["id"], []),  # empty batch
+        ],
+    )
+    @patch(
+        "source_s3.source_files_abstract.stream.FileStream.__abstractmethods__", set()
+    )  # patching abstractmethods to empty set so we can instantiate ABC to test
+    def test_match_target_batch(self, target_columns, records):
+        fs = FileStream(dataset="dummy", provider={}, format={}, path_pattern=[])
+        extra_map = {"_ab_source_file_last_modified": "2021-07-25T15:33:04+0000", "_ab_source_file_url": "bucket/file.csv"}
+        columns = {c: [record[c] for record in records] for c in (records[0].keys() if records else target_columns)}
+        expected_records = [
+            fs._add_extra_fields_from_map(fs._match_target_schema(dict(record), target_columns), extra_map) for record in records
+        ]
+        assert list(fs._match_target_batch(columns, len(records), target_columns, extra_map)) == expected_records
+
     @pytest.mark.parametrize(  #
         "patterns, filepaths, expected_filepaths",
         [
@@ -318,3 +365,142 @@ class TestFileStream:
     def test_pattern_matched_filepath_iterator(self, patterns, filepaths, expected_filepaths):
         fs = FileStream(dataset="dummy", provider={}, format={}, path_pattern=patterns)
         assert set([p for p in fs.pattern_matched_filepath_iterator(filepaths)]) == set(expected_filepaths)
+
+    @patch("source_s3.source_files_abstract.stream.FileStream.__abstractmethods__", set())
+    def test_time_ordered_storagefile_iterator(self):
+        listed_files = [
+            FileInfo(key="b.csv", last_modified=datetime(2021, 8, 2, tzinfo=timezone.utc), size=10, etag='"b"'),
+            FileInfo(key="a.csv", last_modified=datetime(2021, 8, 1, tzinfo=timezone.utc), size=10, etag='"a"'),
+            FileInfo(key="not_matched.txt", last_modified=datetime(2021, 8, 1, tzinfo=timezone.utc)),
+            FileInfo(key="c.csv"),  # no last_modified in the listing
+        ]
+        with patch.object(FileStream, "file_info_iterator", return_value=listed_files), patch.object(
+            FileStream, "storagefile_class", MockStorageFile
+        ):
+            fs = FileStream(dataset="dummy", provider={}, format={}, path_pattern="*.csv")
+            storagefiles = fs.time_ordered_storagefile_iterator()
+        assert [(last_mod, storagefile.url) for last_mod, storagefile in storagefiles] == [
+            (datetime(2021, 8, 1, tzinfo=timezone.utc), "a.csv"),
+            (datetime(2021, 8, 2, tzinfo=timezone.utc), "b.csv"),
+            (MockStorageFile.requested_last_modified, "c.csv"),
+        ]
+        # the last_modified of the files is only requested if the listing didn't return it
+        assert MockStorageFile.requested_urls == ["c.csv"]
+        assert storagefiles[0][1].file_info.etag == '"a"'
+
+
+class TestIncrementalFileStream:
+    @patch("source_s3.source_files_abstract.stream.IncrementalFileStream.__abstractmethods__", set())
+    def test_files_read_before_cursor_are_not_listed(self):
+        listed_files = [FileInfo(key=f"{day}.csv", last_modified=datetime(2021, 8, day, tzinfo=timezone.utc)) for day in range(1, 5)]
+        with patch.object(IncrementalFileStream, "file_info_iterator", return_value=listed_files), patch.object(
+            IncrementalFileStream, "storagefile_class", MockStorageFile
+        ):
+            fs = IncrementalFileStream(
+                dataset="dummy", provider={}, format={}, path_pattern="*.csv", schema='{"id": "integer"}', max_concurrent_files=1
+            )
+            stream_state = {fs.cursor_field: "2021-08-02T00:00:00+0000"}
+            slices = [
+                [file["unique_url"] for file in stream_slice]
+                for stream_slice in fs.stream_slices(sync_mode=SyncMode.incremental, stream_state=stream_state)
+                if stream_slice is not None
+            ]
+            assert slices == [["3.csv"], ["4.csv"]]
+            assert [storagefile.url for _, storagefile in fs.time_ordered_storagefile_iterator()] == ["3.csv", "4.csv"]
+
+    @pytest.mark.parametrize(
+        "max_concurrent_files, expected_slices",
+        [
+            (1, [["1a.csv", "1b.csv"], ["2.csv"], ["3a.csv", "3b.csv", "3c.csv"], ["4.csv"]]),
+            # groups of files with the same last_modified are never split across stream slices
+            (2, [["1a.csv", "1b.csv"], ["2.csv", "3a.csv", "3b.csv", "3c.csv"], ["4.csv"]]),
+            (10, [["1a.csv", "1b.csv", "2.csv", "3a.csv", "3b.csv", "3c.csv", "4.csv"]]),
+        ],
+    )
+    @patch("source_s3.source_files_abstract.stream.IncrementalFileStream.__abstractmethods__", set())
+    @patch.object(IncrementalFileStream, "slice_files_per_worker", 1)
+    def test_stream_slices_group_files_for_concurrent_reads(self, max_concurrent_files, expected_slices):
+        listed_files = [
+            FileInfo(key=key, last_modified=datetime(2021, 8, int(key[0]), tzinfo=timezone.utc))
+            for key in ["1a.csv", "1b.csv", "2.csv", "3a.csv", "3b.csv", "3c.csv", "4.csv"]
+        ]
+        with patch.object(IncrementalFileStream, "file_info_iterator", return_value=listed_files), patch.object(
+            IncrementalFileStream, "storagefile_class", MockStorageFile
+        ):
+            fs = IncrementalFileStream(
+                dataset="dummy",
+                provider={},
+                format={},
+                path_pattern="*.csv",
+                schema='{"id": "integer"}',
+                max_concurrent_files=max_concurrent_files,
+            )
+            slices = [
+                [file["unique_url"] for file in stream_slice]
+                for stream_slice in fs.stream_slices(sync_mode=SyncMode.incremental, stream_state={})
+                if stream_slice is not None
+            ]
+            assert slices == expected_slices
+
+
+class TestSchemaInference:
+    files = {
+        "1.csv": b"id,name\n1,Frodo\n",
+        "2.csv": b"id,name,location\n2,Samwise,The Shire\n",
+        "3.csv": b"id,friend\n3,Merry\n",
+    }
+
+    @pytest.fixture
+    def stream(self, monkeypatch):
+        listed_files = [
+            FileInfo(key=key, last_modified=datetime(2021, 8, int(key[0]), tzinfo=timezone.utc), etag=f'"etag-{key}"') for key in self.files
+        ]
+        monkeypatch.setattr(InMemoryStorageFile, "files", self.files)
+        with patch.object(FileStream, "__abstractmethods__", set()), patch.object(
+            FileStream, "file_info_iterator", return_value=listed_files
+        ), patch.object(FileStream, "storagefile_class", InMemoryStorageFile):
+            yield lambda **kwargs: FileStream(dataset="dummy", provider={}, format={"filetype": "csv"}, path_pattern="*.csv", **kwargs)
+
+    def test_all_files(self, stream):
+        assert stream()._get_master_schema() == {"id": "integer", "name": "string", "location": "string", "friend": "string"}
+        assert sorted(InMemoryStorageFile.opened_urls) == ["1.csv", "2.csv", "3.csv"]
+
+    def test_newest_files(self, stream):
+        fs = stream(schema_inference_strategy="newest_files", schema_inference_sample_size=2)
+        assert fs._get_master_schema() == {"id": "integer", "name": "string", "location": "string", "friend": "string"}
+        assert sorted(InMemoryStorageFile.opened_urls) == ["2.csv", "3.csv"]
+
+    def test_invalid_strategy(self, stream):
+        with pytest.raises(ConfigurationError):
+            stream(schema_inference_strategy="some_files")
+
+
+class InMemoryStorageFile(StorageFile):
+    # reset for every test by the reset_storage_file_stubs fixture
+    files = {}
+    opened_urls = []
+
+    @property
+    def last_modified(self) -> datetime:
+        return self.file_info.last_modified
+
+    @contextmanager
+    def open(self, binary: bool):
+        InMemoryStorageFile.opened_urls.append(self.url)
+        yield BytesIO(self.files[self.url])
+
+
+class MockStorageFile(StorageFile):
+    requested_last_modified = datetime(2021, 8, 3, tzinfo=timezone.utc)
+    # reset for every test by the reset_storage_file_stubs fixture
+    requested_urls = []
+
+    @property
+    def last_modified(self) -> datetime:
+        if self.file_info.last_modified is None:
+            MockStorageFile.requested_urls.append(self.url)
+            self.file_info.last_modified = self.requested_last_modified
+        return self.file_info.last_modified
+
+    def open(self, binary: bool):
+        raise NotImplementedError